@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark log biner (mmap) vs JSONL vs SQLite untuk replay audit
+
+Menulis N hasil pembagian ke tiga format, lalu mengukur ukuran file,
+waktu tulis, waktu scan penuh menjadi SplitResult, dan untuk log biner juga
+scan tuple mentah, jumlah kolom amounts (memoryview tanpa salinan) serta
+akses acak per indeks.
+
+Contoh:
+    python benchmarks/bench_binlog.py --count 1000000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.binlog import BinaryLogReader, BinaryLogWriter  # noqa: E402
+from money_splitter.history import HistoryStore  # noqa: E402
+from money_splitter.models import SplitResult  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+CHUNK_SIZE = 10_000
+
+
+def make_results(count: int, seed: int):
+    splitter = MoneySplitter(seed=seed, strategy="constructive")
+    results = []
+    for start in range(0, count, CHUNK_SIZE):
+        amounts = [10_000_000 + (start + i) * 1_000 for i in range(min(CHUNK_SIZE, count - start))]
+        results.extend(splitter.split_many(amounts))
+    return results
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+
+def write_binlog(path: Path, results) -> None:
+    with BinaryLogWriter(path) as log:
+        for i in range(0, len(results), CHUNK_SIZE):
+            log.extend(results[i:i + CHUNK_SIZE])
+
+
+def write_jsonl(path: Path, results) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for result in results:
+            file.write(json.dumps({"amount": result.original_amount, "splits": result.splits,
+                                   "timestamp": result.timestamp.isoformat()}) + "\n")
+
+
+def read_jsonl(path: Path) -> int:
+    from datetime import datetime
+    count = 0
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            row = json.loads(line)
+            SplitResult(original_amount=row["amount"], splits=row["splits"],
+                        num_parts=len(row["splits"]),
+                        timestamp=datetime.fromisoformat(row["timestamp"]))
+            count += 1
+    return count
+
+
+def write_sqlite(path: Path, results) -> None:
+    with HistoryStore(path) as history:
+        history.add_many(results)
+
+
+def read_sqlite(path: Path, count: int) -> int:
+    with HistoryStore(path) as history:
+        return len(history.query(limit=count).entries)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    results = make_results(args.count, args.seed)
+    print(f"{args.count:,} hasil (5-6 bagian)\n")
+    print(f"{'format':<8} {'MB':>7} {'tulis s':>8} {'scan s':>8} {'hasil/detik':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: Path(tmp) / f"audit.{name}" for name in ("binlog", "jsonl", "sqlite")}
+        writers = {"binlog": write_binlog, "jsonl": write_jsonl, "sqlite": write_sqlite}
+        readers = {
+            "binlog": lambda path: sum(1 for _ in BinaryLogReader(path)),
+            "jsonl": read_jsonl,
+            "sqlite": lambda path: read_sqlite(path, args.count),
+        }
+        for name, path in paths.items():
+            write_time, _ = timed(lambda: writers[name](path, results))
+            scan_time, count = timed(lambda: readers[name](path))
+            assert count == args.count
+            size = sum(p.stat().st_size for p in Path(tmp).glob(path.name + "*"))
+            print(f"{name:<8} {size / 1e6:>7.1f} {write_time:>8.2f} {scan_time:>8.2f} "
+                  f"{count / scan_time:>13,.0f}")
+
+        with BinaryLogReader(paths["binlog"]) as log:
+            raw_time, _ = timed(lambda: sum(1 for _ in log.records()))
+            column_time, _ = timed(lambda: sum(log.amounts))
+            indexes = random.Random(args.seed).choices(range(len(log)), k=args.lookups)
+            lookup_time, _ = timed(lambda: [log[i] for i in indexes])
+        print(f"\nbinlog scan tuple mentah   {raw_time:>8.3f} s")
+        print(f"binlog sum(amounts) view   {column_time:>8.3f} s")
+        print(f"binlog akses acak          {lookup_time / args.lookups * 1e6:>8.2f} us/record")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
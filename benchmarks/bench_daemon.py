@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Load generator daemon split: throughput dan latency p99 per kedalaman pipeline
+
+Pembungkus untuk ``money-splitter daemon bench`` (money_splitter.loadgen)
+agar bisa dijalankan dari checkout tanpa install.
+
+Contoh:
+    python benchmarks/bench_daemon.py --requests 50000 --clients 1 4 --depth 1 16 256
+    python benchmarks/bench_daemon.py --socket /run/money-splitter.sock
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.cli import main as cli_main  # noqa: E402
+
+
+def main(argv=None) -> int:
+    return cli_main(["daemon", "bench", *(sys.argv[1:] if argv is None else argv)])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
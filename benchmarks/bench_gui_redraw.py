@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark latency redraw kartu hasil GUI per pembagian
+
+Membandingkan redraw dengan pool kartu (MoneySpitterGUI.display_results)
+dan cara lama yang menghancurkan lalu membuat ulang CTkFrame, tiga label,
+tombol dan CTkFont baru untuk setiap bagian. Satu redraw diukur sampai
+root.update_idletasks() selesai, yaitu sampai layout dan gambar siap
+ditampilkan. Jumlah bagian bergantian 2-6 seperti kasir yang mengganti
+pilihan.
+
+Butuh customtkinter dan display (misalnya DISPLAY atau xvfb-run).
+
+Contoh:
+    python benchmarks/bench_gui_redraw.py --redraws 300
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def legacy_redraw(gui, ctk, result, frames):
+    """Redraw seperti sebelum pooling: destroy semua kartu lalu buat ulang"""
+    from money_splitter.utils import CurrencyFormatter
+
+    for frame in frames:
+        frame.destroy()
+    frames.clear()
+    for i, (split, percentage) in enumerate(zip(result.splits, result.get_percentages())):
+        card = ctk.CTkFrame(gui.results_scroll, corner_radius=10, fg_color=("gray90", "gray20"))
+        card.grid(row=len(frames), column=0, padx=5, pady=5, sticky="ew")
+        card.grid_columnconfigure(1, weight=1)
+        ctk.CTkLabel(card, text=str(i + 1), width=30, height=30, corner_radius=15,
+                     fg_color=("gray80", "gray30"),
+                     font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, padx=10, pady=10)
+        info = ctk.CTkFrame(card, fg_color="transparent")
+        info.grid(row=0, column=1, padx=10, sticky="w")
+        ctk.CTkLabel(info, text=CurrencyFormatter.format_rupiah(split),
+                     font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(info, text=f"{percentage:.1f}% dari total", font=ctk.CTkFont(size=12),
+                     text_color="gray").pack(anchor="w")
+        ctk.CTkButton(card, text="Salin", width=60, height=30, font=ctk.CTkFont(size=12),
+                      fg_color="transparent", border_width=1).grid(row=0, column=2, padx=15, pady=10)
+        frames.append(card)
+
+
+def measure(gui, redraw, results):
+    latencies = []
+    for result in results:
+        start = time.perf_counter()
+        redraw(result)
+        gui.root.update_idletasks()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--redraws", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    try:
+        import customtkinter as ctk
+        from money_splitter.gui import MoneySpitterGUI
+        gui = MoneySpitterGUI()
+    except Exception as e:  # ImportError atau TclError tanpa display
+        print(f"GUI tidak tersedia: {e}", file=sys.stderr)
+        return 1
+
+    from money_splitter.splitter import MoneySplitter
+    splitter = MoneySplitter(seed=args.seed)
+    results = [splitter.split_money(1_000_000 + i * 25_000, 2 + i % 5) for i in range(args.redraws)]
+    gui.root.update()
+
+    frames = []
+    rows = {
+        "destroy/recreate": measure(gui, lambda r: legacy_redraw(gui, ctk, r, frames), results),
+    }
+    for frame in frames:
+        frame.destroy()
+    rows["pool"] = measure(gui, gui.display_results, results)
+    gui.root.destroy()
+
+    print(f"{args.redraws} redraw, 2-6 kartu\n")
+    print(f"{'mode':<18} {'median ms':>10} {'p95 ms':>8} {'max ms':>8}")
+    for name, latencies in rows.items():
+        ordered = sorted(latencies)
+        print(f"{name:<18} {statistics.median(ordered):>10.2f} "
+              f"{ordered[int(len(ordered) * 0.95) - 1]:>8.2f} {ordered[-1]:>8.2f}")
+    speedup = statistics.median(rows["destroy/recreate"]) / statistics.median(rows["pool"])
+    print(f"\npool {speedup:.1f}x lebih cepat (median)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark riwayat SQLite: insert per batch vs commit per baris, dan query
+
+Mengukur throughput insert HistoryStore (insert/detik) dengan batch_size
+default dan dengan batch_size=1 (satu transaksi per hasil, seperti GUI),
+lalu latency satu halaman query (terbaru, dengan cursor, dan dengan filter
+amount) di atas database yang sudah terisi. Database dibuat di direktori
+sementara agar memakai file sungguhan (WAL), bukan ":memory:".
+
+Contoh:
+    python benchmarks/bench_history.py --count 200000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.history import DEFAULT_BATCH_SIZE, HistoryStore  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+CHUNK_SIZE = 10_000
+
+
+def make_results(count: int, seed: int):
+    splitter = MoneySplitter(seed=seed, strategy="constructive")
+    results = []
+    for start in range(0, count, CHUNK_SIZE):
+        amounts = [10_000_000 + (start + i) * 1_000 for i in range(min(CHUNK_SIZE, count - start))]
+        results.extend(splitter.split_many(amounts))
+    return results
+
+
+def insert_rate(path: Path, results, batch_size: int) -> float:
+    """Insert/detik untuk semua results, termasuk flush dan close"""
+    history = HistoryStore(path, batch_size=batch_size)
+    start = time.perf_counter()
+    for i in range(0, len(results), CHUNK_SIZE):
+        history.add_many(results[i:i + CHUNK_SIZE])
+    history.close()
+    return len(results) / (time.perf_counter() - start)
+
+
+def query_latency(history: HistoryStore, repeat: int, **kwargs) -> float:
+    """Rata-rata milidetik per query satu halaman"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        history.query(**kwargs)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--single-count", type=int, default=5_000,
+                        help="jumlah hasil untuk mode commit per baris")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    results = make_results(args.count, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        batched = insert_rate(Path(tmp) / "batched.db", results, DEFAULT_BATCH_SIZE)
+        single = insert_rate(Path(tmp) / "single.db", results[:args.single_count], 1)
+        print(f"insert batch_size={DEFAULT_BATCH_SIZE:<6} {batched:>12,.0f} insert/detik "
+              f"({args.count:,} hasil)")
+        print(f"insert batch_size=1{'':<5} {single:>12,.0f} insert/detik "
+              f"({args.single_count:,} hasil)")
+        print(f"batch {batched / single:.1f}x lebih cepat\n")
+
+        with HistoryStore(Path(tmp) / "batched.db") as history:
+            middle = history.query(limit=args.count // 2).next_cursor
+            middle_amount = results[len(results) // 2].original_amount
+            cases = {
+                "halaman terbaru": {},
+                "halaman tengah (cursor)": {"cursor": middle},
+                "filter amount": {"min_amount": middle_amount},
+            }
+            for name, filters in cases.items():
+                latency = query_latency(history, 200, limit=args.limit, **filters)
+                print(f"query {name:<24} {latency:>8.3f} ms/halaman ({args.limit} baris)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark responsivitas "event loop" selama batch berat
+
+Mensimulasikan event loop GUI: thread utama menjalankan tick setiap
+POLL_INTERVAL_MS (seperti root.after) dan mencatat jarak antar tick selama
+batch split_many berjalan, baik langsung di thread utama (seperti GUI lama)
+maupun lewat JobRunner di thread worker. Target 60 fps berarti jarak tick
+median sekitar 16-17 ms. Switch interval GIL sama seperti GUI
+(GUI_SWITCH_INTERVAL) kecuali diubah lewat --switch-interval.
+
+Contoh:
+    python benchmarks/bench_jobs.py --count 50000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.jobs import (  # noqa: E402
+    GUI_SWITCH_INTERVAL, POLL_INTERVAL_MS, JobRunner, split_many_job,
+)
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+
+def percentile(values, pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def inline(amounts):
+    """Batch di thread utama: tick tertahan sampai batch selesai"""
+    gaps = []
+    last = time.perf_counter()
+    MoneySplitter(seed=1).split_many(amounts)
+    gaps.append(time.perf_counter() - last)
+    return gaps
+
+
+def with_runner(amounts):
+    """Batch di JobRunner; thread utama tetap tick dan poll"""
+    runner = JobRunner()
+    job = runner.submit(split_many_job, MoneySplitter(seed=1), amounts)
+    gaps = []
+    interval = POLL_INTERVAL_MS / 1000
+    last = time.perf_counter()
+    while not runner.poll():
+        time.sleep(max(0.0, interval - (time.perf_counter() - last)))
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+    runner.shutdown()
+    assert job.progress == 1.0
+    return gaps
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--switch-interval", type=float, default=GUI_SWITCH_INTERVAL,
+                        help="sys.setswitchinterval dalam detik (GUI memakai nilai default)")
+    args = parser.parse_args(argv)
+    sys.setswitchinterval(args.switch_interval)
+
+    amounts = [10_000_000 + i * 1_000 for i in range(args.count)]
+    print(f"batch {args.count:,} amount, tick target {POLL_INTERVAL_MS} ms\n")
+    print(f"{'mode':<12} {'tick':>6} {'median ms':>10} {'p99 ms':>8} {'max ms':>8}")
+    for name, run in (("inline", inline), ("JobRunner", with_runner)):
+        gaps = [gap * 1000 for gap in run(amounts)]
+        print(f"{name:<12} {len(gaps):>6} {statistics.median(gaps):>10.1f} "
+              f"{percentile(gaps, 99):>8.1f} {max(gaps):>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark memori: SplitResult vs CompactSplitResult vs SplitBatch
+
+Mengukur memori yang tetap teralokasi (tracemalloc) untuk menyimpan N hasil
+pembagian, dalam byte per hasil, beserta waktu build (run terpisah tanpa
+tracemalloc) dan waktu get_percentages() untuk semua hasil. Hasil dibuat per chunk dengan
+MoneySplitter.split_many seperti pada batch reconciliation; untuk compact
+dan SplitBatch, SplitResult dari setiap chunk langsung dikonversi lalu
+dibuang. Untuk SplitBatch, persentase dihitung sekaligus untuk seluruh batch.
+
+Contoh:
+    python benchmarks/bench_memory.py --count 1000000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.batch import SplitBatch  # noqa: E402
+from money_splitter.models import CompactSplitResult  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+CHUNK_SIZE = 10_000
+
+
+def build(count: int, model: str, seed: int):
+    """Buat count hasil pembagian dalam representasi model"""
+    splitter = MoneySplitter(seed=seed, strategy="constructive")
+    results = SplitBatch() if model == "SplitBatch" else []
+    for start in range(0, count, CHUNK_SIZE):
+        amounts = [10_000_000 + (start + i) * 1_000 for i in range(min(CHUNK_SIZE, count - start))]
+        chunk = splitter.split_many(amounts)
+        if model == "CompactSplitResult":
+            chunk = [CompactSplitResult.from_result(result) for result in chunk]
+        results.extend(chunk)
+    return results
+
+
+def measure(count: int, model: str, seed: int) -> dict:
+    """Ukur memori tertahan dan waktu untuk satu representasi"""
+    start = time.perf_counter()
+    build(count, model, seed)
+    build_time = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    results = build(count, model, seed)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    if model == "SplitBatch":
+        results.get_percentages()
+    else:
+        for result in results:
+            result.get_percentages()
+    percentages_time = time.perf_counter() - start
+    return {
+        "bytes": retained / count,
+        "peak_mb": peak / 1e6,
+        "build": build_time,
+        "percentages": percentages_time,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    print(f"{args.count:,} hasil (5-6 bagian, strategi constructive)\n")
+    print(f"{'model':<20} {'byte/hasil':>11} {'total MB':>9} {'peak MB':>8} "
+          f"{'build s':>8} {'persen s':>9}")
+    rows = {}
+    for name in ("SplitResult", "CompactSplitResult", "SplitBatch"):
+        stats = rows[name] = measure(args.count, name, args.seed)
+        print(f"{name:<20} {stats['bytes']:>11.0f} {stats['bytes'] * args.count / 1e6:>9.1f} "
+              f"{stats['peak_mb']:>8.1f} {stats['build']:>8.2f} {stats['percentages']:>9.2f}")
+    print()
+    for name in ("CompactSplitResult", "SplitBatch"):
+        ratio = rows["SplitResult"]["bytes"] / rows[name]["bytes"]
+        print(f"{name} {ratio:.1f}x lebih hemat memori dari SplitResult")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParallelSplitter: throughput per jumlah worker
+
+Membandingkan MoneySplitter.split_many (satu proses) dengan ParallelSplitter
+untuk beberapa jumlah worker, dan mengecek bahwa hasilnya identik untuk master
+seed yang sama. Speedup mendekati linear hanya terlihat jika mesin memiliki
+core sebanyak worker.
+
+Contoh:
+    python benchmarks/bench_parallel.py --count 200000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.parallel import ParallelSplitter  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--parts", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    amounts = [rng.randint(10_000, 1_000_000_000) for _ in range(args.count)]
+    print(f"{args.count:,} amount, chunk {args.chunk_size:,}, {os.cpu_count()} CPU\n")
+
+    splitter = MoneySplitter()
+    start = time.perf_counter()
+    splitter.split_many(amounts, args.parts)
+    baseline = time.perf_counter() - start
+    print(f"{'workers':>8} {'detik':>8} {'splits/s':>12} {'speedup':>8}")
+    print(f"{'serial':>8} {baseline:>8.2f} {args.count / baseline:>12,.0f} {1.0:>8.2f}")
+
+    reference = None
+    for workers in args.workers:
+        with ParallelSplitter(workers=workers, chunk_size=args.chunk_size, seed=args.seed) as pool:
+            start = time.perf_counter()
+            results = pool.split_many(amounts, args.parts)
+            elapsed = time.perf_counter() - start
+        splits = [result.splits for result in results]
+        if reference is None:
+            reference = splits
+        elif splits != reference:
+            print(f"ERROR: hasil {workers} worker berbeda untuk seed yang sama", file=sys.stderr)
+            return 1
+        print(f"{workers:>8} {elapsed:>8.2f} {args.count / elapsed:>12,.0f} {baseline / elapsed:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark latency Enter dengan dan tanpa preview background
+
+Mensimulasikan pengguna mengetik amount digit demi digit (jeda antar ketukan
+--keystroke-ms) lalu menekan Enter. Tanpa preview, job pembagian baru
+di-submit saat Enter; dengan preview, Speculator sudah menghitung setiap
+ketukan di background dan Enter hanya mengambil job yang sama. Latency
+diukur dari Enter sampai hasil tersedia di thread utama (lewat poll seperti
+GUI, tetapi tanpa jeda POLL_INTERVAL_MS).
+
+Contoh:
+    python benchmarks/bench_preview.py --rounds 200 --parts 6
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.jobs import JobRunner, Speculator, split_job  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+
+def wait(job) -> None:
+    while not job.finished:
+        time.sleep(0)
+
+
+def enter_latency(runner, splitter, speculator, amount: int, parts: int,
+                  keystroke: float) -> float:
+    """Ketik amount lalu Enter; kembalikan latency Enter dalam ms"""
+    text = str(amount)
+    for end in range(1, len(text) + 1):
+        if speculator is not None:
+            typed = int(text[:end])
+            speculator.update((typed, parts), splitter, typed, parts)
+        time.sleep(keystroke)
+    runner.poll()
+
+    start = time.perf_counter()
+    job = speculator.take((amount, parts)) if speculator is not None else None
+    if job is None:
+        job = runner.submit(split_job, splitter, amount, parts)
+    wait(job)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--parts", type=int, default=6)
+    parser.add_argument("--keystroke-ms", type=float, default=40.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    amounts = [rng.randrange(10_000, 1_000_000_000) for _ in range(args.rounds)]
+    keystroke = args.keystroke_ms / 1000
+    print(f"{args.rounds} amount, {args.parts} bagian, ketukan tiap {args.keystroke_ms:g} ms\n")
+    print(f"{'mode':<10} {'median ms':>10} {'p95 ms':>8} {'max ms':>8}")
+    for name, preview in (("tanpa", False), ("preview", True)):
+        runner = JobRunner()
+        splitter = MoneySplitter(seed=args.seed)
+        speculator = Speculator(runner, split_job) if preview else None
+        latencies = sorted(enter_latency(runner, splitter, speculator, amount, args.parts, keystroke)
+                           for amount in amounts)
+        runner.shutdown()
+        print(f"{name:<10} {statistics.median(latencies):>10.3f} "
+              f"{latencies[int(len(latencies) * 0.95) - 1]:>8.3f} {latencies[-1]:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark serialisasi SplitResult: naive vs to_json/to_bytes vs batch
+
+Membandingkan waktu encode, decode dan ukuran N hasil pembagian untuk:
+
+- naive: json.dumps(dataclasses.asdict(result), default=str) per hasil
+- to_json / to_bytes: serialisasi per objek di models
+- results_to_json / results_to_bytes: bentuk batch di serialization
+
+Contoh:
+    python benchmarks/bench_serialization.py --count 200000
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter import serialization  # noqa: E402
+from money_splitter.models import SplitResult  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+CHUNK_SIZE = 10_000
+
+
+def make_results(count: int, seed: int):
+    splitter = MoneySplitter(seed=seed, strategy="constructive")
+    results = []
+    for start in range(0, count, CHUNK_SIZE):
+        amounts = [10_000_000 + (start + i) * 1_000 for i in range(min(CHUNK_SIZE, count - start))]
+        results.extend(splitter.split_many(amounts))
+    return results
+
+
+def naive_decode(rows):
+    decoded = []
+    for row in rows:
+        data = json.loads(row)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        decoded.append(SplitResult(**data))
+    return decoded
+
+
+CASES = {
+    "naive asdict+dumps": (
+        lambda results: [json.dumps(dataclasses.asdict(r), default=str) for r in results],
+        naive_decode,
+    ),
+    "to_json": (
+        lambda results: [r.to_json() for r in results],
+        lambda rows: [SplitResult.from_json(row) for row in rows],
+    ),
+    "to_bytes": (
+        lambda results: [r.to_bytes() for r in results],
+        lambda rows: [SplitResult.from_bytes(row) for row in rows],
+    ),
+    "results_to_json": (serialization.results_to_json, serialization.results_from_json),
+    "results_to_bytes": (serialization.results_to_bytes, serialization.results_from_bytes),
+}
+
+
+def size_of(encoded) -> int:
+    if isinstance(encoded, list):
+        return sum(len(row) for row in encoded)
+    return len(encoded)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    results = make_results(args.count, args.seed)
+    print(f"{args.count:,} hasil (5-6 bagian)\n")
+    print(f"{'format':<20} {'encode/detik':>13} {'decode/detik':>13} {'byte/hasil':>11}")
+    baseline = None
+    for name, (encode, decode) in CASES.items():
+        start = time.perf_counter()
+        encoded = encode(results)
+        encode_time = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = decode(encoded)
+        decode_time = time.perf_counter() - start
+        assert decoded == results, name
+        baseline = baseline or encode_time
+        print(f"{name:<20} {args.count / encode_time:>13,.0f} {args.count / decode_time:>13,.0f} "
+              f"{size_of(encoded) / args.count:>11.1f}   encode {baseline / encode_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
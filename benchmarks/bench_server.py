@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark server HTTP: throughput dan latency dengan klien keep-alive
+
+Server dan klien berjalan di satu event loop (satu proses), sehingga angka
+absolut dibatasi satu core; yang dibandingkan adalah efek batch_window dan
+jumlah klien bersamaan terhadap req/s, latency dan ukuran batch rata-rata.
+Baris "tanpa keep-alive" membuka koneksi baru per request sebagai pembanding.
+
+Contoh:
+    python benchmarks/bench_server.py --clients 1 16 64 --window-ms 0 1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.server import SplitServer  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+
+async def post(reader, writer, body: bytes) -> None:
+    writer.write(b"POST /split HTTP/1.1\r\nHost: bench\r\nContent-Length: %d\r\n\r\n%s"
+                 % (len(body), body))
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+
+
+async def client(port: int, bodies: list, latencies: list, keep_alive: bool) -> None:
+    connection = await asyncio.open_connection("127.0.0.1", port) if keep_alive else None
+    for body in bodies:
+        start = time.perf_counter()
+        reader, writer = connection or await asyncio.open_connection("127.0.0.1", port)
+        await post(reader, writer, body)
+        if not keep_alive:
+            writer.close()
+        latencies.append(time.perf_counter() - start)
+    if connection:
+        connection[1].close()
+
+
+async def run(requests: int, clients: int, window: float, keep_alive: bool, seed: int) -> dict:
+    """Jalankan satu konfigurasi, kembalikan ringkasan hasil"""
+    server = SplitServer(port=0, splitter=MoneySplitter(seed=seed), batch_window=window)
+    await server.start()
+    rng = random.Random(seed)
+    bodies = [json.dumps({"amount": rng.randint(10_000, 1_000_000_000)}).encode()
+              for _ in range(requests)]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(server.port, bodies[i::clients], latencies, keep_alive) for i in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    await server.shutdown()
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "batch": server.batcher.entries / max(server.batcher.batches, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--window-ms", type=float, nargs="+", default=[0.0, 1.0])
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    print(f"{args.requests:,} request per konfigurasi\n")
+    print(f"{'klien':>6} {'window':>7} {'koneksi':>11} {'req/s':>9} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'batch':>6}")
+    for clients in args.clients:
+        configs = [(window, True) for window in args.window_ms] + [(args.window_ms[0], False)]
+        for window, keep_alive in configs:
+            stats = asyncio.run(run(args.requests, clients, window / 1000, keep_alive, args.seed))
+            mode = "keep-alive" if keep_alive else "per request"
+            print(f"{clients:>6} {window:>7.1f} {mode:>11} {stats['rps']:>9,.0f} "
+                  f"{stats['p50']:>8.2f} {stats['p99']:>8.2f} {stats['batch']:>6.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
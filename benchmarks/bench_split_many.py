@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark MoneySplitter.split_many dibandingkan loop Python atas split_money
+
+Contoh:
+    python benchmarks/bench_split_many.py --count 20000 --parts 5
+    python benchmarks/bench_split_many.py --count 1000000 --engine numpy --skip-loop
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter import vectorized  # noqa: E402
+from money_splitter.splitter import ENGINES, MoneySplitter  # noqa: E402
+
+
+def make_amounts(count: int, seed: int) -> list:
+    """Generate amounts acak antara 10 ribu dan 1 miliar"""
+    rng = random.Random(seed)
+    return [rng.randint(10_000, 1_000_000_000) for _ in range(count)]
+
+
+def bench_loop(amounts: list, num_parts, seed: int) -> float:
+    """Waktu untuk memanggil split_money satu per satu"""
+    splitter = MoneySplitter()
+    splitter.random.seed(seed)
+    start = time.perf_counter()
+    for amount in amounts:
+        splitter.split_money(amount, num_parts)
+    return time.perf_counter() - start
+
+
+def bench_batch(amounts: list, num_parts, seed: int, engine: str = "python") -> float:
+    """Waktu untuk satu panggilan split_many"""
+    splitter = MoneySplitter()
+    splitter.random.seed(seed)
+    start = time.perf_counter()
+    splitter.split_many(amounts, num_parts, engine=engine)
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000, help="jumlah amount per run")
+    parser.add_argument("--parts", type=int, default=None, help="jumlah bagian (default acak 5/6)")
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan, diambil yang terbaik")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--engine", action="append", choices=ENGINES,
+                        help="engine split_many yang diukur (boleh diulang, default semua)")
+    parser.add_argument("--skip-loop", action="store_true",
+                        help="lewati baseline loop split_money (berguna untuk batch sangat besar)")
+    args = parser.parse_args(argv)
+
+    engines = args.engine or list(ENGINES)
+    if "numpy" in engines and not vectorized.HAS_NUMPY:
+        print("NumPy tidak terinstall, engine numpy dilewati")
+        engines.remove("numpy")
+
+    amounts = make_amounts(args.count, args.seed)
+    print(f"{'amounts':<19}: {args.count}")
+
+    loop_time = None
+    if not args.skip_loop:
+        loop_time = min(bench_loop(amounts, args.parts, args.seed) for _ in range(args.repeat))
+        print(f"{'loop split_money':<19}: {loop_time:.3f}s  ({args.count / loop_time:,.0f} splits/s)")
+
+    for engine in engines:
+        batch_time = min(bench_batch(amounts, args.parts, args.seed, engine) for _ in range(args.repeat))
+        line = f"{'split_many[' + engine + ']':<19}: {batch_time:.3f}s  ({args.count / batch_time:,.0f} splits/s)"
+        if loop_time is not None:
+            line += f"  speedup {loop_time / batch_time:.2f}x"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold-start import dengan budget -X importtime
+
+Setiap skenario dijalankan di interpreter baru dengan ``python -X importtime``.
+Waktu kumulatif import modul target (terbaik dari beberapa run) dibandingkan
+dengan budget, dan skenario headless gagal jika ikut meng-import modul GUI
+atau NumPy. Script keluar dengan status 1 jika ada budget yang terlampaui.
+
+Budget mengasumsikan bytecode (.pyc) sudah ter-cache; run pertama dipakai
+sebagai warm-up. Jika PYTHONDONTWRITEBYTECODE aktif, waktu kompilasi ikut
+terhitung sehingga budget perlu dilonggarkan dengan --budget-scale.
+
+Contoh:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10 --budget-scale 1.5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modul yang tidak boleh ter-import di jalur headless/library
+HEADLESS_FORBIDDEN = ("tkinter", "customtkinter", "numpy")
+
+# Nama skenario -> (modul target, budget ms, modul terlarang)
+SCENARIOS = {
+    "library": ("money_splitter.splitter", 50.0, HEADLESS_FORBIDDEN),
+    "cli": ("money_splitter.cli", 70.0, HEADLESS_FORBIDDEN),
+    "main": ("main", 25.0, HEADLESS_FORBIDDEN + ("logging",)),
+}
+
+
+def import_profile(module: str) -> dict:
+    """
+    Import module di interpreter baru dan kembalikan waktu kumulatif per modul
+
+    Returns:
+        dict: Nama modul -> waktu import kumulatif dalam milidetik
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # baris header
+        profile[name.strip()] = int(cumulative) / 1000
+    return profile
+
+
+def run_scenario(module: str, repeat: int) -> tuple:
+    """Jalankan satu skenario, kembalikan (ms terbaik, set modul yang ter-import)"""
+    import_profile(module)  # warm-up, menulis .pyc jika diizinkan
+    best = float("inf")
+    modules = set()
+    for _ in range(repeat):
+        profile = import_profile(module)
+        best = min(best, profile[module])
+        modules |= set(profile)
+    return best, modules
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="pengali budget (misalnya untuk mesin CI yang lambat)")
+    args = parser.parse_args(argv)
+
+    if os.environ.get("PYTHONDONTWRITEBYTECODE"):
+        print("Catatan: PYTHONDONTWRITEBYTECODE aktif, waktu kompilasi ikut terhitung\n")
+
+    failures = []
+    print(f"{'scenario':<10} {'module':<26} {'ms':>8} {'budget':>8}  status")
+    for name, (module, budget, forbidden) in SCENARIOS.items():
+        elapsed, modules = run_scenario(module, args.repeat)
+        budget *= args.budget_scale
+        leaked = sorted(set(forbidden) & modules)
+        status = "ok"
+        if elapsed > budget:
+            status = "LAMBAT"
+            failures.append(f"{name}: {elapsed:.1f} ms > budget {budget:.1f} ms")
+        if leaked:
+            status = "TERLARANG"
+            failures.append(f"{name}: meng-import {', '.join(leaked)}")
+        print(f"{name:<10} {module:<26} {elapsed:>8.1f} {budget:>8.1f}  {status}")
+
+    if failures:
+        print("\nBUDGET STARTUP TERLAMPAUI:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
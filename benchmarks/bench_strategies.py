@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark strategi pembagian "repair" dan "constructive"
+
+Mengukur throughput split_money dan persentase hasil yang memenuhi
+ValidationUtils.is_natural_split untuk setiap jumlah bagian.
+
+Contoh:
+    python benchmarks/bench_strategies.py --count 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.splitter import STRATEGIES, MoneySplitter  # noqa: E402
+from money_splitter.utils import ValidationUtils  # noqa: E402
+
+
+def run(strategy: str, amounts: list, num_parts: int, seed: int) -> tuple:
+    """Jalankan satu strategi, kembalikan (detik, rasio natural)"""
+    splitter = MoneySplitter(strategy=strategy)
+    splitter.random.seed(seed)
+    natural = 0
+    start = time.perf_counter()
+    results = [splitter.split_money(amount, num_parts) for amount in amounts]
+    elapsed = time.perf_counter() - start
+    for result in results:
+        if ValidationUtils.is_natural_split(result.splits, result.original_amount):
+            natural += 1
+    return elapsed, natural / len(amounts)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5_000, help="jumlah amount per jumlah bagian")
+    parser.add_argument("--min-amount", type=int, default=10_000)
+    parser.add_argument("--max-amount", type=int, default=1_000_000_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    amounts = [rng.randint(args.min_amount, args.max_amount) for _ in range(args.count)]
+
+    print(f"{'parts':>5}  {'strategy':<12} {'splits/s':>10} {'natural':>8}")
+    for num_parts in range(2, 7):
+        for strategy in STRATEGIES:
+            elapsed, natural = run(strategy, amounts, num_parts, args.seed)
+            print(f"{num_parts:>5}  {strategy:<12} {args.count / elapsed:>10,.0f} {natural:>8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark ThreadLocalSplitter: throughput per jumlah thread
+
+Setiap thread membagi bagian amounts miliknya dengan splitter per thread.
+Pada build CPython free-threaded throughput seharusnya naik mendekati
+linear; pada build dengan GIL angka ini menunjukkan batas satu core.
+
+Contoh:
+    python benchmarks/bench_threads.py --count 100000 --threads 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.threadsafe import ThreadLocalSplitter  # noqa: E402
+
+
+def gil_status() -> str:
+    """Deskripsi status GIL interpreter yang sedang berjalan"""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_enabled is None:
+        return "GIL (build standar)"
+    return "GIL aktif" if is_enabled() else "free-threaded (GIL nonaktif)"
+
+
+def run(amounts: list, threads: int, parts, seed: int) -> float:
+    """Bagi amounts dengan threads thread, kembalikan detik"""
+    pool = ThreadLocalSplitter(seed=seed)
+    shards = [amounts[i::threads] for i in range(threads)]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(lambda shard: pool.split_many(shard, parts), shards))
+        elapsed = time.perf_counter() - start
+    assert sum(len(chunk) for chunk in results) == len(amounts)
+    return elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--parts", type=int, default=None)
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    amounts = [rng.randint(10_000, 1_000_000_000) for _ in range(args.count)]
+    print(f"{args.count:,} amount, {os.cpu_count()} CPU, {gil_status()}\n")
+    print(f"{'threads':>8} {'detik':>8} {'splits/s':>12} {'speedup':>8}")
+
+    baseline = None
+    for threads in args.threads:
+        elapsed = run(amounts, threads, args.parts, args.seed)
+        baseline = baseline or elapsed
+        print(f"{threads:>8} {elapsed:>8.2f} {args.count / elapsed:>12,.0f} {baseline / elapsed:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark VirtualTable dengan 100k baris vs ttk.Treeview yang diisi penuh
+
+Mengukur waktu memuat N hasil dan latency scroll (per langkah, termasuk
+update_idletasks) untuk VirtualTable, lalu waktu memuat N baris yang sama ke
+ttk.Treeview sebagai pembanding yang membuat satu item per baris.
+
+Butuh display (misalnya DISPLAY atau xvfb-run).
+
+Contoh:
+    python benchmarks/bench_virtual_table.py --rows 100000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money_splitter.batch import SplitBatch  # noqa: E402
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--scrolls", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    import tkinter as tk
+    from tkinter import ttk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk display tidak tersedia: {e}", file=sys.stderr)
+        return 1
+    from money_splitter.widgets import RESULT_COLUMNS, VirtualTable, format_result_row
+
+    splitter = MoneySplitter(seed=args.seed, strategy="constructive")
+    batch = SplitBatch.from_results(
+        splitter.split_many([1_000_000 + i * 1_000 for i in range(args.rows)]))
+    root.geometry("900x600")
+
+    table = VirtualTable(root, RESULT_COLUMNS, format_result_row)
+    table.pack(fill="both", expand=True)
+    root.update()
+    start = time.perf_counter()
+    table.set_rows(batch)
+    root.update_idletasks()
+    load = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    steps = {
+        "scroll baris": lambda: table.yview("scroll", 3, "units"),
+        "scroll halaman": lambda: table.yview("scroll", 1, "pages"),
+        "lompat acak": lambda: table.yview("moveto", rng.random()),
+    }
+    print(f"VirtualTable {args.rows:,} baris: muat {load * 1000:.1f} ms, "
+          f"{table.materialized} slot baris\n")
+    for name, step in steps.items():
+        latencies = []
+        for _ in range(args.scrolls):
+            start = time.perf_counter()
+            step()
+            root.update_idletasks()
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        print(f"{name:<16} median {statistics.median(latencies):6.2f} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99) - 1]:6.2f} ms")
+    table.destroy()
+
+    tree = ttk.Treeview(root, columns=[title for title, _ in RESULT_COLUMNS], show="headings")
+    tree.pack(fill="both", expand=True)
+    start = time.perf_counter()
+    for index, result in enumerate(batch):
+        tree.insert("", "end", values=format_result_row(index, result))
+    root.update_idletasks()
+    print(f"\nttk.Treeview penuh: muat {(time.perf_counter() - start) * 1000:.0f} ms")
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
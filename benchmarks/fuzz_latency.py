@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Fuzzer latency terburuk MoneySplitter.split_money
+
+Mencari amount (10 ribu - 10^12) dan num_parts (2-6) yang memaksimalkan
+jumlah iterasi loop perbaikan di _balance_splits, _ensure_uniqueness dan
+_ensure_thousands_preference, diukur lewat instrumentasi SplitStats
+(MoneySplitter(collect_stats=True)). Setiap kasus dievaluasi dengan seed tetap
+sehingga hasilnya bisa diputar ulang persis. Fase pertama mengambil sampel
+log-uniform, fase kedua memutasi kasus terburuk (geser kecil, kali/bagi 10,
+bulatkan ke ribuan/jutaan, seed lain) untuk mendaki ke iterasi lebih tinggi.
+
+Output: histogram latency, p50/p99/p99.9 per num_parts dan daftar kasus
+terburuk. Dengan --save, kasus terburuk disimpan ke
+tests/data/latency_regressions.json dan diputar ulang oleh
+tests/test_regressions.py.
+
+Contoh:
+    python benchmarks/fuzz_latency.py --samples 20000
+    python benchmarks/fuzz_latency.py --samples 5000 --rounds 5 --save
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from money_splitter.splitter import STRATEGIES, MoneySplitter  # noqa: E402
+
+REGRESSIONS_PATH = ROOT / "tests" / "data" / "latency_regressions.json"
+
+MIN_AMOUNT = 10_000
+MAX_AMOUNT = 10 ** 12
+
+# Counter SplitStats yang ikut dicatat per kasus
+COUNTERS = (
+    "balance_iterations",
+    "collision_shifts",
+    "duplicate_fixes",
+    "forced_roundings",
+    "distribution_retries",
+)
+
+
+def run_case(splitter: MoneySplitter, amount: int, num_parts: int, seed: int) -> dict:
+    """Jalankan satu pembagian dengan seed tetap dan kembalikan ukurannya"""
+    splitter.random.seed(seed)
+    start = time.perf_counter()
+    splitter.split_money(amount, num_parts)
+    elapsed = time.perf_counter() - start
+    stats = splitter.last_stats
+    return {
+        "amount": amount,
+        "num_parts": num_parts,
+        "seed": seed,
+        "iterations": stats.iterations,
+        "counters": {name: getattr(stats, name) for name in COUNTERS if getattr(stats, name)},
+        "dominant": stats.dominant_stage(),
+        "latency_us": elapsed * 1e6,
+    }
+
+
+def score(case: dict) -> tuple:
+    """Urutan kasus: iterasi (deterministik) dulu, latency sebagai tie-breaker"""
+    return case["iterations"], case["latency_us"]
+
+
+def log_uniform_amount(rng: random.Random) -> int:
+    """Amount acak log-uniform di [MIN_AMOUNT, MAX_AMOUNT]"""
+    low, high = math.log(MIN_AMOUNT), math.log(MAX_AMOUNT)
+    return int(math.exp(rng.uniform(low, high)))
+
+
+def mutate(amount: int, num_parts: int, rng: random.Random) -> int:
+    """Turunkan amount baru di sekitar kasus yang sudah lambat"""
+    kind = rng.randrange(6)
+    if kind == 0:
+        amount += rng.randint(-999, 999)
+    elif kind == 1:
+        amount += rng.randint(-50, 50) * 1000
+    elif kind == 2:
+        amount = amount * 10 if rng.random() < 0.5 else amount // 10
+    elif kind == 3:
+        unit = rng.choice([1000, 10 ** 6])
+        amount = max(unit, round(amount / unit) * unit) + rng.choice([-1, 0, 1])
+    elif kind == 4:
+        # Sekitar batas mode per-rupiah di _balance_splits
+        amount = num_parts * 20_000 + rng.randint(-2000, 2000)
+    else:
+        amount = int(amount * rng.uniform(0.9, 1.1))
+    return min(max(amount, MIN_AMOUNT), MAX_AMOUNT)
+
+
+def fuzz(strategy: str, samples: int, rounds: int, top: int, seed: int) -> list:
+    """
+    Jalankan fase sampling lalu fase mutasi untuk setiap num_parts
+
+    Returns:
+        list: Semua kasus yang dievaluasi
+    """
+    rng = random.Random(seed)
+    splitter = MoneySplitter(strategy=strategy, collect_stats=True)
+    cases = []
+    for num_parts in range(2, 7):
+        evaluated = [
+            run_case(splitter, log_uniform_amount(rng), num_parts, rng.getrandbits(32))
+            for _ in range(samples)
+        ]
+        for _ in range(rounds):
+            worst = heapq.nlargest(top, evaluated, key=score)
+            for case in worst:
+                for _ in range(max(1, samples // (top * rounds))):
+                    amount = mutate(case["amount"], num_parts, rng)
+                    evaluated.append(run_case(splitter, amount, num_parts, rng.getrandbits(32)))
+        cases.extend(evaluated)
+    return cases
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Percentile nearest-rank dari list yang sudah terurut"""
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def print_report(cases: list, worst: int) -> None:
+    """Cetak histogram latency, percentile per num_parts dan kasus terburuk"""
+    latencies = sorted(case["latency_us"] for case in cases)
+    buckets = Counter(max(0, int(math.log2(max(value, 1.0)))) for value in latencies)
+    width = max(buckets.values())
+
+    print("Histogram latency (µs)")
+    for exponent in range(min(buckets), max(buckets) + 1):
+        count = buckets.get(exponent, 0)
+        bar = "#" * max(1 if count else 0, round(40 * count / width))
+        print(f"  {2 ** exponent:>8}-{2 ** (exponent + 1):<8} {count:>8}  {bar}")
+
+    print()
+    print(f"{'parts':>5} {'count':>8} {'p50 µs':>9} {'p99 µs':>9} {'p99.9 µs':>9} {'max µs':>9} {'max iter':>8}")
+    for num_parts in range(2, 7):
+        subset = [case for case in cases if case["num_parts"] == num_parts]
+        values = sorted(case["latency_us"] for case in subset)
+        print(
+            f"{num_parts:>5} {len(values):>8} {percentile(values, 0.5):>9.1f} "
+            f"{percentile(values, 0.99):>9.1f} {percentile(values, 0.999):>9.1f} "
+            f"{values[-1]:>9.1f} {max(case['iterations'] for case in subset):>8}"
+        )
+
+    print()
+    print("Kasus terburuk (berdasarkan iterasi):")
+    for case in heapq.nlargest(worst, cases, key=score):
+        counters = ", ".join(f"{name}={count}" for name, count in case["counters"].items())
+        print(
+            f"  amount={case['amount']:<14} parts={case['num_parts']} seed={case['seed']:<10} "
+            f"iter={case['iterations']:<4} {case['latency_us']:>8.1f} µs  "
+            f"dominan={case['dominant']} [{counters}]"
+        )
+
+
+def save_regressions(cases: list, strategy: str, per_parts: int, path: Path) -> list:
+    """
+    Simpan kasus terburuk per num_parts sebagai regression case
+
+    Kasus baru digabung dengan isi file yang sudah ada (unik per
+    strategy/amount/num_parts/seed) agar kasus lama tidak hilang.
+    """
+    existing = []
+    if path.exists():
+        existing = json.loads(path.read_text(encoding="utf-8"))["cases"]
+
+    selected = []
+    for num_parts in range(2, 7):
+        subset = [case for case in cases if case["num_parts"] == num_parts]
+        for case in heapq.nlargest(per_parts, subset, key=score):
+            selected.append({
+                "strategy": strategy,
+                "amount": case["amount"],
+                "num_parts": num_parts,
+                "seed": case["seed"],
+                "iterations": case["iterations"],
+            })
+
+    merged = {}
+    for case in existing + selected:
+        merged[(case["strategy"], case["amount"], case["num_parts"], case["seed"])] = case
+    ordered = sorted(merged.values(), key=lambda c: (c["strategy"], c["num_parts"], -c["iterations"]))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"cases": ordered}, indent=2) + "\n", encoding="utf-8")
+    return ordered
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=10_000, help="sampel acak per num_parts")
+    parser.add_argument("--rounds", type=int, default=3, help="putaran mutasi kasus terburuk")
+    parser.add_argument("--top", type=int, default=20, help="kasus terburuk yang dimutasi per putaran")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="repair")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--worst", type=int, default=15, help="jumlah kasus terburuk yang dicetak")
+    parser.add_argument("--save", action="store_true", help="simpan kasus terburuk sebagai regression case")
+    parser.add_argument("--save-per-parts", type=int, default=4)
+    parser.add_argument("--output", type=Path, default=REGRESSIONS_PATH)
+    args = parser.parse_args(argv)
+
+    cases = fuzz(args.strategy, args.samples, args.rounds, args.top, args.seed)
+    print_report(cases, args.worst)
+
+    if args.save:
+        saved = save_regressions(cases, args.strategy, args.save_per_parts, args.output)
+        print(f"\n{len(saved)} regression case disimpan ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite hot path splitter, formatter dan parser
+
+Mengukur ops/detik untuk MoneySplitter.split_money per magnitude amount dan
+jumlah bagian, CurrencyFormatter.format_rupiah, CurrencyFormatter.parse_input
+dan SplitResult.get_percentages. Input dibuat dari seed tetap sehingga setiap
+run mengukur pekerjaan yang sama. Hasil bisa disimpan sebagai baseline JSON di
+benchmarks/baselines/ dan run berikutnya dibandingkan dengan baseline
+tersebut: case yang lebih lambat dari toleransi membuat script keluar dengan
+status 1.
+
+Suite berjalan headless dan gagal jika customtkinter ikut ter-import.
+
+Contoh:
+    python benchmarks/suite.py --save
+    python benchmarks/suite.py --compare
+    python benchmarks/suite.py --compare --tolerance 0.15 --filter split_money
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from money_splitter.splitter import MoneySplitter  # noqa: E402
+from money_splitter.utils import CurrencyFormatter  # noqa: E402
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Magnitude amount untuk split_money (label -> range amount)
+MAGNITUDES = {
+    "1e5": (10_000, 999_999),
+    "1e7": (1_000_000, 99_999_999),
+    "1e9": (100_000_000, 9_999_999_999),
+    "1e11": (10_000_000_000, 999_999_999_999),
+}
+
+# Jumlah input berbeda yang diputar ulang oleh setiap case
+POOL_SIZE = 256
+
+
+def _split_money_case(low: int, high: int, num_parts: int, seed: int):
+    rng = random.Random(seed)
+    amounts = [rng.randint(low, high) for _ in range(POOL_SIZE)]
+    splitter = MoneySplitter()
+
+    def run(ops: int) -> None:
+        splitter.random.seed(seed)
+        split = splitter.split_money
+        for i in range(ops):
+            split(amounts[i % POOL_SIZE], num_parts)
+    return run
+
+
+def _format_case(low: int, high: int, seed: int):
+    rng = random.Random(seed)
+    amounts = [rng.randint(low, high) for _ in range(POOL_SIZE)]
+
+    def run(ops: int) -> None:
+        fmt = CurrencyFormatter.format_rupiah
+        for i in range(ops):
+            fmt(amounts[i % POOL_SIZE])
+    return run
+
+
+def _parse_case(template: str, seed: int):
+    rng = random.Random(seed)
+    texts = [
+        template.format(f"{rng.randint(10_000, 10 ** 12):,}".replace(",", "."))
+        for _ in range(POOL_SIZE)
+    ]
+
+    def run(ops: int) -> None:
+        parse = CurrencyFormatter.parse_input
+        for i in range(ops):
+            parse(texts[i % POOL_SIZE])
+    return run
+
+
+def _percentages_case(num_parts: int, seed: int):
+    splitter = MoneySplitter()
+    splitter.random.seed(seed)
+    rng = random.Random(seed)
+    results = [
+        splitter.split_money(rng.randint(10_000, 10 ** 9), num_parts)
+        for _ in range(POOL_SIZE)
+    ]
+
+    def run(ops: int) -> None:
+        for i in range(ops):
+            results[i % POOL_SIZE].get_percentages()
+    return run
+
+
+def build_cases(seed: int) -> dict:
+    """
+    Susun semua case benchmark
+
+    Returns:
+        dict: Nama case -> (fungsi run(ops), jumlah ops per pengulangan)
+    """
+    cases = {}
+    for label, (low, high) in MAGNITUDES.items():
+        for num_parts in range(2, 7):
+            cases[f"split_money/{label}/{num_parts}"] = (
+                _split_money_case(low, high, num_parts, seed), 1_000)
+    cases["format_rupiah/small"] = (_format_case(0, 999_999, seed), 200_000)
+    cases["format_rupiah/large"] = (_format_case(10 ** 9, 10 ** 12, seed), 200_000)
+    cases["format_rupiah/negative"] = (_format_case(-10 ** 9, -1, seed), 200_000)
+    cases["parse_input/dotted"] = (_parse_case("{}", seed), 50_000)
+    cases["parse_input/prefixed"] = (_parse_case("Rp {}", seed), 50_000)
+    cases["parse_input/spaced"] = (_parse_case("  IDR {},-  ", seed), 50_000)
+    for num_parts in (2, 6):
+        cases[f"get_percentages/{num_parts}"] = (_percentages_case(num_parts, seed), 200_000)
+    return cases
+
+
+def measure(run, ops: int, repeat: int, scale: float) -> float:
+    """Jalankan run(ops) beberapa kali dan kembalikan ops/detik terbaik"""
+    ops = max(1, int(ops * scale))
+    run(min(ops, 50))  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(ops)
+        best = min(best, time.perf_counter() - start)
+    return ops / best
+
+
+def run_suite(seed: int, repeat: int, scale: float, name_filter: str = None) -> dict:
+    """Ukur semua case (opsional disaring substring nama), kembalikan nama -> ops/detik"""
+    results = {}
+    for name, (run, ops) in build_cases(seed).items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(run, ops, repeat, scale)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Bandingkan hasil dengan baseline
+
+    Args:
+        results: Nama case -> ops/detik run sekarang
+        baseline: Nama case -> ops/detik baseline
+        tolerance: Penurunan relatif maksimal (0.2 = boleh 20% lebih lambat)
+
+    Returns:
+        list: Tuple (nama, baseline, sekarang, rasio) untuk case yang regresi
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference and current < reference * (1 - tolerance):
+            regressions.append((name, reference, current, current / reference))
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    """Baca file baseline dan kembalikan nama -> ops/detik"""
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def save_baseline(results: dict, path: Path, seed: int) -> None:
+    """Simpan hasil run sebagai baseline beserta metadata environment"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def print_results(results: dict, baseline: dict = None) -> None:
+    """Cetak tabel ops/detik, dengan kolom baseline jika ada"""
+    header = f"{'case':<28} {'ops/s':>14}"
+    if baseline:
+        header += f" {'baseline':>14} {'ratio':>7}"
+    print(header)
+    for name, value in results.items():
+        line = f"{name:<28} {value:>14,.0f}"
+        if baseline and name in baseline:
+            line += f" {baseline[name]:>14,.0f} {value / baseline[name]:>7.2f}"
+        print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINES_DIR / "baseline.json",
+                        help="file baseline JSON")
+    parser.add_argument("--save", action="store_true", help="simpan hasil sebagai baseline")
+    parser.add_argument("--compare", action="store_true", help="bandingkan dengan baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="penurunan ops/detik relatif yang masih diterima")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="pengali jumlah ops per case")
+    parser.add_argument("--filter", dest="name_filter", help="hanya case yang namanya mengandung teks ini")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.seed, args.repeat, args.scale, args.name_filter)
+
+    if "customtkinter" in sys.modules:
+        print("ERROR: customtkinter ter-import; suite harus berjalan headless", file=sys.stderr)
+        return 2
+
+    baseline = None
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"ERROR: baseline {args.baseline} tidak ditemukan, jalankan dengan --save dulu",
+                  file=sys.stderr)
+            return 2
+        baseline = load_baseline(args.baseline)
+
+    print_results(results, baseline)
+
+    if args.save:
+        save_baseline(results, args.baseline, args.seed)
+        print(f"\nBaseline disimpan ke {args.baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nREGRESI PERFORMA (toleransi {args.tolerance:.0%}):", file=sys.stderr)
+            for name, reference, current, ratio in regressions:
+                print(f"  {name}: {reference:,.0f} -> {current:,.0f} ops/s ({ratio:.2f}x)",
+                      file=sys.stderr)
+            return 1
+        print(f"\nTidak ada regresi di atas toleransi {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
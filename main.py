@@ -7,49 +7,65 @@ dengan tampilan yang natural untuk keperluan transaksi tunai.
 """
 
 import sys
-import logging
-import traceback
-from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from money_splitter.gui import MoneySpitterGUI
+# Modul berat (logging, tkinter, customtkinter, GUI) di-import di dalam fungsi
+# yang membutuhkannya, sehingga jalur headless (CLI) dan pemakaian sebagai
+# library tidak membayar biaya startup GUI.
+
+# Modul yang dibutuhkan jalur GUI, dicek tanpa di-import
+GUI_DEPENDENCIES = ("tkinter", "customtkinter")
+
+# Database riwayat pembagian jalur GUI
+HISTORY_PATH = "data/history.db"
+
+# HistoryStore yang dibuka jalur GUI, ditutup oleh cleanup()
+_history = None
 
 
 def setup_logging() -> None:
-    """Setup logging configuration untuk aplikasi"""
+    """Setup logging configuration untuk aplikasi (hanya jalur GUI)"""
+    import logging
+    from pathlib import Path
+    
     # Create logs directory if it doesn't exist
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     
-    # Configure logging
+    # Configure logging; file log baru dibuka saat record pertama ditulis
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(logs_dir / "money_splitter.log"),
+            logging.FileHandler(logs_dir / "money_splitter.log", delay=True),
             logging.StreamHandler(sys.stdout)
         ]
     )
 
 
 def check_dependencies() -> bool:
-    """Check if all required dependencies are available"""
-    try:
-        import tkinter
-        from money_splitter.gui import MoneySpitterGUI
-        from money_splitter.splitter import MoneySplitter
-        from money_splitter.utils import CurrencyFormatter, ValidationUtils
-        from money_splitter.models import SplitResult
-        return True
-    except ImportError as e:
-        logging.error(f"Missing dependency: {e}")
-        print(f"Error: Missing required dependency - {e}")
+    """
+    Check if all required dependencies are available
+    
+    Hanya mencari module spec tanpa meng-import, sehingga tkinter dan
+    customtkinter di-load sekali saja oleh money_splitter.gui.
+    """
+    import importlib.util
+    import logging
+    
+    missing = [name for name in GUI_DEPENDENCIES if importlib.util.find_spec(name) is None]
+    if missing:
+        logging.error(f"Missing dependency: {', '.join(missing)}")
+        print(f"Error: Missing required dependency - {', '.join(missing)}")
         print("Please ensure all required modules are installed.")
         return False
+    return True
 
 
 def handle_exception(exc_type, exc_value, exc_traceback) -> None:
     """Global exception handler untuk uncaught exceptions"""
+    import logging
+    
     if issubclass(exc_type, KeyboardInterrupt):
         # Handle Ctrl+C gracefully
         logging.info("Application interrupted by user")
@@ -83,13 +99,28 @@ def handle_exception(exc_type, exc_value, exc_traceback) -> None:
         print(f"\nFATAL ERROR: {error_msg}")
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main function untuk menjalankan aplikasi
     
+    Tanpa argumen membuka GUI. Dengan subcommand (misalnya ``split``) berjalan
+    headless lewat money_splitter.cli tanpa menyentuh tkinter/customtkinter.
+    
+    Args:
+        argv: Argumen command line tanpa nama program (default: sys.argv[1:])
+    
     Returns:
         int: Exit code (0 for success, 1 for error)
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
+        from money_splitter.cli import main as cli_main
+        return cli_main(argv)
+    
+    import logging
+    import traceback
+    
     # Setup logging
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -109,7 +140,8 @@ def main() -> int:
         
         # Create and run the application
         logger.info("Initializing GUI application")
-        app = MoneySpitterGUI()
+        from money_splitter.gui import MoneySpitterGUI
+        app = MoneySpitterGUI(history=open_history())
         
         logger.info("Starting application main loop")
         app.run()
@@ -146,13 +178,43 @@ def main() -> int:
         return 1
 
 
+def open_history():
+    """
+    Buka database riwayat GUI; None jika gagal (aplikasi tetap berjalan)
+
+    Setiap hasil langsung di-commit (batch_size=1) agar riwayat tidak hilang
+    jika aplikasi ditutup paksa.
+    """
+    global _history
+    import logging
+    import sqlite3
+    from money_splitter.history import HistoryStore
+    
+    try:
+        _history = HistoryStore(HISTORY_PATH, batch_size=1, source="gui")
+    except sqlite3.Error as e:
+        logging.warning(f"Riwayat pembagian tidak aktif: {e}")
+        _history = None
+    return _history
+
+
 def cleanup() -> None:
     """Cleanup function yang dipanggil saat aplikasi akan ditutup"""
+    if "logging" not in sys.modules:
+        # Jalur headless tidak pernah menyiapkan logging, tidak ada yang dibersihkan
+        return
+    import logging
+    
     logger = logging.getLogger(__name__)
     logger.info("Performing application cleanup")
     
-    # Add any cleanup tasks here if needed
-    # For example: closing database connections, saving state, etc.
+    global _history
+    if _history is not None:
+        try:
+            _history.close()
+        except Exception:
+            logger.exception("Gagal menutup database riwayat")
+        _history = None
     
     logger.info("Cleanup completed")
 
@@ -168,5 +230,6 @@ if __name__ == "__main__":
         raise
     except:
         # Handle any other exceptions during cleanup
+        import logging
         logging.critical("Error during cleanup", exc_info=True)
         sys.exit(1)
\ No newline at end of file
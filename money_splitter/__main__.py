@@ -0,0 +1,10 @@
+"""
+Jalankan CLI headless dengan ``python -m money_splitter``
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
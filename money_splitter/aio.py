@@ -0,0 +1,221 @@
+"""
+API asyncio untuk Money Splitter
+
+Pembagian adalah pekerjaan CPU-bound (loop _ensure_* pada strategi repair),
+sehingga AsyncSplitter menjalankannya di executor (default: thread pool milik
+event loop, atau ProcessPoolExecutor yang diberikan pemanggil) agar event
+loop tidak pernah terblokir. Jumlah pekerjaan yang sedang berjalan dibatasi
+dengan semaphore: producer yang lebih cepat dari splitter akan menunggu di
+``await`` alih-alih menumpuk antrian tanpa batas.
+
+Setiap task executor membuat MoneySplitter sendiri dengan seed yang
+diturunkan dari master seed dan nomor task, sehingga tidak ada state bersama
+antar thread/proses dan hasil bisa direproduksi untuk urutan panggilan yang
+sama.
+
+Contoh:
+    async with AsyncSplitter(max_pending=32) as splitter:
+        result = await splitter.split_money(1_500_000, 5)
+        async for result in splitter.iter_split(amount_stream()):
+            ...
+"""
+
+import asyncio
+import weakref
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from .models import SplitResult
+from .splitter import MoneySplitter, derive_seed
+
+DEFAULT_MAX_PENDING = 32
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+def _split_task(amounts: List[int], num_parts: Optional[int], seed: Optional[int],
+                splitter_kwargs: Dict[str, Any]) -> List[SplitResult]:
+    """Jalankan satu task di executor (module-level agar bisa di-pickle)"""
+    splitter = MoneySplitter(seed=seed, **splitter_kwargs)
+    return splitter.split_many(amounts, num_parts)
+
+
+class AsyncSplitter:
+    """Facade asyncio di atas MoneySplitter dengan executor dan backpressure"""
+
+    def __init__(self, executor: Executor = None, max_pending: int = DEFAULT_MAX_PENDING,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = None, **splitter_kwargs):
+        """
+        Args:
+            executor: Executor untuk pekerjaan CPU; None memakai executor
+                default event loop. Untuk ProcessPoolExecutor, splitter_kwargs
+                harus bisa di-pickle.
+            max_pending: Jumlah task executor maksimal yang berjalan bersamaan
+            chunk_size: Jumlah amount per task pada split_many/iter_split
+            seed: Master seed opsional untuk hasil yang bisa direproduksi
+            **splitter_kwargs: Argumen lain untuk MoneySplitter (strategy,
+                max_iterations, time_budget)
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending harus minimal 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus minimal 1")
+        if "rng" in splitter_kwargs:
+            raise ValueError("rng tidak bisa dibagi antar task; gunakan seed")
+        self.executor = executor
+        self.max_pending = max_pending
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self._splitter_kwargs = splitter_kwargs
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks = 0
+        self._running = 0
+
+    async def __aenter__(self) -> "AsyncSplitter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Tunggu semua task yang sedang berjalan selesai"""
+        semaphore = self._get_semaphore()
+        for _ in range(self.max_pending):
+            await semaphore.acquire()
+        for _ in range(self.max_pending):
+            semaphore.release()
+
+    @property
+    def pending(self) -> int:
+        """Jumlah task executor yang sedang berjalan"""
+        return self._running
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Dibuat saat pertama dipakai agar terikat ke event loop yang berjalan
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        return self._semaphore
+
+    def _next_seed(self) -> Optional[int]:
+        # Seed diambil saat submit (urutan panggilan), bukan saat task mulai
+        seed = None if self.seed is None else derive_seed(self.seed, self._tasks)
+        self._tasks += 1
+        return seed
+
+    async def split_money(self, amount: int, num_parts: int = None) -> SplitResult:
+        """
+        Versi async MoneySplitter.split_money
+
+        Menunggu (backpressure) jika sudah ada max_pending task berjalan.
+
+        Raises:
+            ValueError: Jika amount atau num_parts tidak valid
+        """
+        results = await self._run([amount], num_parts)
+        return results[0]
+
+    async def split_many(self, amounts: Iterable[int], num_parts: int = None) -> List[SplitResult]:
+        """
+        Versi async MoneySplitter.split_many, dipecah per chunk_size
+
+        Returns:
+            List[SplitResult]: Hasil dengan urutan yang sama seperti input
+        """
+        return [result async for result in self.iter_split(amounts, num_parts)]
+
+    async def iter_split(self, amounts: Union[Iterable[int], AsyncIterable[int]],
+                         num_parts: int = None) -> AsyncIterator[SplitResult]:
+        """
+        Async iterator hasil pembagian sesuai urutan input
+
+        Input (iterable biasa atau async iterable) dibaca per chunk_size.
+        Paling banyak max_pending chunk per iterator yang sedang diproses atau
+        sudah selesai tetapi belum diambil, sehingga memori tetap terbatas
+        untuk stream amount yang panjang meskipun chunk terdepan lambat.
+
+        Yields:
+            SplitResult: Hasil per amount, urutan sama seperti input
+        """
+        semaphore = self._get_semaphore()
+        in_flight = deque()
+        async for chunk in self._chunks(amounts):
+            # Slot semaphore dilepas saat task selesai, jadi hasil yang belum
+            # diambil dibatasi lewat panjang in_flight: tunggu chunk terdepan
+            while in_flight and (len(in_flight) >= self.max_pending or in_flight[0].done()):
+                for result in await asyncio.shield(in_flight.popleft()):
+                    yield result
+            # Tunggu slot sebelum membaca chunk berikutnya dari producer
+            await semaphore.acquire()
+            in_flight.append(self._submit(chunk, num_parts, self._next_seed()))
+        while in_flight:
+            # shield: konsumen yang dibatalkan tidak membatalkan future executor
+            for result in await asyncio.shield(in_flight.popleft()):
+                yield result
+
+    async def _chunks(self, amounts: Union[Iterable[int], AsyncIterable[int]]) -> AsyncIterator[List[int]]:
+        chunk = []
+        if hasattr(amounts, "__aiter__"):
+            async for amount in amounts:
+                chunk.append(amount)
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = []
+        else:
+            for amount in amounts:
+                chunk.append(amount)
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    async def _run(self, amounts: List[int], num_parts: Optional[int]) -> List[SplitResult]:
+        await self._get_semaphore().acquire()
+        return await asyncio.shield(self._submit(amounts, num_parts, self._next_seed()))
+
+    def _submit(self, amounts: List[int], num_parts: Optional[int],
+                seed: Optional[int]) -> "asyncio.Future[List[SplitResult]]":
+        """
+        Kirim satu task ke executor; semaphore sudah di-acquire pemanggil
+
+        Slot dilepas oleh done-callback saat pekerjaan executor benar-benar
+        selesai. Future tidak pernah dibatalkan (pemanggil memakai
+        asyncio.shield), sehingga slot tidak bocor untuk task yang belum
+        mulai dan tidak dilepas terlalu cepat untuk task yang masih berjalan.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(
+                self.executor, _split_task, amounts, num_parts, seed, self._splitter_kwargs)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self._running += 1
+        future.add_done_callback(self._on_task_done)
+        return future
+
+    def _on_task_done(self, future: asyncio.Future) -> None:
+        self._running -= 1
+        self._semaphore.release()
+        # Hasil yang tidak lagi ditunggu (iterator berhenti lebih awal) tidak
+        # memicu peringatan "exception was never retrieved"
+        if not future.cancelled():
+            future.exception()
+
+
+# AsyncSplitter default per event loop (semaphore terikat ke satu loop)
+_default_splitters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSplitter]" = (
+    weakref.WeakKeyDictionary())
+
+
+async def split_money_async(amount: int, num_parts: int = None) -> SplitResult:
+    """
+    Bagi amount tanpa memblokir event loop memakai AsyncSplitter default
+
+    Untuk executor, seed atau batas backpressure sendiri, buat AsyncSplitter.
+    """
+    loop = asyncio.get_running_loop()
+    splitter = _default_splitters.get(loop)
+    if splitter is None:
+        splitter = _default_splitters[loop] = AsyncSplitter()
+    return await splitter.split_money(amount, num_parts)
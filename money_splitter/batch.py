@@ -0,0 +1,201 @@
+"""
+Container kolumnar untuk banyak hasil pembagian
+
+SplitBatch menyimpan N hasil sebagai kolom array('q') yang bersebelahan:
+
+- amounts: amount asli per hasil (N)
+- offsets: posisi awal bagian setiap hasil di kolom parts (N + 1)
+- parts: semua bagian berurutan (jumlah semua num_parts)
+- timestamps: timestamp per hasil dalam mikrodetik sejak 1970-01-01 (N)
+
+Total, persentase dan pengecekan balance dihitung untuk seluruh batch dalam
+satu panggilan dengan semantik integer yang sama seperti
+SplitResult.get_percentages. Jika NumPy terinstall, perhitungan dilakukan
+di atas kolom tanpa salinan (np.frombuffer); hasilnya identik dengan jalur
+pure-Python dan selalu dikembalikan sebagai array.array.
+
+Contoh:
+    batch = SplitBatch.from_results(splitter.split_many(amounts))
+    unbalanced = [i for i, ok in enumerate(batch.is_balanced()) if not ok]
+    percentages = batch.get_percentages()       # sejajar dengan batch.parts
+"""
+
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator, List, Sequence, Union
+
+from .models import CompactSplitResult, SplitResult, _from_epoch_us, _TimestampMemo, _to_epoch_us
+from .vectorized import HAS_NUMPY, _load_numpy
+
+# split * 10000 harus muat di int64 agar jalur NumPy tidak overflow; batch
+# dengan amount lebih besar dihitung dengan jalur pure-Python
+MAX_VECTOR_AMOUNT = (2 ** 63 - 1) // 10000
+
+
+class SplitBatch:
+    """Banyak hasil pembagian dalam kolom array('q')"""
+
+    __slots__ = ("amounts", "offsets", "parts", "timestamps")
+
+    def __init__(self, amounts: array = None, offsets: array = None,
+                 parts: array = None, timestamps: array = None):
+        """
+        Args:
+            amounts: Kolom amount (array('q'))
+            offsets: Kolom offset dengan panjang len(amounts) + 1, diawali 0
+            parts: Kolom semua bagian
+            timestamps: Kolom timestamp mikrodetik sejak epoch
+
+        Raises:
+            ValueError: Jika panjang kolom tidak konsisten
+        """
+        self.amounts = amounts if amounts is not None else array("q")
+        self.offsets = offsets if offsets is not None else array("q", [0])
+        self.parts = parts if parts is not None else array("q")
+        self.timestamps = timestamps if timestamps is not None else array("q")
+        if (len(self.offsets) != len(self.amounts) + 1 or self.offsets[0] != 0
+                or self.offsets[-1] != len(self.parts)
+                or len(self.timestamps) != len(self.amounts)):
+            raise ValueError("Panjang kolom SplitBatch tidak konsisten")
+
+    @classmethod
+    def from_results(cls, results: Iterable[Union[SplitResult, CompactSplitResult]]) -> "SplitBatch":
+        """Susun batch dari SplitResult atau CompactSplitResult"""
+        batch = cls()
+        batch.extend(results)
+        return batch
+
+    def extend(self, results: Iterable[Union[SplitResult, CompactSplitResult]]) -> None:
+        """
+        Tambahkan hasil ke akhir batch, misalnya per chunk split_many
+
+        Timestamp yang sama (seperti hasil satu split_many) hanya dikonversi
+        sekali.
+        """
+        amounts, offsets, parts, timestamps = self.amounts, self.offsets, self.parts, self.timestamps
+        to_us = _TimestampMemo().to_us
+        for result in results:
+            amounts.append(result.original_amount)
+            parts.extend(result.splits)
+            offsets.append(len(parts))
+            if isinstance(result, CompactSplitResult):
+                timestamps.append(result.timestamp_us)
+                continue
+            timestamps.append(to_us(result.timestamp))
+
+    @classmethod
+    def from_matrix(cls, amounts: Sequence[int], matrix, timestamp: datetime = None) -> "SplitBatch":
+        """
+        Susun batch dari matriks (N, num_parts), misalnya vectorized.split_matrix
+
+        Args:
+            amounts: Amount per baris
+            matrix: Matriks bagian (ndarray NumPy atau list of list)
+            timestamp: Timestamp untuk semua hasil (default: sekarang)
+        """
+        rows = matrix.tolist() if hasattr(matrix, "tolist") else matrix
+        amounts = array("q", amounts)
+        if len(rows) != len(amounts):
+            raise ValueError("Jumlah baris matriks harus sama dengan jumlah amounts")
+        if not rows:
+            return cls()
+        width = len(rows[0])
+        if width == 0:
+            raise ValueError("Baris matriks tidak boleh kosong")
+        parts = array("q")
+        for row in rows:
+            if len(row) != width:
+                raise ValueError("Semua baris matriks harus sama panjang")
+            parts.extend(row)
+        offsets = array("q", range(0, len(parts) + 1, width))
+        value = _to_epoch_us(timestamp or datetime.now())
+        return cls(amounts, offsets, parts, array("q", [value]) * len(amounts))
+
+    def to_results(self) -> List[SplitResult]:
+        """Kembalikan sebagai list SplitResult (timestamp sama berbagi datetime)"""
+        return list(self._iter_results())
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __getitem__(self, index: int) -> SplitResult:
+        if index < 0:
+            index += len(self.amounts)
+        if not 0 <= index < len(self.amounts):
+            raise IndexError("Indeks SplitBatch di luar jangkauan")
+        splits = self.parts[self.offsets[index]:self.offsets[index + 1]].tolist()
+        return SplitResult(
+            original_amount=self.amounts[index], splits=splits, num_parts=len(splits),
+            timestamp=_from_epoch_us(self.timestamps[index]),
+        )
+
+    def __iter__(self) -> Iterator[SplitResult]:
+        return self._iter_results()
+
+    def num_parts(self) -> array:
+        """Jumlah bagian per hasil"""
+        offsets = self.offsets
+        return array("q", (offsets[i + 1] - offsets[i] for i in range(len(self.amounts))))
+
+    def get_total(self) -> array:
+        """Total bagian per hasil (array('q') sepanjang batch)"""
+        np = self._numpy()
+        if np is not None:
+            parts = np.frombuffer(self.parts, dtype=np.int64)
+            totals = np.add.reduceat(parts, np.frombuffer(self.offsets, dtype=np.int64)[:-1])
+            return array("q", totals.tobytes())
+        parts, offsets = self.parts, self.offsets
+        return array("q", (sum(parts[offsets[i]:offsets[i + 1]]) for i in range(len(self.amounts))))
+
+    def get_percentages(self) -> array:
+        """
+        Persentase setiap bagian dari amount-nya, sejajar dengan kolom parts
+
+        Semantik sama dengan SplitResult.get_percentages:
+        (split * 10000 // amount) / 100.0. Persentase hasil ke-i ada di
+        indeks offsets[i]:offsets[i + 1].
+        """
+        np = self._numpy()
+        if np is not None:
+            parts = np.frombuffer(self.parts, dtype=np.int64)
+            owners = np.repeat(np.frombuffer(self.amounts, dtype=np.int64),
+                               np.diff(np.frombuffer(self.offsets, dtype=np.int64)))
+            return array("d", ((parts * 10000 // owners) / 100.0).tobytes())
+        percentages = array("d")
+        parts, offsets = self.parts, self.offsets
+        for i, amount in enumerate(self.amounts):
+            percentages.extend(
+                (split * 10000 // amount) / 100.0 for split in parts[offsets[i]:offsets[i + 1]]
+            )
+        return percentages
+
+    def is_balanced(self) -> List[bool]:
+        """Apakah total bagian sama dengan amount, per hasil"""
+        totals = self.get_total()
+        np = self._numpy()
+        if np is not None:
+            return (np.frombuffer(totals, dtype=np.int64)
+                    == np.frombuffer(self.amounts, dtype=np.int64)).tolist()
+        return [total == amount for total, amount in zip(totals, self.amounts)]
+
+    def all_balanced(self) -> bool:
+        """True jika semua hasil di batch balance"""
+        return all(self.is_balanced())
+
+    def _iter_results(self) -> Iterator[SplitResult]:
+        from_us = _TimestampMemo().from_us
+        parts, offsets, timestamps = self.parts, self.offsets, self.timestamps
+        for i, amount in enumerate(self.amounts):
+            splits = parts[offsets[i]:offsets[i + 1]].tolist()
+            yield SplitResult(original_amount=amount, splits=splits,
+                              num_parts=len(splits), timestamp=from_us(timestamps[i]))
+
+    def _numpy(self):
+        """Modul NumPy jika terinstall dan semua nilai aman dari overflow int64, selain itu None"""
+        if not HAS_NUMPY or not self.amounts:
+            return None
+        np = _load_numpy()
+        if (int(np.frombuffer(self.amounts, dtype=np.int64).max()) <= MAX_VECTOR_AMOUNT
+                and int(np.frombuffer(self.parts, dtype=np.int64).max()) <= MAX_VECTOR_AMOUNT):
+            return np
+        return None
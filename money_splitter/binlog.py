@@ -0,0 +1,245 @@
+"""
+Log biner append-only untuk hasil pembagian
+
+Format file (little-endian, semua field int64 agar record bisa dibaca
+sebagai memoryview 'q' tanpa salinan):
+
+    header (16 byte): magic b"MSPLTLOG", version uint32, max_parts uint32
+    record (8 * (3 + max_parts) byte, ukuran tetap):
+        amount, timestamp (mikrodetik sejak 1970-01-01), num_parts,
+        parts[max_parts] (slot yang tidak dipakai berisi 0)
+
+BinaryLogWriter hanya menambah record di akhir file. Record terakhir yang
+terpotong (misalnya proses mati di tengah write) dibuang saat file dibuka
+lagi untuk ditulis. BinaryLogReader membaca file lewat mmap: akses acak per
+indeks, scan penuh dengan struct.iter_unpack langsung di atas mapping, dan
+kolom amounts/timestamps sebagai memoryview ber-stride tanpa salinan.
+
+Contoh:
+    with BinaryLogWriter("audit.splitlog") as log:
+        log.extend(splitter.split_many(amounts))
+
+    with BinaryLogReader("audit.splitlog") as log:
+        result = log[123_456]
+        total = sum(log.amounts)
+        for result in log:          # SplitResult dibuat satu per satu
+            ...
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from .models import SplitResult, _TimestampMemo
+
+MAGIC = b"MSPLTLOG"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+
+# Jumlah bagian maksimal yang didukung MoneySplitter
+DEFAULT_MAX_PARTS = 6
+
+# Field sebelum parts di setiap record: amount, timestamp, num_parts
+_FIXED_FIELDS = 3
+
+
+def _record_struct(max_parts: int) -> struct.Struct:
+    return struct.Struct(f"<{_FIXED_FIELDS + max_parts}q")
+
+
+def _read_header(header: bytes, path) -> int:
+    """Validasi header dan kembalikan max_parts"""
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} bukan log biner split (header terpotong)")
+    magic, version, max_parts = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} bukan log biner split")
+    if version != VERSION:
+        raise ValueError(f"Versi log biner tidak didukung: {version}")
+    if max_parts < 1:
+        raise ValueError(f"max_parts di header {path} tidak valid")
+    return max_parts
+
+
+class BinaryLogWriter:
+    """Penulis log biner append-only dengan record berukuran tetap"""
+
+    def __init__(self, path: Union[str, Path], max_parts: int = DEFAULT_MAX_PARTS):
+        """
+        Args:
+            path: File log; dibuat jika belum ada, ditambah jika sudah ada
+            max_parts: Jumlah slot bagian per record untuk file baru (file
+                yang sudah ada memakai nilai di header-nya)
+
+        Raises:
+            ValueError: Jika file yang ada bukan log biner split
+        """
+        if max_parts < 1:
+            raise ValueError("max_parts harus minimal 1")
+        self.path = str(path)
+        self._file = open(self.path, "a+b")
+        try:
+            size = self._file.seek(0, os.SEEK_END)
+            if size == 0:
+                self._file.write(HEADER.pack(MAGIC, VERSION, max_parts))
+            else:
+                self._file.seek(0)
+                max_parts = _read_header(self._file.read(HEADER.size), self.path)
+            self.max_parts = max_parts
+            self._record = _record_struct(max_parts)
+            records, partial = divmod(max(size - HEADER.size, 0), self._record.size)
+            if partial:
+                # Sisa write yang terputus: buang agar record tetap sejajar
+                self._file.truncate(HEADER.size + records * self._record.size)
+            self.count = records
+        except BaseException:
+            self._file.close()
+            raise
+        self._padding = {n: (0,) * (max_parts - n) for n in range(max_parts + 1)}
+        self._timestamps = _TimestampMemo()
+
+    def __enter__(self) -> "BinaryLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def append(self, result: SplitResult) -> int:
+        """
+        Tambahkan satu hasil
+
+        Returns:
+            int: Indeks record yang baru ditulis
+        """
+        self.extend((result,))
+        return self.count - 1
+
+    def extend(self, results: Iterable[SplitResult]) -> int:
+        """
+        Tambahkan banyak hasil dengan satu write
+
+        Returns:
+            int: Jumlah record yang ditulis
+
+        Raises:
+            ValueError: Jika hasil punya lebih dari max_parts bagian atau
+                nilainya tidak muat di int64 (tidak ada record yang ditulis)
+        """
+        pack = self._record.pack
+        padding = self._padding
+        chunks = []
+        for result in results:
+            splits = result.splits
+            if len(splits) > self.max_parts:
+                raise ValueError(f"Hasil dengan {len(splits)} bagian melebihi max_parts "
+                                 f"{self.max_parts}")
+            try:
+                chunks.append(pack(result.original_amount, self._timestamps.to_us(result.timestamp),
+                                   len(splits), *splits, *padding[len(splits)]))
+            except struct.error as e:
+                raise ValueError(f"Hasil tidak bisa ditulis ke log biner: {e}") from None
+        self._file.write(b"".join(chunks))
+        self.count += len(chunks)
+        return len(chunks)
+
+    def flush(self, fsync: bool = False) -> None:
+        """Flush buffer ke OS, dan ke disk jika fsync=True"""
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush lalu tutup file"""
+        if not self._file.closed:
+            self._file.close()
+
+
+class BinaryLogReader:
+    """Pembaca log biner lewat mmap (read-only, zero-copy)"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Record dihitung saat file dibuka; record yang ditambahkan setelahnya
+        tidak terlihat sampai reader dibuka ulang. Record terakhir yang
+        terpotong diabaikan.
+
+        Args:
+            path: File log
+
+        Raises:
+            ValueError: Jika file bukan log biner split
+        """
+        self.path = str(path)
+        with open(self.path, "rb") as file:
+            self.max_parts = _read_header(file.read(HEADER.size), self.path)
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._record = _record_struct(self.max_parts)
+        self._stride = _FIXED_FIELDS + self.max_parts
+        self.count = (len(self._mmap) - HEADER.size) // self._record.size
+        end = HEADER.size + self.count * self._record.size
+        self._bytes = memoryview(self._mmap)[HEADER.size:end]
+        self._values = self._bytes.cast("q")
+        self._timestamps = _TimestampMemo()
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Lepas mapping
+
+        Raises:
+            BufferError: Jika view kolom (amounts/timestamps) masih dipegang
+        """
+        if self._mmap.closed:
+            return
+        self._values.release()
+        self._bytes.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> SplitResult:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Indeks log biner di luar jangkauan")
+        return self._result(self._record.unpack_from(self._bytes, index * self._record.size))
+
+    def __iter__(self) -> Iterator[SplitResult]:
+        result = self._result
+        for values in self._record.iter_unpack(self._bytes):
+            yield result(values)
+
+    def records(self) -> Iterator[Tuple[int, int, List[int]]]:
+        """
+        Scan cepat tanpa membuat SplitResult
+
+        Yields:
+            Tuple[int, int, List[int]]: (amount, timestamp mikrodetik, splits)
+        """
+        fixed = _FIXED_FIELDS
+        for values in self._record.iter_unpack(self._bytes):
+            yield values[0], values[1], list(values[fixed:fixed + values[2]])
+
+    @property
+    def amounts(self) -> memoryview:
+        """Kolom amount sebagai memoryview int64 ber-stride (tanpa salinan)"""
+        return self._values[0::self._stride]
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Kolom timestamp (mikrodetik sejak epoch) sebagai memoryview ber-stride"""
+        return self._values[1::self._stride]
+
+    def _result(self, values: tuple) -> SplitResult:
+        amount, timestamp_us, num_parts = values[0], values[1], values[2]
+        return SplitResult(original_amount=amount,
+                           splits=list(values[_FIXED_FIELDS:_FIXED_FIELDS + num_parts]),
+                           num_parts=num_parts, timestamp=self._timestamps.from_us(timestamp_us))
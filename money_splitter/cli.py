@@ -0,0 +1,556 @@
+"""
+Command line interface headless untuk Money Splitter
+
+Subcommand ``split`` membaca amount per baris dari stdin atau file dan menulis
+satu baris JSON (JSONL) atau CSV per SplitResult. Input diproses per chunk
+dengan MoneySplitter.split_many dan output di-flush setiap chunk, sehingga
+memori tetap terbatas berapa pun panjang input.
+
+Dengan ``--seed`` hasil bisa direproduksi, dan dengan ``--checkpoint`` posisi
+input/output serta state RNG disimpan di setiap batas chunk sehingga batch
+panjang yang crash bisa dilanjutkan dengan perintah yang sama dan menghasilkan
+output identik byte per byte.
+
+Contoh:
+    money-splitter split amounts.txt > splits.jsonl
+    cat amounts.txt | python -m money_splitter split --parts 5 --format csv
+    money-splitter split amounts.txt -o splits.jsonl --seed 42 --checkpoint job.ckpt
+    money-splitter serve --port 8000
+    money-splitter daemon --socket /run/money-splitter.sock
+    money-splitter daemon bench --clients 1 4 --depth 1 16 256
+"""
+
+import argparse
+import csv
+import os
+import sys
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .checkpoint import Checkpoint, CheckpointMismatch
+from .models import SplitResult
+from .splitter import ENGINES, STRATEGIES, MoneySplitter
+from .utils import CurrencyFormatter, ValidationUtils
+
+if TYPE_CHECKING:
+    from .history import HistoryStore
+
+FORMATS = ("jsonl", "csv")
+
+# Jumlah bagian maksimal, menentukan jumlah kolom split_N pada output CSV
+MAX_PARTS = 6
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class InputError(ValueError):
+    """Dilempar jika satu baris input tidak bisa dibagi"""
+
+
+def read_amounts(lines: Iterable[str], skip_invalid: bool = False,
+                 errors: TextIO = None, first_line: int = 1) -> Iterator[int]:
+    """
+    Parse amount dari setiap baris input secara lazy
+
+    Baris kosong dilewati. Format yang diterima sama seperti input GUI
+    (CurrencyFormatter.parse_input), misalnya "1500000", "1.500.000" atau
+    "Rp 1.500.000".
+
+    Args:
+        lines: Iterable baris teks
+        skip_invalid: Jika True, baris tidak valid dilaporkan ke errors lalu
+            dilewati; jika False dilempar InputError
+        errors: Stream untuk laporan baris yang dilewati (default stderr)
+        first_line: Nomor baris pertama dari lines, untuk pesan error saat
+            resume dari checkpoint
+
+    Yields:
+        int: Amount yang valid (>= 10.000)
+
+    Raises:
+        InputError: Jika ada baris tidak valid dan skip_invalid False
+    """
+    errors = errors or sys.stderr
+    for line_number, line in enumerate(lines, first_line):
+        text = line.strip()
+        if not text:
+            continue
+        amount = CurrencyFormatter.parse_input(text)
+        if amount is None:
+            message = ValidationUtils.get_error_message("invalid_format")
+        elif not ValidationUtils.is_valid_amount(amount):
+            message = ValidationUtils.get_error_message(
+                "negative_or_zero" if amount <= 0 else "too_small")
+        else:
+            yield amount
+            continue
+
+        if not skip_invalid:
+            raise InputError(f"Baris {line_number}: {text!r} - {message}")
+        errors.write(f"Baris {line_number} dilewati: {text!r} - {message}\n")
+
+
+def chunked(amounts: Iterable[int], size: int) -> Iterator[List[int]]:
+    """Kelompokkan iterable menjadi list berukuran maksimal size"""
+    iterator = iter(amounts)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class JsonlWriter:
+    """Tulis SplitResult sebagai satu objek JSON per baris"""
+
+    def __init__(self, stream: TextIO, timestamp: bool = False):
+        self.stream = stream
+        self.timestamp = timestamp
+
+    def write_header(self) -> None:
+        """JSONL tidak memiliki header"""
+
+    def write(self, results: List[SplitResult]) -> None:
+        """Tulis satu chunk hasil"""
+        self.stream.writelines([result.to_json(self.timestamp) + "\n" for result in results])
+
+
+class CsvWriter:
+    """Tulis SplitResult sebagai baris CSV dengan kolom split_1..split_6"""
+
+    def __init__(self, stream: TextIO, timestamp: bool = False):
+        self.writer = csv.writer(stream, lineterminator="\n")
+        self.timestamp = timestamp
+
+    def write_header(self) -> None:
+        """Tulis baris header kolom"""
+        header = ["amount", "num_parts"] + [f"split_{i}" for i in range(1, MAX_PARTS + 1)]
+        if self.timestamp:
+            header.append("timestamp")
+        self.writer.writerow(header)
+
+    def write(self, results: List[SplitResult]) -> None:
+        """Tulis satu chunk hasil, kolom split yang tidak terpakai dikosongkan"""
+        rows = []
+        for r in results:
+            row = [r.original_amount, r.num_parts] + r.splits + [""] * (MAX_PARTS - len(r.splits))
+            if self.timestamp:
+                row.append(r.timestamp.isoformat())
+            rows.append(row)
+        self.writer.writerows(rows)
+
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter}
+
+
+class LineCounter:
+    """Iterator baris yang mencatat jumlah baris yang sudah dibaca"""
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self.count = 0
+
+    def __iter__(self) -> "LineCounter":
+        return self
+
+    def __next__(self) -> str:
+        line = next(self._lines)
+        self.count += 1
+        return line
+
+    def skip(self, count: int) -> int:
+        """Lewati count baris, kembalikan jumlah yang benar-benar dilewati"""
+        return sum(1 for _ in islice(self, count))
+
+
+def stream_splits(lines: Iterable[str], output: TextIO, splitter: MoneySplitter,
+                  num_parts: int = None, output_format: str = "jsonl",
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, engine: str = "python",
+                  timestamp: bool = False, skip_invalid: bool = False,
+                  errors: TextIO = None, header: bool = True, first_line: int = 1,
+                  on_chunk: Callable[[int], None] = None, history: "HistoryStore" = None,
+                  history_source: str = "cli", first_seq: int = None) -> int:
+    """
+    Bagi setiap amount dari lines dan tulis hasilnya ke output per chunk
+
+    Args:
+        lines: Iterable baris input (file, stdin, list)
+        output: Stream output teks
+        splitter: MoneySplitter yang dipakai
+        num_parts: Jumlah bagian (2-6), None untuk acak 5 atau 6 per amount
+        output_format: "jsonl" atau "csv"
+        chunk_size: Jumlah amount per panggilan split_many dan per flush
+        engine: Engine split_many ("python" atau "numpy")
+        timestamp: Sertakan timestamp pembagian di setiap baris output
+        skip_invalid: Lewati baris tidak valid alih-alih berhenti
+        errors: Stream untuk laporan baris yang dilewati
+        header: Tulis header (CSV); False saat melanjutkan output yang ada
+        first_line: Nomor baris pertama dari lines (untuk pesan error)
+        on_chunk: Callback opsional setelah setiap chunk ditulis dan di-flush,
+            menerima jumlah SplitResult yang sudah ditulis sejauh ini
+        history: HistoryStore opsional; setiap chunk dicatat dan di-commit
+            setelah ditulis ke output, sebelum on_chunk
+        history_source: Label source baris riwayat
+        first_seq: Nomor urut riwayat untuk hasil pertama (None: tanpa seq)
+
+    Returns:
+        int: Jumlah SplitResult yang ditulis
+    """
+    writer = WRITERS[output_format](output, timestamp=timestamp)
+    if header:
+        writer.write_header()
+    written = 0
+    amounts = read_amounts(lines, skip_invalid, errors, first_line)
+    for chunk in chunked(amounts, chunk_size):
+        results = splitter.split_many(chunk, num_parts, engine=engine)
+        # Riwayat divalidasi (di-buffer) sebelum output ditulis, di-commit sesudahnya
+        if history is not None:
+            seq = None if first_seq is None else first_seq + written
+            _record_history(history.add_many, results, history_source, seq)
+        writer.write(results)
+        output.flush()
+        if history is not None:
+            _record_history(history.flush)
+        written += len(results)
+        if on_chunk is not None:
+            on_chunk(written)
+    output.flush()
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Susun argparse parser untuk semua subcommand"""
+    parser = argparse.ArgumentParser(
+        prog="money-splitter",
+        description="Money Splitter - bagi uang secara natural (tanpa argumen: buka GUI)",
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    split = subcommands.add_parser(
+        "split", help="bagi amount dari stdin/file dan tulis JSONL atau CSV")
+    split.add_argument("input", nargs="?", default="-",
+                       help="file berisi satu amount per baris (default: stdin)")
+    split.add_argument("-o", "--output", default="-", help="file output (default: stdout)")
+    split.add_argument("-f", "--format", choices=FORMATS, default="jsonl", dest="output_format")
+    split.add_argument("-p", "--parts", type=int, choices=range(2, MAX_PARTS + 1),
+                       metavar="{2..6}", help="jumlah bagian (default: acak 5 atau 6)")
+    split.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                       help="amount per batch dan per flush output")
+    split.add_argument("--strategy", choices=STRATEGIES, default="repair")
+    split.add_argument("--engine", choices=ENGINES, default="python")
+    split.add_argument("--timestamp", action="store_true",
+                       help="sertakan timestamp pembagian di setiap baris")
+    split.add_argument("--skip-invalid", action="store_true",
+                       help="lewati baris tidak valid (dilaporkan ke stderr)")
+    split.add_argument("--seed", type=int, help="seed RNG agar hasil bisa direproduksi")
+    split.add_argument("--checkpoint", metavar="FILE",
+                       help="simpan checkpoint per chunk dan lanjutkan dari FILE jika ada "
+                            "(butuh --output ke file)")
+    split.add_argument("--history", metavar="DB",
+                       help="catat setiap hasil ke database riwayat SQLite")
+    split.set_defaults(handler=_cmd_split)
+
+    history = subcommands.add_parser(
+        "history", help="tampilkan riwayat pembagian (JSONL, terbaru dulu)")
+    history.add_argument("database", help="file database riwayat")
+    history.add_argument("--limit", type=_positive_int, default=50)
+    history.add_argument("--cursor", help="next_cursor dari halaman sebelumnya")
+    history.add_argument("--since", type=datetime.fromisoformat, help="timestamp ISO minimal")
+    history.add_argument("--until", type=datetime.fromisoformat, help="timestamp ISO batas atas")
+    history.add_argument("--min-amount", type=int)
+    history.add_argument("--max-amount", type=int)
+    history.add_argument("--source", help="hanya baris dengan label source ini")
+    history.set_defaults(handler=_cmd_history)
+
+    serve = subcommands.add_parser(
+        "serve", help="jalankan server HTTP lokal (POST /split, POST /split/batch)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--strategy", choices=STRATEGIES, default="repair")
+    serve.add_argument("--seed", type=int, help="seed RNG agar hasil bisa direproduksi")
+    serve.add_argument("--batch-window-ms", type=float, default=0.0,
+                       help="tunggu request tambahan per batch (default: 0, tanpa delay)")
+    serve.add_argument("--max-batch", type=_positive_int, default=256,
+                       help="jumlah request maksimal per batch")
+    serve.set_defaults(handler=_cmd_serve)
+
+    daemon = subcommands.add_parser(
+        "daemon", help="jalankan daemon Unix socket dengan protokol biner")
+    daemon.add_argument("--socket", help="path Unix socket (default: "
+                        "$XDG_RUNTIME_DIR/money-splitter.sock atau direktori 0700 per user)")
+    daemon.add_argument("--strategy", choices=STRATEGIES, default="repair")
+    daemon.add_argument("--seed", type=int, help="seed RNG untuk request tanpa seed")
+    daemon.set_defaults(handler=_cmd_daemon)
+
+    daemon_commands = daemon.add_subparsers(dest="daemon_command")
+    bench = daemon_commands.add_parser(
+        "bench", help="ukur throughput dan latency p99 daemon per kedalaman pipeline")
+    bench.add_argument("--socket", help="daemon yang sudah berjalan (default: jalankan sendiri)")
+    bench.add_argument("--requests", type=_positive_int, default=20_000,
+                       help="jumlah request per konfigurasi")
+    bench.add_argument("--clients", type=_positive_int, nargs="+", default=[1, 4])
+    bench.add_argument("--depth", type=_positive_int, nargs="+", default=[1, 16, 256])
+    bench.add_argument("--spawn", type=int, default=5,
+                       help="jumlah spawn untuk pembanding per-panggilan (0: lewati)")
+    bench.add_argument("--seed", type=int, default=1234)
+    bench.set_defaults(handler=_cmd_daemon_bench)
+    return parser
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("harus minimal 1")
+    return number
+
+
+def _open_streams(args) -> Tuple[TextIO, TextIO]:
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    return source, target
+
+
+def _open_history(path: Optional[str]) -> Optional["HistoryStore"]:
+    if not path:
+        return None
+    import sqlite3
+
+    from .history import HistoryStore
+    try:
+        return HistoryStore(path)
+    except sqlite3.Error as e:
+        raise InputError(f"Database riwayat tidak bisa dibuka: {e}") from None
+
+
+def _record_history(method: Callable[..., None], *args) -> None:
+    """Panggil method HistoryStore; amount terlalu besar atau error SQLite jadi InputError"""
+    import sqlite3
+    try:
+        method(*args)
+    except (ValueError, sqlite3.Error) as e:
+        raise InputError(f"Riwayat tidak bisa dicatat: {e}") from None
+
+
+def _cmd_split(args) -> int:
+    splitter = MoneySplitter(strategy=args.strategy, seed=args.seed)
+    if args.checkpoint:
+        return _split_with_checkpoint(args, splitter)
+    history = _open_history(args.history)
+    source, target = _open_streams(args)
+    try:
+        stream_splits(
+            source, target, splitter,
+            num_parts=args.parts,
+            output_format=args.output_format,
+            chunk_size=args.chunk_size,
+            engine=args.engine,
+            timestamp=args.timestamp,
+            skip_invalid=args.skip_invalid,
+            history=history,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        if history is not None:
+            history.close()
+    return 0
+
+
+def _split_with_checkpoint(args, splitter: MoneySplitter) -> int:
+    """
+    Jalankan split dengan checkpoint per chunk, lanjutkan jika checkpoint ada
+
+    Urutan per chunk: tulis output, commit riwayat, flush + fsync, lalu
+    simpan checkpoint secara atomik. Checkpoint tidak pernah mendahului data
+    di disk, dan output yang tertulis setelah checkpoint terakhir dipotong
+    saat resume. Riwayat dicatat dengan source "cli:<job>" dan seq = nomor
+    record, sehingga chunk yang diulang saat resume tidak tercatat dua kali.
+    """
+    import uuid
+
+    if args.output == "-":
+        raise InputError("--checkpoint membutuhkan --output ke file")
+    checkpoint_path = Path(args.checkpoint)
+    options = {
+        "input": args.input, "output": args.output, "parts": args.parts,
+        "format": args.output_format, "chunk_size": args.chunk_size,
+        "strategy": args.strategy, "engine": args.engine, "seed": args.seed,
+        "timestamp": args.timestamp, "skip_invalid": args.skip_invalid,
+        "history": args.history,
+    }
+
+    resume = Checkpoint.load(checkpoint_path) if checkpoint_path.exists() else None
+    # Id job tetap sama saat resume, baru untuk setiap batch baru
+    options["job"] = resume.options.get("job") if resume else uuid.uuid4().hex
+    if resume is not None:
+        try:
+            resume.check_options(options)
+        except CheckpointMismatch as e:
+            raise InputError(str(e)) from None
+        splitter.set_rng_state(resume.rng_state)
+        os.truncate(args.output, resume.output_bytes)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    lines = LineCounter(source)
+    target = open(args.output, "a" if resume else "w", encoding="utf-8", newline="")
+    written_before = resume.records_written if resume else 0
+    if resume and lines.skip(resume.lines_read) < resume.lines_read:
+        raise InputError("Input lebih pendek dari posisi checkpoint")
+
+    def save_checkpoint(written: int) -> None:
+        os.fsync(target.fileno())
+        Checkpoint(
+            lines_read=lines.count,
+            records_written=written_before + written,
+            output_bytes=target.tell(),
+            rng_state=list(splitter.get_rng_state()),
+            options=options,
+        ).save(checkpoint_path)
+
+    history = _open_history(args.history)
+    try:
+        stream_splits(
+            lines, target, splitter,
+            num_parts=args.parts,
+            output_format=args.output_format,
+            chunk_size=args.chunk_size,
+            engine=args.engine,
+            timestamp=args.timestamp,
+            skip_invalid=args.skip_invalid,
+            header=resume is None,
+            first_line=lines.count + 1,
+            on_chunk=save_checkpoint,
+            history=history,
+            history_source=f"cli:{options['job']}",
+            first_seq=written_before,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        target.close()
+        if history is not None:
+            history.close()
+    # Batch selesai, checkpoint tidak dibutuhkan lagi
+    checkpoint_path.unlink(missing_ok=True)
+    return 0
+
+
+def _cmd_history(args) -> int:
+    import json
+
+    if not Path(args.database).exists():
+        raise InputError(f"Database riwayat tidak ditemukan: {args.database}")
+    history = _open_history(args.database)
+    try:
+        page = history.query(
+            limit=args.limit, cursor=args.cursor, since=args.since, until=args.until,
+            min_amount=args.min_amount, max_amount=args.max_amount, source=args.source,
+        )
+    except ValueError as e:
+        raise InputError(str(e)) from None
+    finally:
+        history.close()
+    for entry in page.entries:
+        result = entry.result
+        sys.stdout.write(json.dumps({
+            "id": entry.id, "amount": result.original_amount, "num_parts": result.num_parts,
+            "splits": result.splits, "timestamp": result.timestamp.isoformat(),
+            "source": entry.source,
+        }, separators=(",", ":")) + "\n")
+    if page.next_cursor:
+        print(f"next_cursor: {page.next_cursor}", file=sys.stderr)
+    return 0
+
+
+def _cmd_serve(args) -> int:
+    # Di-import di sini agar subcommand split tidak ikut memuat asyncio
+    import asyncio
+
+    from .server import SplitServer, serve
+
+    server = SplitServer(
+        host=args.host, port=args.port,
+        splitter=MoneySplitter(strategy=args.strategy, seed=args.seed),
+        batch_window=args.batch_window_ms / 1000,
+        max_batch=args.max_batch,
+    )
+
+    def ready(server: SplitServer) -> None:
+        print(f"Melayani di http://{server.host}:{server.port} (Ctrl+C untuk berhenti)",
+              file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(serve(server, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_daemon(args) -> int:
+    import asyncio
+
+    from .daemon import SplitDaemon
+    from .server import serve
+
+    daemon = SplitDaemon(args.socket, strategy=args.strategy, seed=args.seed)
+
+    def ready(daemon: SplitDaemon) -> None:
+        print(f"Daemon mendengarkan di {daemon.path} (Ctrl+C untuk berhenti)",
+              file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(serve(daemon, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_daemon_bench(args) -> int:
+    from .loadgen import benchmark, spawn_cost
+
+    header = False
+    for path, clients, depth, stats in benchmark(args.socket, args.requests,
+                                                 args.clients, args.depth, args.seed):
+        if not header:
+            print(f"{args.requests:,} request per konfigurasi, daemon di {path}\n")
+            print(f"{'klien':>6} {'depth':>6} {'req/s':>10} {'p50 ms':>8} "
+                  f"{'p99 ms':>8} {'p99.9 ms':>9}")
+            header = True
+        print(f"{clients:>6} {depth:>6} {stats['rps']:>10,.0f} {stats['p50']:>8.3f} "
+              f"{stats['p99']:>8.3f} {stats['p999']:>9.3f}", flush=True)
+
+    if args.spawn > 0:
+        cost = spawn_cost(args.spawn)
+        print(f"\nPembanding spawn per panggilan: {cost:.1f} ms/split "
+              f"({1000 / cost:,.0f} split/s)")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point CLI
+
+    Args:
+        argv: Argumen tanpa nama program (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (0 sukses, 1 input tidak valid, 2 argumen salah)
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except InputError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Pembaca output berhenti lebih awal (misalnya "| head"); arahkan
+        # stdout ke devnull agar flush saat interpreter keluar tidak error
+        sys.stdout = open(os.devnull, "w")
+        return 0
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
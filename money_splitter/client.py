@@ -0,0 +1,194 @@
+"""
+Client untuk daemon split (money_splitter.daemon)
+
+Client hanya memakai socket, struct dan models, sehingga import-nya ringan
+dan tidak memuat MoneySplitter maupun asyncio. split_many mengirim request
+secara pipelined (banyak frame sebelum membaca response) per jendela
+``window`` request, sehingga biaya round-trip dibayar sekali per jendela.
+Response dibaca selama jendela masih dikirim, sehingga jendela sebesar apa
+pun tidak macet saat buffer socket penuh.
+
+Contoh:
+    with DaemonClient() as client:
+        result = client.split(1_500_000, 5)
+        results = client.split_many(amounts, seeds=ledger_ids)
+"""
+
+import select
+import socket
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, List
+
+from .models import SplitResult
+from .protocol import (
+    LENGTH, MAX_FRAME_SIZE, STATUS_INVALID, STATUS_OK, ProtocolError, decode_response,
+    default_socket_path, encode_request,
+)
+
+DEFAULT_WINDOW = 1024
+
+# Ukuran maksimal satu recv/send
+CHUNK_SIZE = 65536
+
+
+class DaemonError(RuntimeError):
+    """Daemon menolak request karena alasan selain input tidak valid"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class DaemonClient:
+    """Koneksi blocking ke daemon split; satu instance per thread"""
+
+    def __init__(self, path: str = None, timeout: float = None):
+        """
+        Args:
+            path: Path Unix socket daemon (default: protocol.default_socket_path())
+            timeout: Timeout per operasi socket dalam detik (None: tanpa batas)
+
+        Raises:
+            OSError: Jika daemon tidak bisa dihubungi
+        """
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self.path)
+        except OSError:
+            self._sock.close()
+            raise
+        # Non-blocking setelah terhubung: _exchange menunggu lewat select
+        self._sock.setblocking(False)
+        self.timeout = timeout
+        self._buffer = bytearray()
+        self._next_id = 0
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Tutup koneksi"""
+        self._sock.close()
+
+    def split(self, amount: int, num_parts: int = None, seed: int = None) -> SplitResult:
+        """
+        Bagi satu amount di daemon
+
+        Args:
+            amount: Jumlah uang yang akan dibagi
+            num_parts: Jumlah bagian (2-6), None untuk acak 5 atau 6
+            seed: Seed opsional; seed yang sama selalu menghasilkan pembagian
+                yang sama untuk amount dan num_parts yang sama
+
+        Returns:
+            SplitResult: Hasil pembagian
+
+        Raises:
+            ValueError: Jika amount atau num_parts tidak valid
+            DaemonError: Jika daemon gagal membagi (misalnya budget terlampaui)
+        """
+        return self.split_many([amount], num_parts, None if seed is None else [seed])[0]
+
+    def split_many(self, amounts: Iterable[int], num_parts: int = None,
+                   seeds: Iterable[int] = None, window: int = DEFAULT_WINDOW) -> List[SplitResult]:
+        """
+        Bagi banyak amount dengan request yang di-pipeline
+
+        Args:
+            amounts: Daftar jumlah uang
+            num_parts: Jumlah bagian untuk semua amount, None untuk acak
+            seeds: Seed per amount (panjang sama dengan amounts), opsional
+            window: Jumlah request maksimal yang dikirim sebelum membaca response
+
+        Returns:
+            List[SplitResult]: Hasil dengan urutan yang sama seperti input
+
+        Raises:
+            ValueError: Jika ada amount atau num_parts yang tidak valid
+            DaemonError: Jika daemon gagal membagi salah satu amount
+        """
+        amounts = list(amounts)
+        seeds = [None] * len(amounts) if seeds is None else list(seeds)
+        if len(seeds) != len(amounts):
+            raise ValueError("Jumlah seeds harus sama dengan jumlah amounts")
+        requests = iter(zip(amounts, seeds))
+        timestamp = datetime.now()
+        results = []
+        error = None
+        while True:
+            batch = list(islice(requests, window))
+            if not batch:
+                break
+            first_id = self._next_id
+            frames = []
+            for i, (amount, seed) in enumerate(batch):
+                frames.append(encode_request((first_id + i) & 0xFFFFFFFF, amount, num_parts, seed))
+            self._next_id = (first_id + len(batch)) & 0xFFFFFFFF
+            # Semua response jendela ini dibaca dulu agar stream tetap sinkron
+            responses = self._exchange(b"".join(frames), len(batch))
+            for i, (amount, _) in enumerate(batch):
+                request_id, status, body = decode_response(responses[i])
+                if request_id != (first_id + i) & 0xFFFFFFFF:
+                    raise ProtocolError(f"Response untuk request {request_id} tidak urut")
+                if status == STATUS_OK:
+                    results.append(SplitResult(original_amount=amount, splits=body,
+                                               num_parts=len(body), timestamp=timestamp))
+                elif error is None:
+                    error = ValueError(body) if status == STATUS_INVALID else DaemonError(status, body)
+            if error is not None:
+                raise error
+        return results
+
+    def _exchange(self, payload: bytes, count: int) -> List[bytes]:
+        """
+        Kirim payload sambil membaca response sampai count frame diterima
+
+        Daemon berhenti membaca request selama buffer tulisnya penuh, jadi
+        mengirim seluruh jendela dulu baru membaca bisa membuat kedua sisi
+        saling menunggu. Response yang sudah tiba dibaca di sela pengiriman.
+
+        Raises:
+            socket.timeout: Jika daemon tidak merespons dalam timeout
+            ConnectionError: Jika koneksi ditutup daemon
+            ProtocolError: Jika frame response terlalu besar
+        """
+        pending = memoryview(payload)
+        buffer = self._buffer
+        frames = []
+        while pending or len(frames) < count:
+            readable, writable, _ = select.select(
+                [self._sock], [self._sock] if pending else [], [], self.timeout)
+            if not readable and not writable:
+                raise socket.timeout("Daemon tidak merespons")
+            if writable:
+                try:
+                    pending = pending[self._sock.send(pending[:CHUNK_SIZE]):]
+                except BlockingIOError:
+                    pass
+            if not readable:
+                continue
+            try:
+                chunk = self._sock.recv(CHUNK_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                raise ConnectionError("Koneksi ditutup oleh daemon")
+            buffer += chunk
+            offset = 0
+            while len(frames) < count and len(buffer) - offset >= LENGTH.size:
+                (length,) = LENGTH.unpack_from(buffer, offset)
+                if length > MAX_FRAME_SIZE:
+                    raise ProtocolError("Frame response terlalu besar")
+                end = offset + LENGTH.size + length
+                if len(buffer) < end:
+                    break
+                frames.append(bytes(buffer[offset + LENGTH.size:end]))
+                offset = end
+            del buffer[:offset]
+        return frames
@@ -0,0 +1,177 @@
+"""
+Daemon Unix domain socket dengan protokol biner (money_splitter.protocol)
+
+Daemon menyimpan MoneySplitter yang sudah "hangat" sehingga worker di host
+yang sama tidak membayar biaya spawn Python atau import per panggilan.
+Setiap koneksi diproses dengan asyncio.Protocol: semua frame lengkap yang
+tiba dalam satu read dibagi berurutan dan response-nya dikirim dalam satu
+write, sehingga klien yang mem-pipeline banyak request per koneksi hanya
+membayar satu round-trip per batch. Jika klien lambat membaca, pembacaan
+dari koneksi tersebut dijeda sampai buffer tulis kosong kembali.
+
+Request dengan seed dibagi memakai MoneySplitter terpisah yang di-seed ulang
+per request, sehingga hasilnya hanya bergantung pada (amount, num_parts,
+seed) dan tidak memengaruhi RNG request tanpa seed.
+
+Contoh:
+    money-splitter daemon --socket /run/money-splitter.sock
+
+    from money_splitter.client import DaemonClient
+    with DaemonClient("/run/money-splitter.sock") as client:
+        result = client.split(1_500_000, 5, seed=42)
+"""
+
+import asyncio
+import os
+import socket
+import stat
+from typing import Optional, Set
+
+from .protocol import (
+    LENGTH, MAX_FRAME_SIZE, STATUS_BAD_REQUEST, STATUS_BUDGET_EXCEEDED, STATUS_INVALID,
+    ProtocolError, decode_request, default_socket_path, encode_error, encode_response,
+)
+from .splitter import MoneySplitter, SplitBudgetExceeded
+
+
+class _DaemonProtocol(asyncio.Protocol):
+    """Satu koneksi klien: parse frame, bagi, tulis response sesuai urutan"""
+
+    def __init__(self, daemon: "SplitDaemon"):
+        self.daemon = daemon
+        self.transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.daemon._connections.add(self)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.daemon._connections.discard(self)
+
+    def pause_writing(self) -> None:
+        # Klien tidak membaca response: berhenti menerima request baru
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self.transport.resume_reading()
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        responses = []
+        offset = 0
+        while len(buffer) - offset >= LENGTH.size:
+            (length,) = LENGTH.unpack_from(buffer, offset)
+            if length > MAX_FRAME_SIZE:
+                responses.append(encode_error(0, STATUS_BAD_REQUEST, "Frame terlalu besar"))
+                self.transport.write(b"".join(responses))
+                self.transport.close()
+                return
+            end = offset + LENGTH.size + length
+            if len(buffer) < end:
+                break
+            responses.append(self.daemon.handle(bytes(buffer[offset + LENGTH.size:end])))
+            offset = end
+        del buffer[:offset]
+        if responses:
+            self.transport.write(b"".join(responses))
+
+
+class SplitDaemon:
+    """Daemon split di Unix domain socket dengan MoneySplitter yang tetap hangat"""
+
+    def __init__(self, path: str = None, strategy: str = "repair", seed: int = None,
+                 max_iterations: int = None, time_budget: float = None):
+        """
+        Args:
+            path: Path Unix socket (default: protocol.default_socket_path())
+            strategy: Strategi MoneySplitter
+            seed: Seed opsional untuk RNG request tanpa seed
+            max_iterations: Batas iterasi per pembagian (lihat MoneySplitter)
+            time_budget: Batas waktu per pembagian dalam detik
+        """
+        self.path = path or default_socket_path()
+        kwargs = {"strategy": strategy, "max_iterations": max_iterations,
+                  "time_budget": time_budget}
+        self.splitter = MoneySplitter(seed=seed, **kwargs)
+        # Di-seed ulang per request yang membawa seed
+        self._seeded = MoneySplitter(**kwargs)
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[_DaemonProtocol] = set()
+
+    def handle(self, payload: bytes) -> bytes:
+        """Proses satu payload request dan kembalikan frame response"""
+        self.requests += 1
+        try:
+            request_id, amount, num_parts, seed = decode_request(payload)
+        except ProtocolError as e:
+            return encode_error(0, STATUS_BAD_REQUEST, str(e))
+        if seed is None:
+            splitter = self.splitter
+        else:
+            splitter = self._seeded
+            splitter.random.seed(seed)
+        try:
+            result = splitter.split_money(amount, num_parts)
+        except ValueError as e:
+            return encode_error(request_id, STATUS_INVALID, str(e))
+        except SplitBudgetExceeded as e:
+            return encode_error(request_id, STATUS_BUDGET_EXCEEDED, str(e))
+        return encode_response(request_id, result.splits)
+
+    async def start(self) -> None:
+        """
+        Bind socket dan mulai menerima koneksi
+
+        Socket basi dari daemon yang mati dihapus otomatis.
+
+        Raises:
+            OSError: Jika path sudah dipakai daemon lain atau bukan socket
+        """
+        self._remove_stale_socket()
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_unix_server(lambda: _DaemonProtocol(self), self.path)
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Berhenti menerima koneksi, tutup koneksi setelah response terkirim
+
+        Semua frame lengkap sudah dijawab secara sinkron di data_received,
+        jadi menutup transport (yang mem-flush buffer tulis) sudah graceful.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        for connection in list(self._connections):
+            connection.transport.close()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._connections and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+        for connection in list(self._connections):
+            connection.transport.abort()
+        await self._server.wait_closed()
+        self._server = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = os.stat(self.path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise OSError(f"{self.path} sudah ada dan bukan socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except ConnectionRefusedError:
+            os.unlink(self.path)
+            return
+        finally:
+            probe.close()
+        raise OSError(f"Daemon lain sudah berjalan di {self.path}")
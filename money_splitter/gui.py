@@ -2,34 +2,164 @@
 GUI components untuk Money Splitter menggunakan CustomTkinter
 """
 
+import sqlite3
+import sys
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
+from .jobs import (
+    CANCELLED, DONE, GUI_SWITCH_INTERVAL, POLL_INTERVAL_MS, Job, JobRunner, Speculator, split_job,
+)
 from .models import SplitResult
 from .splitter import MoneySplitter
 from .utils import CurrencyFormatter, ValidationUtils
+from .widgets import RESULT_COLUMNS, VirtualTable, format_result_row
+
+if TYPE_CHECKING:
+    from .history import HistoryStore
+
+# Jumlah kartu hasil yang dibuat di awal (jumlah bagian maksimal)
+CARD_POOL_SIZE = 6
+
+
+class ResultCard:
+    """
+    Kartu hasil yang dibuat sekali lalu dikonfigurasi ulang (pool)
+    
+    Widget hanya di-configure jika nilainya berubah, dan kartu yang tidak
+    dipakai disembunyikan dengan grid_remove, bukan di-destroy.
+    """
+    
+    def __init__(self, gui: "MoneySpitterGUI", row: int):
+        fonts = gui.fonts
+        self.row = row
+        self.visible = False
+        self.amount: Optional[int] = None
+        self._index: Optional[int] = None
+        self._percentage: Optional[float] = None
+        
+        self.frame = ctk.CTkFrame(gui.results_scroll, corner_radius=10, fg_color=("gray90", "gray20"))
+        self.frame.grid_columnconfigure(1, weight=1) # Middle expands
+        
+        # Index Bubble
+        self.index_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            width=30,
+            height=30,
+            corner_radius=15,
+            fg_color=("gray80", "gray30"),
+            font=fonts["index"]
+        )
+        self.index_label.grid(row=0, column=0, padx=10, pady=10)
+        
+        # Amount & Percentage
+        info_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info_frame.grid(row=0, column=1, padx=10, sticky="w")
+        
+        self.amount_label = ctk.CTkLabel(info_frame, text="", font=fonts["amount"])
+        self.amount_label.pack(anchor="w")
+        
+        self.percentage_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=fonts["small"],
+            text_color="gray"
+        )
+        self.percentage_label.pack(anchor="w")
+        
+        # Copy Button, selalu menyalin amount yang sedang ditampilkan kartu ini
+        self.copy_button = ctk.CTkButton(
+            self.frame,
+            text="Salin",
+            width=60,
+            height=30,
+            font=fonts["small"],
+            fg_color="transparent",
+            border_width=1,
+            border_color=("gray60", "gray50"),
+            text_color=("gray10", "gray90"),
+            hover_color=("gray80", "gray30"),
+            command=lambda: gui.copy_to_clipboard(self.amount, self.copy_button)
+        )
+        self.copy_button.grid(row=0, column=2, padx=15, pady=10)
+    
+    def show(self, index: int, amount: int, percentage: float):
+        """Tampilkan nilai baru; widget yang nilainya sama tidak disentuh"""
+        if index != self._index:
+            self._index = index
+            self.index_label.configure(text=str(index))
+        if amount != self.amount:
+            self.amount = amount
+            self.amount_label.configure(text=CurrencyFormatter.format_rupiah(amount))
+        if percentage != self._percentage:
+            self._percentage = percentage
+            self.percentage_label.configure(text=f"{percentage:.1f}% dari total")
+        if not self.visible:
+            self.visible = True
+            self.frame.grid(row=self.row, column=0, padx=5, pady=5, sticky="ew")
+    
+    def hide(self):
+        """Sembunyikan kartu tanpa menghancurkan widget"""
+        if self.visible:
+            self.visible = False
+            self.frame.grid_remove()
 
 
 class MoneySpitterGUI:
     """Main GUI class untuk Money Splitter application"""
     
-    def __init__(self):
+    def __init__(self, history: Optional["HistoryStore"] = None, preview: bool = True):
+        """
+        Args:
+            history: HistoryStore opsional untuk mencatat setiap hasil pembagian
+            preview: Hitung pembagian di background selama mengetik agar Enter
+                langsung menampilkan hasil
+        """
         # Setup Theme
         ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
         ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
         
         self.root = ctk.CTk()
         self.splitter = MoneySplitter()
+        self.history = history
+        # Pembagian berjalan di thread worker; hasilnya diambil lewat root.after
+        self.jobs = JobRunner()
+        self.active_job: Optional[Job] = None
+        self.preview_enabled = preview
+        self.preview = Speculator(self.jobs, split_job)
+        self._polling = False
+        self._progress_determinate = False
+        # after_idle id format input yang belum dijalankan (debounce per siklus idle)
+        self._format_pending: Optional[str] = None
         self.selected_parts = ctk.IntVar(value=3)  # Default 3 bagian
         
-        self.result_frames = [] # Keep track of result frames
+        self.result_frames = [] # Frame kartu yang sedang ditampilkan
+        self.card_pool: List[ResultCard] = []
         
         self.setup_ui()
     
+    def create_fonts(self) -> Dict[str, ctk.CTkFont]:
+        """Buat semua font sekali per instance GUI (dipakai bersama oleh widget)"""
+        return {
+            "title": ctk.CTkFont(family="Roboto", size=28, weight="bold"),
+            "subtitle": ctk.CTkFont(family="Roboto", size=14),
+            "label": ctk.CTkFont(size=12, weight="bold"),
+            "entry": ctk.CTkFont(size=16),
+            "button": ctk.CTkFont(size=16, weight="bold"),
+            "header": ctk.CTkFont(size=18, weight="bold"),
+            "total": ctk.CTkFont(size=14, weight="bold"),
+            "small": ctk.CTkFont(size=12),
+            "index": ctk.CTkFont(weight="bold"),
+            "amount": ctk.CTkFont(size=16, weight="bold"),
+        }
+    
     def setup_ui(self):
         """Setup antarmuka pengguna yang modern"""
+        self.fonts = self.create_fonts()
+        
         # Setup main window
         self.root.title("Money Splitter Pro")
         self.root.geometry("700x650") # Slightly larger for better spacing
@@ -49,14 +179,14 @@ class MoneySpitterGUI:
         self.title_label = ctk.CTkLabel(
             self.main_frame, 
             text="Money Splitter", 
-            font=ctk.CTkFont(family="Roboto", size=28, weight="bold")
+            font=self.fonts["title"]
         )
         self.title_label.grid(row=0, column=0, pady=(10, 5))
         
         self.subtitle_label = ctk.CTkLabel(
             self.main_frame,
             text="Bagi uang secara natural dan profesional",
-            font=ctk.CTkFont(family="Roboto", size=14),
+            font=self.fonts["subtitle"],
             text_color="gray"
         )
         self.subtitle_label.grid(row=1, column=0, pady=(0, 20))
@@ -67,27 +197,29 @@ class MoneySpitterGUI:
         self.input_card.grid_columnconfigure(0, weight=1)
         
         # Amount Input
-        self.amount_label = ctk.CTkLabel(self.input_card, text="Jumlah Uang (Rp)", font=ctk.CTkFont(size=12, weight="bold"))
+        self.amount_label = ctk.CTkLabel(self.input_card, text="Jumlah Uang (Rp)", font=self.fonts["label"])
         self.amount_label.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
         
         self.amount_entry = ctk.CTkEntry(
             self.input_card, 
             placeholder_text="Contoh: 1.000.000",
             height=40,
-            font=ctk.CTkFont(size=16)
+            font=self.fonts["entry"]
         )
         self.amount_entry.grid(row=1, column=0, padx=20, pady=(0, 5), sticky="ew")
         self.amount_entry.bind('<KeyRelease>', self.format_currency_input)
+        self.amount_entry.bind('<<Paste>>', self.on_paste)
         self.amount_entry.bind('<Return>', lambda event: self.on_split_button_click())
         
         # Parts Selection
-        self.parts_label = ctk.CTkLabel(self.input_card, text="Jumlah Bagian", font=ctk.CTkFont(size=12, weight="bold"))
+        self.parts_label = ctk.CTkLabel(self.input_card, text="Jumlah Bagian", font=self.fonts["label"])
         self.parts_label.grid(row=2, column=0, padx=20, pady=(15, 5), sticky="w")
         
         self.parts_segmented = ctk.CTkSegmentedButton(
             self.input_card,
             values=["2", "3", "4", "5", "6"],
             variable=self.selected_parts,
+            command=lambda value: self.update_preview(),
             height=35,
             dynamic_resizing=True
         )
@@ -99,7 +231,7 @@ class MoneySpitterGUI:
             text="BAGI UANG SEKARANG",
             command=self.on_split_button_click,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.fonts["button"],
             corner_radius=25
         )
         self.split_button.grid(row=3, column=0, pady=20, padx=10, sticky="ew")
@@ -114,7 +246,7 @@ class MoneySpitterGUI:
         self.results_header = ctk.CTkLabel(
             self.results_container, 
             text="Hasil Pembagian", 
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.fonts["header"]
         )
         self.results_header.grid(row=0, column=0, padx=20, pady=15, sticky="w")
         
@@ -123,6 +255,9 @@ class MoneySpitterGUI:
         self.results_scroll.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
         self.results_scroll.grid_columnconfigure(0, weight=1)
         
+        # Kartu hasil dibuat sekali di awal lalu dipakai ulang
+        self.card_pool = [ResultCard(self, row) for row in range(CARD_POOL_SIZE)]
+        
         # Summary & Footer
         self.footer_frame = ctk.CTkFrame(self.results_container, fg_color="transparent")
         self.footer_frame.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
@@ -130,149 +265,237 @@ class MoneySpitterGUI:
         self.total_label = ctk.CTkLabel(
             self.footer_frame, 
             text="Total: -",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.fonts["total"]
         )
         self.total_label.pack(side="right")
         
+        # Progress job, hanya terlihat selama pembagian berjalan
+        self.progress_bar = ctk.CTkProgressBar(self.footer_frame, width=120, mode="indeterminate")
+        
         self.status_label = ctk.CTkLabel(
             self.footer_frame,
             text="Siap",
             text_color="gray",
-            font=ctk.CTkFont(size=12)
+            font=self.fonts["small"]
         )
         self.status_label.pack(side="left")
 
     def format_currency_input(self, event=None):
-        """Format input otomatis dengan pemisah ribuan"""
-        value = self.amount_entry.get()
+        """
+        Jadwalkan format pemisah ribuan pada siklus idle berikutnya
         
-        # Hapus semua karakter non-digit
-        clean_value = ''.join(filter(str.isdigit, value))
+        Banyak ketukan (mengetik cepat, key repeat) dalam satu siklus event
+        digabung menjadi satu apply_currency_format.
+        """
+        if self._format_pending is None:
+            self._format_pending = self.root.after_idle(self.apply_currency_format)
+
+    def apply_currency_format(self):
+        """Format input dengan pemisah ribuan tanpa memindahkan kursor, lalu update preview"""
+        self._format_pending = None
+        entry = self.amount_entry
+        value = entry.get()
+        formatted, caret = CurrencyFormatter.format_live(value, entry.index("insert"))
+        if formatted != value:
+            # Ganti hanya karakter yang berubah, bukan delete/insert seluruh isi
+            start, end, replacement = CurrencyFormatter.diff_span(value, formatted)
+            if end > start:
+                entry.delete(start, end)
+            if replacement:
+                entry.insert(start, replacement)
+            entry.icursor(caret)
+        self.update_preview()
+
+    def update_preview(self):
+        """
+        Hitung pembagian untuk amount dan jumlah bagian saat ini di background
         
-        if not clean_value:
-            # Jika user menghapus semua atau input sampah, bersihkan
-            if value:
-                self.amount_entry.delete(0, "end")
+        Dipanggil setelah input berubah (sekali per siklus idle) dan saat
+        jumlah bagian diganti. Job untuk input lama dibatalkan; job yang masih
+        antre tidak pernah dijalankan. Hasilnya tidak ditampilkan sampai
+        pengguna menekan Enter atau tombol bagi.
+        """
+        if not self.preview_enabled:
             return
+        if not self._polling:
+            # Tanpa poll aktif, buang job preview lama yang menumpuk di antrian hasil
+            self.jobs.poll()
+        amount = CurrencyFormatter.parse_input(self.amount_entry.get())
+        if amount is None:
+            self.preview.cancel()
+            return
+        num_parts = self.selected_parts.get()
+        self.preview.update((amount, num_parts), self.splitter, amount, num_parts)
 
-        # Format ribuan dengan titik
+    def on_paste(self, event=None):
+        """
+        Tempel amount dari clipboard sebagai satu angka
+        
+        Teks clipboard di-parse sekaligus (label, desimal dan pemisah dibuang)
+        lalu digitnya disisipkan di kursor, menggantikan seleksi jika ada.
+        """
         try:
-            formatted = "{:,}".format(int(clean_value)).replace(",", ".")
-            
-            # Update hanya jika berbeda (mencegah loop/cursor jump yang tidak perlu)
-            if value != formatted:
-                self.amount_entry.delete(0, "end")
-                self.amount_entry.insert(0, formatted)
-        except ValueError:
-            pass
+            amount = CurrencyFormatter.parse_pasted(self.root.clipboard_get())
+        except tk.TclError:  # Clipboard kosong atau bukan teks
+            amount = None
+        if amount is not None:
+            entry = self.amount_entry
+            if entry.select_present():
+                entry.delete("sel.first", "sel.last")
+            entry.insert("insert", str(abs(amount)))
+            self.format_currency_input()
+        return "break"
 
     def on_split_button_click(self):
-        """Handle split button click event"""
-        try:
-            self.status_label.configure(text="Memproses...", text_color="orange")
-            self.root.update()
-            
-            # Clear previous
+        """
+        Handle split button click event
+        
+        Pembagian dijalankan di thread worker sehingga window tetap responsif.
+        Jika preview untuk input yang sama sudah selesai, hasilnya langsung
+        ditampilkan; jika masih berjalan, job itu dipakai alih-alih dimulai
+        ulang. Klik baru membatalkan job yang masih berjalan; hasilnya tidak
+        ditampilkan. Kartu hasil sebelumnya tetap terlihat sampai hasil baru
+        menggantikannya di tempat, sehingga tidak ada kedipan hapus-lalu-gambar-ulang.
+        """
+        # Job sebelumnya (jika ada) sudah basi
+        if self.active_job is not None:
+            self.active_job.cancel()
+            self.active_job = None
+        
+        # Get input (parsing cepat, tetap di thread utama)
+        input_text = self.amount_entry.get()
+        amount = CurrencyFormatter.parse_input(input_text)
+        
+        if amount is None:
+            self.preview.cancel()
+            self.stop_progress()
             self.clear_results()
-            
-            # Get input
-            input_text = self.amount_entry.get()
-            amount = CurrencyFormatter.parse_input(input_text)
-            
-            if amount is None:
-                self.show_error(ValidationUtils.get_error_message("invalid_format"))
-                self.status_label.configure(text="Error Input", text_color="red")
-                return
-            
-            # Perform split
-            num_parts = self.selected_parts.get()
-            result = self.splitter.split_money(amount, num_parts)
+            self.show_error(ValidationUtils.get_error_message("invalid_format"))
+            self.status_label.configure(text="Error Input", text_color="red")
+            return
+        
+        num_parts = self.selected_parts.get()
+        job = self.preview.take((amount, num_parts))
+        if job is None:
+            job = self.jobs.submit(split_job, self.splitter, amount, num_parts)
+        # Siapkan pembagian berikutnya untuk input yang sama (klik berulang)
+        self.update_preview()
+        if job.finished:
+            self.stop_progress()
+            self.on_job_finished(job)
+            return
+        
+        self.active_job = job
+        self.status_label.configure(text="Memproses...", text_color="orange")
+        self.start_progress()
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self.poll_jobs)
+    
+    def poll_jobs(self):
+        """Ambil job yang selesai dari thread worker dan update progress (via root.after)"""
+        for job in self.jobs.poll():
+            if job is self.active_job:
+                self.active_job = None
+                self.stop_progress()
+                self.on_job_finished(job)
+        
+        job = self.active_job
+        if job is not None and job.progress is not None and job.progress < 1.0:
+            if not self._progress_determinate:
+                self._progress_determinate = True
+                self.progress_bar.stop()
+                self.progress_bar.configure(mode="determinate")
+            self.progress_bar.set(job.progress)
+        
+        # Berhenti setelah job aktif diterima; job lama yang batal tidak ditunggu
+        if self.active_job is not None:
+            self.root.after(POLL_INTERVAL_MS, self.poll_jobs)
+        else:
+            self._polling = False
+    
+    def on_job_finished(self, job: Job):
+        """Tampilkan hasil atau error job pembagian yang aktif"""
+        if job.state == CANCELLED:
+            return
+        if job.state == DONE:
+            result = job.result
             self.display_results(result)
-            
-            self.status_label.configure(text=f"Sukses! Dibagi menjadi {num_parts} bagian.", text_color="green")
-            
-        except ValueError as e:
-            self.show_error(str(e))
+            if not self.record_history(result):
+                self.status_label.configure(text="Sukses, tapi riwayat gagal disimpan", text_color="orange")
+                return
+            self.status_label.configure(text=f"Sukses! Dibagi menjadi {result.num_parts} bagian.", text_color="green")
+        elif isinstance(job.error, ValueError):
+            self.clear_results()
+            self.show_error(str(job.error))
             self.status_label.configure(text="Validasi Gagal", text_color="red")
-        except Exception as e:
-            self.show_error(ValidationUtils.get_error_message("processing_error") + f"\n{e}")
+        else:
+            self.clear_results()
+            self.show_error(ValidationUtils.get_error_message("processing_error") + f"\n{job.error}")
             self.status_label.configure(text="Error Internal", text_color="red")
+    
+    def start_progress(self):
+        """Tampilkan progress bar (indeterminate sampai job melaporkan total)"""
+        self._progress_determinate = False
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.pack(side="left", padx=10)
+        self.progress_bar.start()
+    
+    def stop_progress(self):
+        """Sembunyikan progress bar"""
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+
+    def record_history(self, result: SplitResult) -> bool:
+        """
+        Catat hasil ke riwayat; kegagalan database tidak membatalkan pembagian
+
+        Returns:
+            bool: False jika riwayat aktif tetapi gagal ditulis
+        """
+        if self.history is None:
+            return True
+        try:
+            self.history.add(result)
+            self.history.flush()
+        except sqlite3.Error:
+            return False
+        return True
 
     def clear_results(self):
-        """Clear previous results"""
-        for frame in self.result_frames:
-            frame.destroy()
+        """Clear previous results (kartu disembunyikan, tidak di-destroy)"""
+        for card in self.card_pool:
+            card.hide()
         self.result_frames = []
         self.total_label.configure(text="Total: -")
 
     def display_results(self, result: SplitResult):
-        """Display split results cards"""
+        """
+        Display split results cards
+        
+        Kartu dari pool dikonfigurasi ulang di tempat; kartu sisa dari hasil
+        sebelumnya yang lebih panjang disembunyikan.
+        """
         percentages = result.get_percentages()
         
+        self.result_frames = []
         for i, (split, percentage) in enumerate(zip(result.splits, percentages)):
             self.create_result_card(i + 1, split, percentage)
+        for card in self.card_pool[len(result.splits):]:
+            card.hide()
             
         # Update total
         total_formatted = CurrencyFormatter.format_rupiah(result.get_total())
         self.total_label.configure(text=f"Total: {total_formatted}")
 
     def create_result_card(self, index, amount, percentage):
-        """Create a single result row card with Copy button"""
-        card = ctk.CTkFrame(self.results_scroll, corner_radius=10, fg_color=("gray90", "gray20"))
-        card.grid(row=len(self.result_frames), column=0, padx=5, pady=5, sticky="ew")
-        card.grid_columnconfigure(1, weight=1) # Middle expands
-        
-        # Index Bubble
-        index_label = ctk.CTkLabel(
-            card, 
-            text=str(index), 
-            width=30, 
-            height=30, 
-            corner_radius=15,
-            fg_color=("gray80", "gray30"),
-            font=ctk.CTkFont(weight="bold")
-        )
-        index_label.grid(row=0, column=0, padx=10, pady=10)
-        
-        # Amount & Percentage
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.grid(row=0, column=1, padx=10, sticky="w")
-        
-        amount_text = CurrencyFormatter.format_rupiah(amount)
-        amount_label = ctk.CTkLabel(
-            info_frame, 
-            text=amount_text, 
-            font=ctk.CTkFont(size=16, weight="bold")
-        )
-        amount_label.pack(anchor="w")
-        
-        perc_label = ctk.CTkLabel(
-            info_frame, 
-            text=f"{percentage:.1f}% dari total", 
-            font=ctk.CTkFont(size=12),
-            text_color="gray"
-        )
-        perc_label.pack(anchor="w")
-        
-        # Copy Button
-        copy_btn = ctk.CTkButton(
-            card,
-            text="Salin",
-            width=60,
-            height=30,
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            border_width=1,
-            border_color=("gray60", "gray50"),
-            text_color=("gray10", "gray90"),
-            hover_color=("gray80", "gray30"),
-            command=lambda v=amount, b=None: self.copy_to_clipboard(v) 
-        )
-        # Hack to pass button reference if we wanted to change text temporarily, but let's keep it simple first
-        copy_btn.configure(command=lambda v=amount, b=copy_btn: self.copy_to_clipboard(v, b))
-        copy_btn.grid(row=0, column=2, padx=15, pady=10)
-        
-        self.result_frames.append(card)
+        """Tampilkan satu kartu hasil dari pool (kartu baru hanya jika pool habis)"""
+        position = len(self.result_frames)
+        if position == len(self.card_pool):
+            self.card_pool.append(ResultCard(self, position))
+        card = self.card_pool[position]
+        card.show(index, amount, percentage)
+        self.result_frames.append(card.frame)
 
     def copy_to_clipboard(self, value, btn_widget=None):
         """Copy value (number) to clipboard"""
@@ -285,13 +508,45 @@ class MoneySpitterGUI:
             btn_widget.configure(text="Disalin!", fg_color=("green", "green"), text_color="white")
             self.root.after(1000, lambda: btn_widget.configure(text=original_text, fg_color="transparent", text_color=("gray10", "gray90")))
 
+    def open_batch_view(self, results: Sequence[SplitResult], title: str = "Hasil Batch") -> VirtualTable:
+        """
+        Tampilkan banyak hasil (misalnya SplitBatch) di window tabel tervirtualisasi
+        
+        Hanya baris yang terlihat yang dibuat, sehingga tetap responsif untuk
+        ratusan ribu hasil.
+        """
+        window = ctk.CTkToplevel(self.root)
+        window.title(f"{title} ({len(results):,} hasil)".replace(",", "."))
+        window.geometry("860x520")
+        if ctk.get_appearance_mode() == "Dark":
+            colors = {"background": "gray14", "foreground": "gray90",
+                      "stripe": "gray18", "header_background": "gray25"}
+        else:
+            colors = {}
+        table = VirtualTable(window, RESULT_COLUMNS, format_result_row,
+                             font=self.fonts["small"], **colors)
+        table.pack(fill="both", expand=True, padx=10, pady=10)
+        table.set_rows(results)
+        return table
+
     def show_error(self, message: str):
         """Display error messages"""
         messagebox.showerror("Error", message)
 
     def run(self):
-        """Start the GUI application"""
-        self.root.mainloop()
+        """
+        Start the GUI application
+
+        Switch interval GIL diturunkan ke GUI_SWITCH_INTERVAL hanya selama
+        mainloop berjalan dan dikembalikan ke nilai sebelumnya setelahnya.
+        """
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(GUI_SWITCH_INTERVAL)
+        try:
+            self.root.mainloop()
+        finally:
+            sys.setswitchinterval(previous)
+            self.jobs.shutdown(wait=False)
 
 if __name__ == "__main__":
     app = MoneySpitterGUI()
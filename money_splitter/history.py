@@ -0,0 +1,296 @@
+"""
+Riwayat pembagian (audit trail) di SQLite
+
+Setiap SplitResult dicatat sebagai satu baris tabel split_history. Database
+memakai WAL (pembaca tidak memblokir penulis) dengan synchronous=NORMAL, dan
+insert dikumpulkan di buffer lalu ditulis per batch dalam satu transaksi
+(executemany), sehingga throughput insert jauh di atas satu transaksi per
+baris. Index pada created_at dan amount mendukung query berhalaman.
+
+Baris bisa diberi label source dan nomor urut seq. Pasangan (source, seq)
+unik dan insert-nya idempoten, sehingga batch CLI yang di-resume dari
+checkpoint tidak mencatat hasil yang sama dua kali.
+
+Contoh:
+    with HistoryStore("history.db") as history:
+        history.add_many(splitter.split_many(amounts), source="batch")
+        page = history.query(limit=50)
+        older = history.query(limit=50, cursor=page.next_cursor)
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .models import SplitResult, _from_epoch_us, _TimestampMemo, _to_epoch_us
+
+SCHEMA_VERSION = 1
+
+DEFAULT_BATCH_SIZE = 5_000
+DEFAULT_PAGE_SIZE = 50
+
+# Batas kolom INTEGER SQLite (int64); amount di atasnya ditolak sebelum di-buffer
+MAX_AMOUNT = 2 ** 63 - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS split_history (
+    id INTEGER PRIMARY KEY,
+    created_at INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    num_parts INTEGER NOT NULL,
+    splits TEXT NOT NULL,
+    source TEXT,
+    seq INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_split_history_created_at ON split_history (created_at);
+CREATE INDEX IF NOT EXISTS idx_split_history_amount ON split_history (amount);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_split_history_source_seq
+    ON split_history (source, seq) WHERE seq IS NOT NULL;
+"""
+
+_INSERT = (
+    "INSERT OR IGNORE INTO split_history (created_at, amount, num_parts, splits, source, seq) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass
+class HistoryEntry:
+    """Satu baris riwayat"""
+    id: int
+    result: SplitResult
+    source: Optional[str] = None
+
+
+@dataclass
+class HistoryPage:
+    """Satu halaman hasil query, urut dari yang terbaru"""
+    entries: List[HistoryEntry] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class HistoryStore:
+    """Penyimpanan riwayat pembagian di SQLite (WAL, insert per batch)"""
+
+    def __init__(self, path: Union[str, Path] = ":memory:",
+                 batch_size: int = DEFAULT_BATCH_SIZE, source: str = None):
+        """
+        Args:
+            path: File database (dibuat jika belum ada) atau ":memory:"
+            batch_size: Jumlah baris di buffer sebelum ditulis otomatis;
+                1 berarti setiap add langsung di-commit
+            source: Label source default untuk baris baru
+
+        Raises:
+            ValueError: Jika batch_size kurang dari 1
+            sqlite3.Error: Jika database tidak bisa dibuka
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size harus minimal 1")
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.source = source
+        self._buffer: List[tuple] = []
+        self._lock = threading.Lock()
+        self._timestamps = _TimestampMemo()
+        # Dipakai lintas thread (misalnya executor server) di bawah _lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            self._conn.close()
+            raise sqlite3.DatabaseError(f"Versi schema riwayat tidak didukung: {version}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def add(self, result: SplitResult, source: str = None, seq: int = None) -> None:
+        """
+        Catat satu hasil (ditulis saat buffer penuh atau flush)
+
+        Args:
+            result: Hasil pembagian
+            source: Label source (default: source store)
+            seq: Nomor urut opsional; (source, seq) yang sudah ada diabaikan
+
+        Raises:
+            ValueError: Jika amount melebihi MAX_AMOUNT (tidak ada yang di-buffer)
+        """
+        with self._lock:
+            self._buffer.append(self._row(result, source or self.source, seq))
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def add_many(self, results: Iterable[SplitResult], source: str = None,
+                 first_seq: int = None) -> None:
+        """
+        Catat banyak hasil sekaligus
+
+        Args:
+            results: Hasil pembagian
+            source: Label source (default: source store)
+            first_seq: Nomor urut hasil pertama; hasil berikutnya +1
+
+        Raises:
+            ValueError: Jika ada amount yang melebihi MAX_AMOUNT; tidak ada
+                hasil dari panggilan ini yang di-buffer
+        """
+        source = source or self.source
+        with self._lock:
+            row = self._row
+            rows = [row(result, source, None if first_seq is None else first_seq + i)
+                    for i, result in enumerate(results)]
+            buffer = self._buffer
+            for values in rows:
+                buffer.append(values)
+                if len(buffer) >= self.batch_size:
+                    self._flush_locked()
+
+    def flush(self) -> None:
+        """
+        Tulis semua baris di buffer dalam satu transaksi
+
+        Raises:
+            sqlite3.Error: Jika insert gagal; transaksi di-rollback dan baris
+                di buffer dibuang agar store tetap bisa dipakai dan ditutup
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush buffer lalu tutup koneksi (koneksi tetap ditutup jika flush gagal)"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    def query(self, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None,
+              since: datetime = None, until: datetime = None,
+              min_amount: int = None, max_amount: int = None,
+              source: str = None) -> HistoryPage:
+        """
+        Ambil satu halaman riwayat, terbaru dulu (keyset pagination)
+
+        Buffer di-flush dulu agar hasil yang baru dicatat ikut terbaca.
+
+        Args:
+            limit: Jumlah baris maksimal per halaman
+            cursor: next_cursor dari halaman sebelumnya
+            since: Hanya hasil dengan timestamp >= since
+            until: Hanya hasil dengan timestamp < until
+            min_amount: Hanya amount >= min_amount
+            max_amount: Hanya amount <= max_amount
+            source: Hanya baris dengan label source ini
+
+        Returns:
+            HistoryPage: Baris halaman ini dan cursor halaman berikutnya
+            (None jika sudah habis)
+
+        Raises:
+            ValueError: Jika limit atau cursor tidak valid
+        """
+        if limit < 1:
+            raise ValueError("limit harus minimal 1")
+        where, params = self._filters(since, until, min_amount, max_amount, source)
+        if cursor is not None:
+            created_at, row_id = _parse_cursor(cursor)
+            # Row value agar SQLite memakai index created_at (yang menyertakan id)
+            where.append("(created_at, id) < (?, ?)")
+            params += [created_at, row_id]
+        sql = "SELECT id, created_at, amount, num_parts, splits, source FROM split_history"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+
+        entries = [_entry(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = f"{last[1]}:{last[0]}"
+        return HistoryPage(entries, next_cursor)
+
+    def count(self, since: datetime = None, until: datetime = None,
+              min_amount: int = None, max_amount: int = None, source: str = None) -> int:
+        """Jumlah baris yang cocok dengan filter (sama seperti query)"""
+        where, params = self._filters(since, until, min_amount, max_amount, source)
+        sql = "SELECT COUNT(*) FROM split_history"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(_INSERT, self._buffer)
+        finally:
+            # Batch yang gagal sudah di-rollback; jangan diulang di setiap flush berikutnya
+            self._buffer.clear()
+
+    def _row(self, result: SplitResult, source: Optional[str], seq: Optional[int]) -> tuple:
+        # Bagian selalu positif dan berjumlah amount, sehingga cukup amount yang dicek
+        if result.original_amount > MAX_AMOUNT:
+            raise ValueError(f"Amount {result.original_amount} melebihi batas riwayat "
+                             f"(maksimal {MAX_AMOUNT})")
+        return (self._timestamps.to_us(result.timestamp), result.original_amount, result.num_parts,
+                ",".join(map(str, result.splits)), source, seq)
+
+    def _filters(self, since, until, min_amount, max_amount, source) -> Tuple[List[str], list]:
+        where, params = [], []
+        if since is not None:
+            where.append("created_at >= ?")
+            params.append(_to_epoch_us(since))
+        if until is not None:
+            where.append("created_at < ?")
+            params.append(_to_epoch_us(until))
+        if min_amount is not None:
+            where.append("amount >= ?")
+            params.append(min_amount)
+        if max_amount is not None:
+            where.append("amount <= ?")
+            params.append(max_amount)
+        if source is not None:
+            where.append("source = ?")
+            params.append(source)
+        return where, params
+
+
+def _parse_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        created_at, row_id = cursor.split(":")
+        return int(created_at), int(row_id)
+    except ValueError:
+        raise ValueError(f"Cursor tidak valid: {cursor!r}") from None
+
+
+def _entry(row: tuple) -> HistoryEntry:
+    row_id, created_at, amount, num_parts, splits, source = row
+    result = SplitResult(
+        original_amount=amount,
+        splits=[int(part) for part in splits.split(",")],
+        num_parts=num_parts,
+        timestamp=_from_epoch_us(created_at),
+    )
+    return HistoryEntry(row_id, result, source)
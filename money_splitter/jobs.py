@@ -0,0 +1,298 @@
+"""
+Job runner di thread worker untuk GUI
+
+GUI Tk hanya boleh disentuh dari thread utama, sehingga pembagian yang lama
+(atau batch besar) dijalankan di satu thread worker. Job yang selesai masuk
+antrian hasil; GUI mengambilnya dengan poll() dari callback root.after tanpa
+pernah memblokir event loop.
+
+Pembatalan bersifat kooperatif: job memanggil job.report()/job.check() di
+antara chunk dan berhenti dengan JobCancelled. Job yang dibatalkan saat
+sedang berjalan tetap ditandai CANCELLED walaupun fungsinya selesai, sehingga
+hasil basi tidak pernah ditampilkan. Satu thread worker berarti job berjalan
+berurutan dan satu MoneySplitter aman dipakai semua job.
+
+Speculator menghitung hasil untuk input yang sedang diketik di runner yang
+sama, sehingga saat pengguna menekan Enter hasilnya biasanya sudah siap.
+
+Contoh:
+    runner = JobRunner()
+    job = runner.submit(split_many_job, splitter, amounts)
+
+    def poll():
+        for finished in runner.poll():
+            if finished.state == DONE:
+                show(finished.result)
+        if not job.finished:
+            progress_bar.set(job.progress or 0)
+            root.after(POLL_INTERVAL_MS, poll)
+"""
+
+import itertools
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Sequence
+
+from .models import SplitResult
+from .splitter import MoneySplitter
+
+# Interval poll GUI (~60 fps)
+POLL_INTERVAL_MS = 16
+
+# sys.setswitchinterval selama mainloop GUI (MoneySpitterGUI.run): default 5 ms
+# membuat thread utama menunggu GIL hingga 5 ms setiap tick selama worker sibuk
+GUI_SWITCH_INTERVAL = 0.001
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+_FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Dilempar di dalam job yang dibatalkan"""
+
+
+class Job:
+    """Satu pekerjaan di JobRunner beserta status, progress dan hasilnya"""
+
+    def __init__(self, job_id: int, func: Callable[..., Any], args: tuple, kwargs: dict):
+        self.id = job_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.state = PENDING
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.done = 0
+        self.total: Optional[int] = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True jika pembatalan sudah diminta"""
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """True jika job sudah selesai, gagal atau dibatalkan"""
+        return self.state in _FINISHED_STATES
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Progress 0.0-1.0, None jika total belum diketahui"""
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    def cancel(self) -> None:
+        """Minta job berhenti; efektif pada check/report berikutnya"""
+        self._cancel.set()
+
+    def check(self) -> None:
+        """
+        Raises:
+            JobCancelled: Jika job sudah dibatalkan
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def report(self, done: int, total: Optional[int] = None) -> None:
+        """
+        Laporkan progress dari dalam job lalu cek pembatalan
+
+        Raises:
+            JobCancelled: Jika job sudah dibatalkan
+        """
+        if total is not None:
+            self.total = total
+        self.done = done
+        self.check()
+
+    def __repr__(self) -> str:
+        return f"Job(id={self.id}, state={self.state!r})"
+
+
+class JobRunner:
+    """Satu thread worker dengan antrian job dan antrian hasil"""
+
+    def __init__(self, name: str = "money-splitter-jobs"):
+        """
+        Args:
+            name: Nama thread worker (dibuat saat job pertama di-submit)
+        """
+        self.name = name
+        self._jobs: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._finished: "queue.Queue[Job]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._active: List[Job] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Job:
+        """
+        Jadwalkan func(job, *args, **kwargs) di thread worker
+
+        Returns:
+            Job: Handle untuk status, progress dan pembatalan
+
+        Raises:
+            RuntimeError: Jika runner sudah di-shutdown
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JobRunner sudah di-shutdown")
+            job = Job(next(self._ids), func, args, kwargs)
+            self._active.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        self._jobs.put(job)
+        return job
+
+    def poll(self) -> List[Job]:
+        """Ambil semua job yang sudah selesai sejak poll terakhir (tidak memblokir)"""
+        finished = []
+        while True:
+            try:
+                finished.append(self._finished.get_nowait())
+            except queue.Empty:
+                return finished
+
+    def cancel_all(self) -> None:
+        """Batalkan semua job yang belum selesai"""
+        with self._lock:
+            for job in self._active:
+                job.cancel()
+
+    @property
+    def pending(self) -> int:
+        """Jumlah job yang belum selesai"""
+        with self._lock:
+            return len(self._active)
+
+    def shutdown(self, wait: bool = True, timeout: float = None) -> None:
+        """
+        Batalkan semua job dan hentikan thread worker
+
+        Args:
+            wait: Tunggu thread worker berhenti
+            timeout: Batas waktu tunggu dalam detik
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for job in self._active:
+                job.cancel()
+            thread = self._thread
+        self._jobs.put(None)
+        if wait and thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            if not job.cancelled:
+                job.state = RUNNING
+                try:
+                    job.result = job.func(job, *job.args, **job.kwargs)
+                except JobCancelled:
+                    job.cancel()
+                except Exception as e:
+                    job.error = e
+            if job.cancelled:
+                job.state = CANCELLED
+                job.result = None
+            else:
+                job.state = FAILED if job.error is not None else DONE
+            with self._lock:
+                self._active.remove(job)
+            self._finished.put(job)
+
+
+class Speculator:
+    """
+    Hitung satu job secara spekulatif untuk input terakhir
+
+    update(key, ...) dipanggil setiap input berubah: job untuk key lama
+    dibatalkan (job yang masih antre dilewati worker) dan job baru di-submit.
+    take(key) mengambil job untuk key yang sama, baik sudah selesai maupun
+    masih berjalan, sehingga hasil bisa langsung dipakai tanpa memulai ulang.
+    """
+
+    def __init__(self, runner: JobRunner, func: Callable[..., Any]):
+        """
+        Args:
+            runner: JobRunner tempat job spekulatif dijalankan
+            func: func(job, *args) seperti JobRunner.submit
+        """
+        self.runner = runner
+        self.func = func
+        self.key: Any = None
+        self.job: Optional[Job] = None
+
+    def update(self, key: Any, *args) -> Optional[Job]:
+        """
+        Mulai job untuk key jika belum ada; key None hanya membatalkan
+
+        Returns:
+            Optional[Job]: Job spekulatif untuk key (None jika key None)
+        """
+        if key is not None and key == self.key and self.job is not None \
+                and not self.job.cancelled:
+            return self.job
+        self.cancel()
+        if key is not None:
+            self.key = key
+            self.job = self.runner.submit(self.func, *args)
+        return self.job
+
+    def take(self, key: Any) -> Optional[Job]:
+        """
+        Ambil job untuk key lalu kosongkan; job untuk key lain dibatalkan
+
+        Returns:
+            Optional[Job]: Job (selesai atau masih berjalan), None jika tidak cocok
+        """
+        job = self.job
+        if job is None or key != self.key or job.cancelled:
+            self.cancel()
+            return None
+        self.key = self.job = None
+        return job
+
+    def cancel(self) -> None:
+        """Batalkan job spekulatif yang belum selesai"""
+        if self.job is not None and not self.job.finished:
+            self.job.cancel()
+        self.key = self.job = None
+
+
+def split_job(job: Job, splitter: MoneySplitter, amount: int,
+              num_parts: int = None) -> SplitResult:
+    """
+    Job satu pembagian
+
+    Tidak bisa dihentikan di tengah dan tanpa total progress (indeterminate);
+    hasilnya dibuang jika job dibatalkan selama berjalan.
+    """
+    job.check()
+    return splitter.split_money(amount, num_parts)
+
+
+def split_many_job(job: Job, splitter: MoneySplitter, amounts: Sequence[int],
+                   num_parts: int = None, chunk_size: int = 1000) -> List[SplitResult]:
+    """Job batch yang melaporkan progress dan bisa dibatalkan per chunk"""
+    results: List[SplitResult] = []
+    job.report(0, len(amounts))
+    for start in range(0, len(amounts), chunk_size):
+        results.extend(splitter.split_many(amounts[start:start + chunk_size], num_parts))
+        job.report(len(results))
+    return results
@@ -0,0 +1,150 @@
+"""
+Load generator daemon split: throughput dan latency p99 per kedalaman pipeline
+
+Setiap klien adalah proses terpisah dengan satu koneksi yang mengirim
+``depth`` request sekaligus sebelum membaca response-nya; latency per
+request diukur dari kirim jendela sampai response request tersebut diterima.
+Tanpa path socket, daemon dijalankan sebagai subprocess di direktori
+sementara (0700) dan dihentikan setelah benchmark. spawn_cost mengukur
+pembanding: biaya menjalankan Python + import + satu split per panggilan.
+
+Contoh:
+    money-splitter daemon bench --requests 50000 --clients 1 4 --depth 1 16 256
+    money-splitter daemon bench --socket /run/money-splitter.sock
+"""
+
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .client import DEFAULT_WINDOW
+from .protocol import LENGTH, STATUS_OK, decode_response, encode_request
+
+# Direktori yang berisi package, agar subprocess bisa import money_splitter
+# baik dari checkout maupun hasil install
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_client(path: str, requests: int, depth: int, seed: int) -> List[float]:
+    """Kirim requests request dengan pipeline depth, kembalikan latency (detik)"""
+    rng = random.Random(seed)
+    amounts = [rng.randint(10_000, 1_000_000_000) for _ in range(requests)]
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path)
+    reader = sock.makefile("rb")
+    latencies = []
+    try:
+        for start in range(0, requests, depth):
+            window = amounts[start:start + depth]
+            frames = b"".join(encode_request(start + i, amount) for i, amount in enumerate(window))
+            # Jendela besar dikirim dari thread lain sambil response dibaca,
+            # agar depth yang melebihi buffer socket tidak saling menunggu
+            sender = None
+            sent = time.perf_counter()
+            if len(window) <= DEFAULT_WINDOW:
+                sock.sendall(frames)
+            else:
+                sender = threading.Thread(target=sock.sendall, args=(frames,), daemon=True)
+                sender.start()
+            for _ in window:
+                (length,) = LENGTH.unpack(reader.read(LENGTH.size))
+                _, status, body = decode_response(reader.read(length))
+                if status != STATUS_OK:
+                    raise RuntimeError(f"Daemon menjawab error: {body}")
+                latencies.append(time.perf_counter() - sent)
+            if sender is not None:
+                sender.join()
+    finally:
+        reader.close()
+        sock.close()
+    return latencies
+
+
+def run(path: str, requests: int, clients: int, depth: int, seed: int) -> Dict[str, float]:
+    """
+    Jalankan satu konfigurasi
+
+    Returns:
+        dict: rps, serta latency p50/p99/p999 dalam ms
+    """
+    per_client = max(1, requests // clients)
+    with ProcessPoolExecutor(max_workers=clients) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(run_client, path, per_client, depth, seed + i) for i in range(clients)]
+        latencies = sorted(lat for future in futures for lat in future.result())
+        elapsed = time.perf_counter() - start
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(0.50), "p99": percentile(0.99), "p999": percentile(0.999),
+    }
+
+
+def benchmark(path: Optional[str], requests: int, clients: Sequence[int],
+              depths: Sequence[int], seed: int = 1234
+              ) -> Iterator[Tuple[str, int, int, Dict[str, float]]]:
+    """
+    Ukur setiap kombinasi jumlah klien dan kedalaman pipeline
+
+    Args:
+        path: Socket daemon yang sudah berjalan (None: jalankan daemon sendiri)
+        requests: Jumlah request per konfigurasi
+        clients: Daftar jumlah proses klien
+        depths: Daftar kedalaman pipeline
+        seed: Seed amount acak
+
+    Yields:
+        tuple: (path socket, jumlah klien, depth, hasil run())
+    """
+    with tempfile.TemporaryDirectory(prefix="money-splitter-") as tmp:
+        process = None
+        if path is None:
+            path = os.path.join(tmp, "bench.sock")
+            process = start_daemon(path)
+        try:
+            for count in clients:
+                for depth in depths:
+                    yield path, count, depth, run(path, requests, count, depth, seed)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+
+def spawn_cost(count: int) -> float:
+    """Rata-rata ms untuk spawn Python + import + satu split"""
+    code = "from money_splitter.splitter import MoneySplitter; MoneySplitter().split_money(1500000)"
+    start = time.perf_counter()
+    for _ in range(count):
+        subprocess.run([sys.executable, "-c", code], cwd=_ROOT, check=True)
+    return (time.perf_counter() - start) / count * 1000
+
+
+def start_daemon(path: str, timeout: float = 10.0) -> subprocess.Popen:
+    """
+    Jalankan daemon sebagai subprocess dan tunggu sampai socket siap
+
+    Raises:
+        OSError: Jika daemon berhenti atau socket tidak muncul sebelum timeout
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "money_splitter", "daemon", "--socket", path],
+        cwd=_ROOT, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            process.wait()
+            raise OSError(f"Daemon gagal dijalankan di {path}")
+        time.sleep(0.05)
+    return process
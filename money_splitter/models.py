@@ -1,10 +1,31 @@
 """
 Data models untuk Money Splitter application
+
+SplitResult dan SplitPart punya serialisasi cepat untuk format wire/storage
+antara worker dan ledger: to_dict/to_json (string JSON disusun langsung,
+tanpa dataclasses.asdict) dan to_bytes/from_bytes (struct little-endian).
+Bentuk batch ada di money_splitter.serialization.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List
+import struct
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Titik nol timestamp CompactSplitResult (naive, sama seperti datetime.now())
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Versi format biner to_bytes
+WIRE_VERSION = 1
+
+# SplitResult: version, num_parts, amount, timestamp (mikrodetik), lalu parts
+_RESULT_HEADER = struct.Struct("<BBqq")
+# Struct parts per jumlah bagian, dibuat saat pertama kali dibutuhkan
+_RESULT_PARTS: Dict[int, struct.Struct] = {}
+# SplitPart: version, amount, percentage, index
+_PART = struct.Struct("<Bqdi")
 
 
 @dataclass
@@ -50,6 +71,102 @@ class SplitResult:
             SplitPart(amount=split, percentage=percentage, index=i)
             for i, (split, percentage) in enumerate(zip(self.splits, percentages))
         ]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Bentuk dict siap JSON (field sama seperti output JSONL CLI)"""
+        return {
+            "amount": self.original_amount,
+            "num_parts": self.num_parts,
+            "splits": list(self.splits),
+            "timestamp": self.timestamp.isoformat(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SplitResult":
+        """
+        Buat SplitResult dari bentuk to_dict
+        
+        num_parts boleh tidak ada (dihitung dari splits); timestamp yang tidak
+        ada diisi waktu sekarang, seperti output CLI tanpa --timestamp.
+        
+        Raises:
+            ValueError: Jika field wajib tidak ada atau data tidak valid
+        """
+        try:
+            splits = list(data["splits"])
+            amount = data["amount"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Data SplitResult tidak lengkap: {e}") from None
+        text = data.get("timestamp")
+        timestamp = datetime.fromisoformat(text) if text else datetime.now()
+        return cls(
+            original_amount=amount,
+            splits=splits,
+            num_parts=data.get("num_parts", len(splits)),
+            timestamp=timestamp,
+        )
+    
+    def to_json(self, timestamp: bool = True) -> str:
+        """
+        String JSON ringkas, disusun langsung tanpa json.dumps
+        
+        Args:
+            timestamp: Sertakan field timestamp (output CLI tanpa --timestamp
+                tidak menyertakannya)
+        """
+        if not timestamp:
+            return '{"amount":%d,"num_parts":%d,"splits":[%s]}' % (
+                self.original_amount, self.num_parts, ",".join(map(str, self.splits)))
+        return '{"amount":%d,"num_parts":%d,"splits":[%s],"timestamp":"%s"}' % (
+            self.original_amount, self.num_parts, ",".join(map(str, self.splits)),
+            self.timestamp.isoformat())
+    
+    @classmethod
+    def from_json(cls, text: Union[str, bytes]) -> "SplitResult":
+        """
+        Buat SplitResult dari string to_json
+        
+        Raises:
+            ValueError: Jika JSON atau datanya tidak valid
+        """
+        import json
+        return cls.from_dict(json.loads(text))
+    
+    def to_bytes(self) -> bytes:
+        """
+        Encode ke format biner (18 + 8 * num_parts byte)
+        
+        Raises:
+            ValueError: Jika nilai tidak muat di int64 atau bagian lebih dari 255
+        """
+        splits = self.splits
+        try:
+            return (_RESULT_HEADER.pack(WIRE_VERSION, len(splits), self.original_amount,
+                                        _to_epoch_us(self.timestamp))
+                    + _parts_struct(len(splits)).pack(*splits))
+        except struct.error as e:
+            raise ValueError(f"SplitResult tidak bisa di-encode: {e}") from None
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SplitResult":
+        """
+        Decode hasil to_bytes
+        
+        Raises:
+            ValueError: Jika data terpotong, versinya tidak dikenal, atau tidak valid
+        """
+        try:
+            version, num_parts, amount, timestamp_us = _RESULT_HEADER.unpack_from(data)
+            parts = _parts_struct(num_parts)
+            if len(data) != _RESULT_HEADER.size + parts.size:
+                raise ValueError("Panjang data SplitResult tidak sesuai num_parts")
+            splits = list(parts.unpack_from(data, _RESULT_HEADER.size))
+        except struct.error as e:
+            raise ValueError(f"Data SplitResult tidak valid: {e}") from None
+        if version != WIRE_VERSION:
+            raise ValueError(f"Versi format SplitResult tidak didukung: {version}")
+        return cls(original_amount=amount, splits=splits, num_parts=num_parts,
+                   timestamp=_from_epoch_us(timestamp_us))
 
 
 @dataclass
@@ -66,4 +183,237 @@ class SplitPart:
         if self.percentage < 0:
             raise ValueError("Percentage cannot be negative")
         if self.index < 0:
-            raise ValueError("Index must be non-negative")
\ No newline at end of file
+            raise ValueError("Index must be non-negative")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Bentuk dict siap JSON"""
+        return {"amount": self.amount, "percentage": self.percentage, "index": self.index}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SplitPart":
+        """
+        Buat SplitPart dari bentuk to_dict
+        
+        Raises:
+            ValueError: Jika field tidak lengkap atau data tidak valid
+        """
+        try:
+            return cls(amount=data["amount"], percentage=float(data["percentage"]),
+                       index=data["index"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Data SplitPart tidak lengkap: {e}") from None
+    
+    def to_json(self) -> str:
+        """String JSON ringkas, disusun langsung tanpa json.dumps"""
+        return '{"amount":%d,"percentage":%r,"index":%d}' % (
+            self.amount, float(self.percentage), self.index)
+    
+    @classmethod
+    def from_json(cls, text: Union[str, bytes]) -> "SplitPart":
+        """
+        Buat SplitPart dari string to_json
+        
+        Raises:
+            ValueError: Jika JSON atau datanya tidak valid
+        """
+        import json
+        return cls.from_dict(json.loads(text))
+    
+    def to_bytes(self) -> bytes:
+        """
+        Encode ke format biner (21 byte)
+        
+        Raises:
+            ValueError: Jika nilai tidak muat di field biner
+        """
+        try:
+            return _PART.pack(WIRE_VERSION, self.amount, self.percentage, self.index)
+        except struct.error as e:
+            raise ValueError(f"SplitPart tidak bisa di-encode: {e}") from None
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SplitPart":
+        """
+        Decode hasil to_bytes
+        
+        Raises:
+            ValueError: Jika ukuran data, versi, atau isinya tidak valid
+        """
+        if len(data) != _PART.size:
+            raise ValueError(f"Data SplitPart harus {_PART.size} byte, bukan {len(data)}")
+        version, amount, percentage, index = _PART.unpack(data)
+        if version != WIRE_VERSION:
+            raise ValueError(f"Versi format SplitPart tidak didukung: {version}")
+        return cls(amount=amount, percentage=percentage, index=index)
+
+
+class CompactSplitResult:
+    """
+    Representasi SplitResult yang hemat memori untuk menyimpan jutaan hasil
+    
+    Splits disimpan sebagai array('q') (8 byte per bagian, tanpa objek int
+    per bagian) dan timestamp sebagai integer mikrodetik sejak 1970-01-01
+    (naive, sama seperti datetime.now()). Objek memakai __slots__ tanpa
+    __dict__. Method publik sama dengan SplitResult; num_parts dan timestamp
+    dihitung dari data yang disimpan.
+    """
+    __slots__ = ("original_amount", "splits", "timestamp_us")
+    
+    def __init__(self, original_amount: int, splits: Iterable[int],
+                 timestamp: Union[datetime, int, None] = None):
+        """
+        Args:
+            original_amount: Jumlah uang yang dibagi
+            splits: Bagian-bagian pembagian (list, array('q') atau iterable)
+            timestamp: datetime naive, integer mikrodetik sejak epoch, atau
+                None untuk waktu sekarang
+        
+        Raises:
+            ValueError: Jika data tidak valid (aturan sama seperti SplitResult)
+        """
+        if original_amount <= 0:
+            raise ValueError("Original amount must be positive")
+        if not isinstance(splits, array) or splits.typecode != "q":
+            splits = array("q", splits)
+        if not splits:
+            raise ValueError("Splits list cannot be empty")
+        if min(splits) <= 0:
+            raise ValueError("All splits must be positive")
+        if timestamp is None:
+            timestamp = datetime.now()
+        if isinstance(timestamp, datetime):
+            timestamp = _to_epoch_us(timestamp)
+        self.original_amount = original_amount
+        self.splits = splits
+        self.timestamp_us = timestamp
+    
+    @classmethod
+    def from_result(cls, result: SplitResult) -> "CompactSplitResult":
+        """Buat representasi compact dari SplitResult"""
+        return cls(result.original_amount, result.splits, result.timestamp)
+    
+    def to_result(self) -> SplitResult:
+        """Kembalikan sebagai SplitResult biasa"""
+        return SplitResult(
+            original_amount=self.original_amount,
+            splits=self.splits.tolist(),
+            num_parts=len(self.splits),
+            timestamp=self.timestamp,
+        )
+    
+    @property
+    def num_parts(self) -> int:
+        """Jumlah bagian"""
+        return len(self.splits)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp pembagian sebagai datetime naive"""
+        return _from_epoch_us(self.timestamp_us)
+    
+    def get_total(self) -> int:
+        """Mengembalikan total dari semua bagian"""
+        return sum(self.splits)
+    
+    def get_percentages(self) -> List[float]:
+        """Mengembalikan persentase setiap bagian dari total"""
+        original = self.original_amount
+        return [(split * 10000 // original) / 100.0 for split in self.splits]
+    
+    def is_balanced(self) -> bool:
+        """Mengecek apakah total splits sama dengan original amount"""
+        return sum(self.splits) == self.original_amount
+    
+    def get_split_parts(self) -> List[SplitPart]:
+        """Mengembalikan list SplitPart objects (dibuat saat dipanggil)"""
+        return [
+            SplitPart(amount=split, percentage=percentage, index=i)
+            for i, (split, percentage) in enumerate(zip(self.splits, self.get_percentages()))
+        ]
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactSplitResult):
+            return NotImplemented
+        return (self.original_amount == other.original_amount
+                and self.splits == other.splits
+                and self.timestamp_us == other.timestamp_us)
+    
+    def __repr__(self) -> str:
+        return (f"CompactSplitResult(original_amount={self.original_amount}, "
+                f"splits={self.splits.tolist()}, timestamp={self.timestamp.isoformat()})")
+    
+    def __getstate__(self):
+        return self.original_amount, self.splits, self.timestamp_us
+    
+    def __setstate__(self, state) -> None:
+        self.original_amount, self.splits, self.timestamp_us = state
+
+
+def _parts_struct(count: int) -> struct.Struct:
+    parts = _RESULT_PARTS.get(count)
+    if parts is None:
+        parts = _RESULT_PARTS[count] = struct.Struct(f"<{count}q")
+    return parts
+
+
+def _to_epoch_us(timestamp: datetime) -> int:
+    """Mikrodetik sejak _EPOCH untuk datetime naive"""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(timestamp_us: int) -> datetime:
+    """Kebalikan _to_epoch_us"""
+    return _EPOCH + timedelta(microseconds=timestamp_us)
+
+
+class _TimestampMemo:
+    """
+    Memo konversi timestamp milik satu pemanggil (satu batch, writer atau reader)
+
+    Hasil satu split_many berbagi satu datetime, sehingga konversi terakhir
+    (ke dan dari mikrodetik) dipakai ulang untuk hasil berikutnya. Setiap
+    pemanggil membuat instance sendiri; memo tidak dibagi antar thread.
+    """
+    __slots__ = ("_datetime", "_datetime_us", "_us", "_us_datetime")
+
+    def __init__(self):
+        self._datetime, self._datetime_us = None, 0
+        self._us, self._us_datetime = None, None
+
+    def to_us(self, timestamp: datetime) -> int:
+        if timestamp is not self._datetime:
+            self._datetime, self._datetime_us = timestamp, _to_epoch_us(timestamp)
+        return self._datetime_us
+
+    def from_us(self, timestamp_us: int) -> datetime:
+        if timestamp_us != self._us:
+            self._us, self._us_datetime = timestamp_us, _from_epoch_us(timestamp_us)
+        return self._us_datetime
+
+
+@dataclass
+class SplitStats:
+    """
+    Statistik satu pembagian dari instrumentasi opsional MoneySplitter
+    
+    Counter dihitung per panggilan split. stage_times berisi waktu eksklusif
+    (detik) per tahap, yaitu tanpa waktu tahap lain yang dipanggil di dalamnya,
+    sehingga jumlahnya tidak dihitung ganda.
+    """
+    amount: int
+    num_parts: int
+    strategy: str
+    iterations: int = 0
+    balance_iterations: int = 0
+    collision_shifts: int = 0
+    duplicate_fixes: int = 0
+    forced_roundings: int = 0
+    distribution_retries: int = 0
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    total_time: float = 0.0
+    
+    def dominant_stage(self) -> Optional[str]:
+        """Mengembalikan nama tahap dengan waktu eksklusif terbesar"""
+        if not self.stage_times:
+            return None
+        return max(self.stage_times, key=self.stage_times.get)
@@ -0,0 +1,155 @@
+"""
+Pembagian batch paralel dengan ProcessPoolExecutor
+
+MoneySplitter adalah pure-Python dan CPU-bound, sehingga batch besar dibatasi
+satu core. ParallelSplitter memecah amounts menjadi chunk dan membagi setiap
+chunk di proses worker terpisah. Setiap chunk memakai MoneySplitter dengan
+seed sendiri yang diturunkan dari master seed dan nomor chunk, sehingga hasil
+hanya bergantung pada master seed dan chunk_size (bukan jumlah worker atau
+urutan selesai worker) dan selalu dikembalikan sesuai urutan input.
+"""
+
+import os
+import random
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .models import SplitResult
+from .splitter import ENGINES, STRATEGIES, MoneySplitter, derive_seed
+
+DEFAULT_CHUNK_SIZE = 5_000
+
+
+def _split_chunk(task: Tuple[List[int], Optional[int], int, str, str]) -> List[List[int]]:
+    """
+    Bagi satu chunk di proses worker
+
+    Hanya list splits yang dikirim balik ke proses utama; SplitResult dibuat
+    di sana agar pickling antar proses tetap ringan.
+    """
+    amounts, num_parts, seed, strategy, engine = task
+    splitter = MoneySplitter(strategy=strategy)
+    splitter.random.seed(seed)
+    return [result.splits for result in splitter.split_many(amounts, num_parts, engine=engine)]
+
+
+class ParallelSplitter:
+    """Executor paralel di atas MoneySplitter untuk batch besar"""
+
+    def __init__(self, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 seed: int = None, strategy: str = "repair", engine: str = "python"):
+        """
+        Args:
+            workers: Jumlah proses worker (default: jumlah CPU). Dengan 1 worker
+                semua chunk dibagi di proses ini tanpa pool.
+            chunk_size: Jumlah amount per task worker
+            seed: Master seed; jika None diambil acak sekali per instance
+            strategy: Strategi MoneySplitter di setiap worker
+            engine: Engine split_many di setiap worker ("python" atau "numpy")
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus minimal 1")
+        if workers is not None and workers < 1:
+            raise ValueError("workers harus minimal 1")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Strategi tidak dikenal: {strategy!r}")
+        if engine not in ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine!r}")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.strategy = strategy
+        self.engine = engine
+        self._executor: Optional[Executor] = None
+        # Dipakai hanya untuk validasi input di proses utama
+        self._validator = MoneySplitter()
+
+    def __enter__(self) -> "ParallelSplitter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Hentikan proses worker jika pool sudah dibuat"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def chunk_seed(self, index: int) -> int:
+        """Seed RNG untuk chunk ke-index, independen dari jumlah worker"""
+        return derive_seed(self.seed, index)
+
+    def split_many(self, amounts: Iterable[int], num_parts: int = None) -> List[SplitResult]:
+        """
+        Bagi semua amounts secara paralel
+
+        Args:
+            amounts: Daftar jumlah uang yang akan dibagi
+            num_parts: Jumlah bagian (2-6), None untuk acak 5 atau 6 per amount
+
+        Returns:
+            List[SplitResult]: Hasil dengan urutan yang sama seperti input
+
+        Raises:
+            ValueError: Jika ada amount atau num_parts yang tidak valid
+        """
+        return list(self.imap(amounts, num_parts))
+
+    def imap(self, amounts: Iterable[int], num_parts: int = None) -> Iterator[SplitResult]:
+        """
+        Bagi amounts secara paralel dan yield hasil sesuai urutan input
+
+        Input dibaca lazy dan jumlah chunk yang sedang diproses dibatasi
+        (2 per worker), sehingga memori tetap terbatas untuk input panjang.
+        Amount divalidasi per chunk saat chunk dibaca.
+
+        Raises:
+            ValueError: Jika ada amount atau num_parts yang tidak valid
+        """
+        if num_parts is not None:
+            self._validator._check_num_parts(num_parts)
+        chunks = self._chunks(amounts, num_parts)
+
+        if self.workers == 1:
+            for chunk, task in chunks:
+                yield from self._to_results(chunk, _split_chunk(task))
+            return
+
+        executor = self._get_executor()
+        pending = deque()
+        for chunk, task in chunks:
+            pending.append((chunk, executor.submit(_split_chunk, task)))
+            if len(pending) >= self.workers * 2:
+                chunk, future = pending.popleft()
+                yield from self._to_results(chunk, future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from self._to_results(chunk, future.result())
+
+    def _chunks(self, amounts: Iterable[int], num_parts: Optional[int]) -> Iterator[Tuple[List[int], tuple]]:
+        """Pecah amounts menjadi (chunk, task worker) dengan seed per chunk"""
+        iterator = iter(amounts)
+        index = 0
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            for amount in chunk:
+                self._validator._check_amount(amount)
+            yield chunk, (chunk, num_parts, self.chunk_seed(index), self.strategy, self.engine)
+            index += 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    @staticmethod
+    def _to_results(amounts: List[int], splits: List[List[int]]) -> Iterator[SplitResult]:
+        timestamp = datetime.now()
+        for amount, row in zip(amounts, splits):
+            yield SplitResult(original_amount=amount, splits=row, num_parts=len(row), timestamp=timestamp)
@@ -0,0 +1,138 @@
+"""
+Protokol biner daemon Money Splitter
+
+Setiap frame diawali panjang payload (uint32 big-endian), diikuti payload:
+
+Request (22 byte):
+    request_id  uint32   dikembalikan apa adanya di response
+    amount      uint64
+    num_parts   uint8    0 = acak (5 atau 6)
+    flags       uint8    FLAG_SEED jika field seed dipakai
+    seed        uint64   seed RNG per request (hasil bisa direproduksi)
+
+Response:
+    request_id  uint32
+    status      uint8    STATUS_OK atau kode error
+    count       uint8    jumlah bagian (STATUS_OK) atau 0
+    parts       count x uint64   (STATUS_OK)
+    message     UTF-8, sisa payload (status error)
+
+Frame bisa dikirim berturut-turut tanpa menunggu response (pipelining);
+response dikirim dengan urutan yang sama seperti request dalam satu koneksi.
+Modul ini hanya memakai struct, stat dan os agar client tetap ringan di-import.
+"""
+
+import os
+import stat
+import struct
+from typing import List, Optional, Tuple
+
+LENGTH = struct.Struct("!I")
+REQUEST = struct.Struct("!IQBBQ")
+RESPONSE_HEADER = struct.Struct("!IBB")
+
+# Payload lebih besar dari ini dianggap frame rusak dan koneksi ditutup
+MAX_FRAME_SIZE = 4096
+
+FLAG_SEED = 0x01
+
+STATUS_OK = 0
+STATUS_INVALID = 1          # amount/num_parts tidak valid (ValueError)
+STATUS_BUDGET_EXCEEDED = 2  # SplitBudgetExceeded
+STATUS_BAD_REQUEST = 3      # payload tidak sesuai format
+
+_PARTS = [struct.Struct(f"!{count}Q") for count in range(7)]
+
+
+def default_socket_path() -> str:
+    """
+    Path socket default: $XDG_RUNTIME_DIR/money-splitter.sock
+
+    Tanpa XDG_RUNTIME_DIR, socket ditaruh di direktori per user
+    ($TMPDIR atau /tmp)/money-splitter-<uid> dengan permission 0700, sehingga
+    user lain tidak bisa membuat atau menyambung ke socket tersebut.
+
+    Raises:
+        OSError: Jika direktori per user sudah ada tetapi bukan milik user ini,
+            bukan direktori, atau bisa diakses user lain
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime:
+        runtime = _private_directory(os.path.join(
+            os.environ.get("TMPDIR") or "/tmp", f"money-splitter-{os.getuid()}"))
+    return os.path.join(runtime, "money-splitter.sock")
+
+
+def _private_directory(path: str) -> str:
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise OSError(f"{path} bukan direktori milik user ini")
+    if info.st_mode & 0o077:
+        raise OSError(f"{path} bisa diakses user lain (harus 0700)")
+    return path
+
+
+class ProtocolError(Exception):
+    """Dilempar jika frame tidak sesuai protokol"""
+
+
+def encode_request(request_id: int, amount: int, num_parts: Optional[int] = None,
+                   seed: Optional[int] = None) -> bytes:
+    """
+    Susun satu frame request
+
+    Raises:
+        ValueError: Jika field di luar range tipe protokol
+    """
+    try:
+        payload = REQUEST.pack(request_id, amount, num_parts or 0,
+                               FLAG_SEED if seed is not None else 0, seed or 0)
+    except struct.error as e:
+        raise ValueError(f"Request tidak bisa di-encode: {e}") from None
+    return LENGTH.pack(len(payload)) + payload
+
+
+def decode_request(payload: bytes) -> Tuple[int, int, Optional[int], Optional[int]]:
+    """
+    Parse payload request menjadi (request_id, amount, num_parts, seed)
+
+    Raises:
+        ProtocolError: Jika ukuran payload salah
+    """
+    if len(payload) != REQUEST.size:
+        raise ProtocolError(f"Ukuran request harus {REQUEST.size} byte, bukan {len(payload)}")
+    request_id, amount, num_parts, flags, seed = REQUEST.unpack(payload)
+    return request_id, amount, num_parts or None, seed if flags & FLAG_SEED else None
+
+
+def encode_response(request_id: int, parts: List[int]) -> bytes:
+    """Susun frame response sukses"""
+    payload = RESPONSE_HEADER.pack(request_id, STATUS_OK, len(parts)) + _PARTS[len(parts)].pack(*parts)
+    return LENGTH.pack(len(payload)) + payload
+
+
+def encode_error(request_id: int, status: int, message: str) -> bytes:
+    """Susun frame response error"""
+    payload = RESPONSE_HEADER.pack(request_id, status, 0) + message.encode("utf-8")
+    return LENGTH.pack(len(payload)) + payload
+
+
+def decode_response(payload: bytes) -> Tuple[int, int, object]:
+    """
+    Parse payload response menjadi (request_id, status, parts atau pesan error)
+
+    Raises:
+        ProtocolError: Jika ukuran payload tidak sesuai jumlah bagian
+    """
+    if len(payload) < RESPONSE_HEADER.size:
+        raise ProtocolError("Response terlalu pendek")
+    request_id, status, count = RESPONSE_HEADER.unpack_from(payload)
+    if status != STATUS_OK:
+        return request_id, status, payload[RESPONSE_HEADER.size:].decode("utf-8", "replace")
+    if count >= len(_PARTS) or len(payload) != RESPONSE_HEADER.size + _PARTS[count].size:
+        raise ProtocolError("Ukuran response tidak sesuai jumlah bagian")
+    return request_id, status, list(_PARTS[count].unpack_from(payload, RESPONSE_HEADER.size))
@@ -0,0 +1,464 @@
+"""
+Server HTTP lokal untuk Money Splitter (stdlib, asyncio)
+
+Endpoint:
+    POST /split        {"amount": 1500000, "num_parts": 5}
+                       -> {"amount": ..., "num_parts": ..., "splits": [...], "timestamp": "..."}
+    POST /split/batch  {"amounts": [1500000, 250000], "num_parts": 3}
+                       -> {"results": [...]}
+    GET  /health       -> {"status": "ok", "requests": ..., "batches": ...}
+
+Koneksi HTTP/1.1 dipertahankan (keep-alive) sampai klien mengirim
+``Connection: close`` atau idle melewati keep_alive_timeout.
+
+Request yang datang bersamaan digabung (micro-batching): semua request yang
+masuk antrian selama batch sebelumnya diproses, ditambah yang datang dalam
+batch_window, dibagi dalam satu kali lompatan ke executor dengan satu
+MoneySplitter. Dengan batch_window=0 tidak ada latency tambahan untuk klien
+tunggal; batch terbentuk sendiri saat beban naik.
+
+Shutdown graceful: server berhenti menerima koneksi, koneksi idle ditutup,
+request yang sedang berjalan diselesaikan (dengan ``Connection: close``),
+lalu worker batch dihentikan.
+
+Contoh:
+    money-splitter serve --port 8000
+    curl -d '{"amount": 1500000, "num_parts": 5}' localhost:8000/split
+"""
+
+import asyncio
+import json
+import signal
+from concurrent.futures import Executor
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import SplitResult
+from .splitter import MoneySplitter, SplitBudgetExceeded
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_BODY = 1 << 20
+DEFAULT_KEEP_ALIVE_TIMEOUT = 15.0
+DEFAULT_SHUTDOWN_TIMEOUT = 10.0
+
+# Jumlah amount maksimal per request /split/batch
+MAX_BATCH_AMOUNTS = 100_000
+
+# Batas ukuran request line + header
+MAX_HEADER_SIZE = 16 * 1024
+
+
+class HTTPError(Exception):
+    """Error yang dikirim ke klien sebagai response JSON {"error": ...}"""
+
+    def __init__(self, status: HTTPStatus, message: str = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+class MicroBatcher:
+    """
+    Antrian yang menggabungkan request bersamaan menjadi satu pass executor
+
+    Satu task worker mengambil entri dari antrian, menunggu paling lama
+    batch_window detik untuk entri berikutnya (atau sampai max_batch), lalu
+    membagi semuanya di executor. Batch diproses berurutan, sehingga satu
+    MoneySplitter tidak pernah dipakai dua thread sekaligus.
+    """
+
+    def __init__(self, splitter: MoneySplitter, batch_window: float = 0.0,
+                 max_batch: int = DEFAULT_MAX_BATCH, executor: Executor = None):
+        """
+        Args:
+            splitter: MoneySplitter yang dipakai oleh worker batch
+            batch_window: Detik menunggu request tambahan setelah request
+                pertama dalam batch (0: hanya yang sudah antri)
+            max_batch: Jumlah entri maksimal per batch
+            executor: Executor untuk pembagian (None: default event loop)
+        """
+        if batch_window < 0:
+            raise ValueError("batch_window tidak boleh negatif")
+        if max_batch < 1:
+            raise ValueError("max_batch harus minimal 1")
+        self.splitter = splitter
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.executor = executor
+        self.batches = 0
+        self.entries = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, amounts: List[int], num_parts: Optional[int]) -> List[SplitResult]:
+        """
+        Antrikan amounts dan tunggu hasilnya
+
+        Raises:
+            ValueError: Jika amount atau num_parts tidak valid
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.ensure_future(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((amounts, num_parts, future))
+        return await future
+
+    async def close(self) -> None:
+        """Selesaikan entri yang masih antri lalu hentikan worker"""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._queue = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                try:
+                    outcomes = await loop.run_in_executor(self.executor, self._split_batch, batch)
+                except asyncio.CancelledError:
+                    for _, _, future in batch:
+                        future.cancel()
+                    raise
+                except Exception as e:  # executor sudah shutdown, MemoryError, dll.
+                    # Semua request di batch mendapat error; worker tetap hidup
+                    outcomes = [e] * len(batch)
+                for (_, _, future), outcome in zip(batch, outcomes):
+                    if future.done():
+                        continue  # klien sudah putus
+                    if isinstance(outcome, Exception):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
+            finally:
+                self.batches += 1
+                self.entries += len(batch)
+                for _ in batch:
+                    queue.task_done()
+
+    def _split_batch(self, batch: List[Tuple[List[int], Optional[int], asyncio.Future]]) -> list:
+        """
+        Bagi semua entri batch di executor; error dikembalikan per entri
+
+        Entri dikelompokkan per num_parts dan setiap kelompok dibagi dengan
+        satu split_many. Entri yang tidak valid disaring dulu agar tidak
+        menggagalkan entri lain di kelompoknya; jika split_many kelompok tetap
+        gagal (misalnya SplitBudgetExceeded), kelompok itu diulang per entri.
+        """
+        splitter = self.splitter
+        outcomes: list = [None] * len(batch)
+        groups: Dict[Optional[int], List[int]] = {}
+        for index, (amounts, num_parts, _) in enumerate(batch):
+            try:
+                if num_parts is not None:
+                    splitter._check_num_parts(num_parts)
+                for amount in amounts:
+                    splitter._check_amount(amount)
+            except ValueError as e:
+                outcomes[index] = e
+                continue
+            groups.setdefault(num_parts, []).append(index)
+
+        for num_parts, indexes in groups.items():
+            amounts = [amount for index in indexes for amount in batch[index][0]]
+            try:
+                results = splitter.split_many(amounts, num_parts)
+            except Exception:
+                for index in indexes:
+                    outcomes[index] = self._split_entry(batch[index][0], num_parts)
+                continue
+            start = 0
+            for index in indexes:
+                end = start + len(batch[index][0])
+                outcomes[index] = results[start:end]
+                start = end
+        return outcomes
+
+    def _split_entry(self, amounts: List[int], num_parts: Optional[int]):
+        try:
+            return self.splitter.split_many(amounts, num_parts)
+        except Exception as e:  # dikirim ke request pemiliknya saja
+            return e
+
+
+class SplitServer:
+    """Server HTTP/1.1 asyncio untuk POST /split dan POST /split/batch"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 splitter: MoneySplitter = None, batch_window: float = 0.0,
+                 max_batch: int = DEFAULT_MAX_BATCH, max_body: int = DEFAULT_MAX_BODY,
+                 keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT,
+                 executor: Executor = None):
+        """
+        Args:
+            host: Alamat bind
+            port: Port bind (0: pilih port bebas, lihat atribut port)
+            splitter: MoneySplitter untuk worker batch (default: baru)
+            batch_window: Detik menunggu request tambahan per batch
+            max_batch: Jumlah request maksimal per batch
+            max_body: Ukuran body request maksimal (byte)
+            keep_alive_timeout: Detik koneksi idle sebelum ditutup
+            executor: Executor untuk pembagian (None: default event loop)
+        """
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self.keep_alive_timeout = keep_alive_timeout
+        self.batcher = MicroBatcher(splitter or MoneySplitter(), batch_window, max_batch, executor)
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._busy = set()  # task koneksi yang sedang memproses request
+        self._closing = False
+
+    async def start(self) -> None:
+        """Mulai menerima koneksi"""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Hentikan server secara graceful
+
+        Koneksi idle langsung ditutup; request yang sedang diproses diberi
+        waktu sampai timeout detik untuk selesai sebelum koneksinya diputus.
+        Koneksi ditutup lewat transport (bukan Task.cancel) agar handler
+        keluar lewat jalur EOF biasa.
+        """
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        for task, writer in list(self._connections.items()):
+            if task not in self._busy:
+                writer.close()
+        if self._connections:
+            _, remaining = await asyncio.wait(list(self._connections), timeout=timeout)
+            for task in remaining:
+                self._connections[task].transport.abort()
+            if remaining:
+                await asyncio.wait(remaining)
+        if self._server is not None:
+            await self._server.wait_closed()
+        await self.batcher.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            keep_alive = True
+            while keep_alive and not self._closing:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), self.keep_alive_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                        {"error": "Header terlalu besar"}, keep_alive=False)
+                    break
+                self._busy.add(task)
+                try:
+                    keep_alive = await self._handle_request(head, reader, writer)
+                finally:
+                    self._busy.discard(task)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(self, head: bytes, reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> bool:
+        """Proses satu request, kembalikan True jika koneksi tetap dipakai"""
+        try:
+            method, path, version, headers = _parse_head(head)
+        except HTTPError as e:
+            await self._respond(writer, e.status, {"error": e.message}, keep_alive=False)
+            return False
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+
+        try:
+            body = await self._read_body(method, headers, reader)
+            status, payload = await self._dispatch(method, path, body)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+            # Body yang tidak terbaca membuat stream tidak sinkron lagi
+            if status in (HTTPStatus.LENGTH_REQUIRED, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                          HTTPStatus.NOT_IMPLEMENTED):
+                keep_alive = False
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception as e:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+            keep_alive = False
+        self.requests += 1
+        keep_alive = keep_alive and not self._closing
+        await self._respond(writer, status, payload, keep_alive)
+        return keep_alive
+
+    async def _read_body(self, method: str, headers: Dict[str, str],
+                         reader: asyncio.StreamReader) -> bytes:
+        if "transfer-encoding" in headers:
+            raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding tidak didukung")
+        length = headers.get("content-length")
+        if length is None:
+            if method == "POST":
+                raise HTTPError(HTTPStatus.LENGTH_REQUIRED)
+            return b""
+        if not length.isdigit():
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length tidak valid")
+        if int(length) > self.max_body:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return await reader.readexactly(int(length))
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Any]:
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, {
+                "status": "ok", "requests": self.requests,
+                "batches": self.batcher.batches,
+            }
+        if path not in ("/split", "/split/batch"):
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        data = _parse_json(body)
+        num_parts = data.get("num_parts")
+        if num_parts is not None and not _is_int(num_parts):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "num_parts harus integer")
+        if path == "/split":
+            amount = data.get("amount")
+            if not _is_int(amount):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "amount harus integer")
+            results = await self._split([amount], num_parts)
+            return HTTPStatus.OK, results[0].to_dict()
+
+        amounts = data.get("amounts")
+        if not isinstance(amounts, list) or not all(_is_int(a) for a in amounts):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "amounts harus list integer")
+        if len(amounts) > MAX_BATCH_AMOUNTS:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Maksimal {MAX_BATCH_AMOUNTS} amount per batch")
+        results = await self._split(amounts, num_parts) if amounts else []
+        return HTTPStatus.OK, {"results": [r.to_dict() for r in results]}
+
+    async def _split(self, amounts: List[int], num_parts: Optional[int]) -> List[SplitResult]:
+        try:
+            return await self.batcher.submit(amounts, num_parts)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, str(e)) from None
+        except SplitBudgetExceeded as e:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, str(e)) from None
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: HTTPStatus,
+                       payload: Any, keep_alive: bool) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+        writer.write(head + body)
+        await writer.drain()
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+    """Parse request line dan header; nama header di-lowercase"""
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, path, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Request line tidak valid") from None
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise HTTPError(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED)
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Header tidak valid")
+        headers[name.strip().lower()] = value.strip()
+    return method, path, version, headers
+
+
+def _parse_json(body: bytes) -> Dict[str, Any]:
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body harus JSON") from None
+    if not isinstance(data, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body harus objek JSON")
+    return data
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+async def serve(server, ready=None) -> None:
+    """
+    Jalankan server sampai SIGINT/SIGTERM, lalu shutdown graceful
+
+    Args:
+        server: SplitServer (atau objek lain dengan start() dan shutdown(),
+            misalnya SplitDaemon) yang akan dijalankan
+        ready: Callback opsional dipanggil dengan server setelah bind
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    installed = []
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+            installed.append(signum)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows / bukan main thread: andalkan KeyboardInterrupt
+    await server.start()
+    if ready is not None:
+        ready(server)
+    try:
+        await stop.wait()
+    finally:
+        for signum in installed:
+            loop.remove_signal_handler(signum)
+        await server.shutdown()
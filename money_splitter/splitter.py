@@ -3,18 +3,115 @@ Business logic untuk Money Splitter - algoritma pembagian uang
 """
 
 import random
+import time
 from datetime import datetime
-from typing import List
+from typing import Callable, Iterable, List, Optional
 
-from .models import SplitResult
+from .models import SplitResult, SplitStats
 from .utils import ValidationUtils
+from . import vectorized
+
+# Engine yang tersedia untuk split_many
+ENGINES = ("python", "numpy")
+
+# Strategi algoritma pembagian per amount
+STRATEGIES = ("repair", "constructive")
+
+# Tahap yang diukur waktunya jika instrumentasi aktif
+STAT_STAGES = (
+    "_construct_splits",
+    "_balance_splits",
+    "_ensure_natural_properties",
+    "_ensure_thousands_preference",
+    "_ensure_uniqueness",
+    "_ensure_reasonable_distribution",
+)
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """
+    Turunkan seed independen ke-index dari master seed
+    
+    Dipakai untuk memberi setiap chunk, worker atau thread RNG sendiri yang
+    tetap bisa direproduksi dari satu master seed.
+    """
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+class SplitBudgetExceeded(RuntimeError):
+    """Dilempar jika satu pembagian melebihi batas iterasi atau waktu"""
 
 
 class MoneySplitter:
     """Class utama untuk melakukan pembagian uang"""
     
-    def __init__(self):
-        self.random = random.Random()
+    def __init__(self, strategy: str = "repair", max_iterations: int = None,
+                 time_budget: float = None, collect_stats: bool = False,
+                 on_stats: Callable[[SplitStats], None] = None, seed: int = None,
+                 rng: random.Random = None):
+        """
+        Args:
+            strategy: "repair" (default) untuk algoritma undi lalu perbaiki,
+                atau "constructive" untuk algoritma satu langkah yang langsung
+                membangun pembagian valid tanpa loop perbaikan
+            max_iterations: Batas opsional jumlah iterasi loop perbaikan per
+                pembagian; jika terlampaui dilempar SplitBudgetExceeded
+            time_budget: Batas opsional waktu (detik) per pembagian; jika
+                terlampaui dilempar SplitBudgetExceeded
+            collect_stats: Jika True, statistik setiap pembagian (SplitStats)
+                disimpan di last_stats
+            on_stats: Callback opsional yang dipanggil dengan SplitStats setelah
+                setiap pembagian; mengaktifkan instrumentasi seperti collect_stats
+            seed: Seed opsional untuk RNG; dengan seed yang sama, urutan panggilan
+                yang sama menghasilkan pembagian yang identik
+            rng: Instance random.Random opsional yang dipakai langsung sebagai
+                RNG splitter (tidak boleh digabung dengan seed)
+        
+        Instrumentasi hanya memasang pengukur waktu per tahap jika diaktifkan,
+        sehingga tanpa collect_stats/on_stats biayanya hampir nol.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Strategi tidak dikenal: {strategy!r}")
+        if max_iterations is not None and max_iterations < 1:
+            raise ValueError("max_iterations harus minimal 1")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("time_budget harus lebih besar dari 0")
+        if rng is not None and seed is not None:
+            raise ValueError("seed dan rng tidak bisa dipakai bersamaan")
+        self.random = rng if rng is not None else random.Random(seed)
+        self.strategy = strategy
+        self.max_iterations = max_iterations
+        self.time_budget = time_budget
+        self._iterations = 0
+        self._deadline = None
+        self.on_stats = on_stats
+        self.last_stats: Optional[SplitStats] = None
+        self._stats: Optional[SplitStats] = None
+        self._instrumented = collect_stats or on_stats is not None
+        if self._instrumented:
+            self._instrument_stages()
+    
+    def get_rng_state(self) -> tuple:
+        """
+        Snapshot state RNG, misalnya di batas batch untuk checkpoint
+        
+        Returns:
+            tuple: State dari random.Random.getstate()
+        """
+        return self.random.getstate()
+    
+    def set_rng_state(self, state: tuple) -> None:
+        """
+        Pulihkan state RNG dari get_rng_state
+        
+        Pembagian berikutnya identik dengan yang akan dihasilkan splitter
+        asal tepat setelah snapshot diambil.
+        
+        Args:
+            state: State dari get_rng_state (tuple atau list hasil JSON)
+        """
+        version, internal, gauss_next = state
+        self.random.setstate((version, tuple(internal), gauss_next))
     
     def split_money(self, amount: int, num_parts: int = None) -> SplitResult:
         """
@@ -30,22 +127,17 @@ class MoneySplitter:
         Raises:
             ValueError: Jika input tidak valid
         """
-        if not self._validate_input(amount):
-            if amount <= 0:
-                raise ValueError(ValidationUtils.get_error_message("negative_or_zero"))
-            else:
-                raise ValueError(ValidationUtils.get_error_message("too_small"))
+        self._check_amount(amount)
         
         # Validasi num_parts
         if num_parts is not None:
-            if not isinstance(num_parts, int) or num_parts < 2 or num_parts > 6:
-                raise ValueError("Jumlah bagian harus antara 2 dan 6")
+            self._check_num_parts(num_parts)
         else:
             # Default: Tentukan jumlah bagian secara acak (5 atau 6)
             num_parts = self.random.choice([5, 6])
         
         # Generate pembagian natural
-        splits = self._generate_natural_splits(amount, num_parts)
+        splits = self._generate_splits(amount, num_parts)
         
         return SplitResult(
             original_amount=amount,
@@ -54,6 +146,324 @@ class MoneySplitter:
             timestamp=datetime.now()
         )
     
+    def split_many(self, amounts: Iterable[int], num_parts: int = None,
+                   engine: str = "python") -> List[SplitResult]:
+        """
+        Membagi banyak jumlah uang sekaligus dalam satu panggilan
+        
+        Semua amount divalidasi di awal sebelum ada pembagian yang dilakukan,
+        lalu setiap amount dibagi dengan algoritma yang sama seperti split_money
+        sehingga jaminannya identik (total tepat, tidak ada bagian identik,
+        distribusi 5% - 40%, preferensi ribuan). Overhead per panggilan
+        (validasi num_parts, lookup method, datetime.now()) hanya dibayar
+        sekali untuk seluruh batch; semua hasil berbagi timestamp yang sama.
+        
+        Args:
+            amounts: Daftar jumlah uang yang akan dibagi
+            num_parts: Jumlah bagian (2-6) untuk semua amount, jika None akan
+                dipilih secara acak (5 atau 6) untuk setiap amount
+            engine: "python" (default) atau "numpy" untuk engine vektor di
+                money_splitter.vectorized. Jika NumPy tidak terinstall, engine
+                "numpy" otomatis kembali ke jalur pure-Python.
+            
+        Returns:
+            List[SplitResult]: Hasil pembagian dengan urutan yang sama seperti input
+            
+        Raises:
+            ValueError: Jika ada amount, num_parts atau engine yang tidak valid
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine!r}")
+        amounts = list(amounts)
+        for amount in amounts:
+            self._check_amount(amount)
+        if num_parts is not None:
+            self._check_num_parts(num_parts)
+        
+        if engine == "numpy" and vectorized.HAS_NUMPY:
+            return self._split_many_vectorized(amounts, num_parts)
+        
+        timestamp = datetime.now()
+        generate = self._generate_splits
+        choice = self.random.choice
+        part_choices = [5, 6]
+        
+        results = []
+        append = results.append
+        for amount in amounts:
+            parts = num_parts if num_parts is not None else choice(part_choices)
+            append(SplitResult(
+                original_amount=amount,
+                splits=generate(amount, parts),
+                num_parts=parts,
+                timestamp=timestamp
+            ))
+        return results
+    
+    def _split_many_vectorized(self, amounts: List[int], num_parts: int = None) -> List[SplitResult]:
+        """
+        Jalur split_many dengan engine NumPy
+        
+        Jika num_parts None, jumlah bagian diundi per amount lalu amount
+        dikelompokkan per jumlah bagian karena matriks harus persegi.
+        """
+        if num_parts is not None:
+            part_counts = [num_parts] * len(amounts)
+        else:
+            choice = self.random.choice
+            part_counts = [choice([5, 6]) for _ in amounts]
+        
+        splits = [None] * len(amounts)
+        limit = vectorized.MAX_VECTOR_AMOUNT
+        for parts in sorted(set(part_counts)):
+            rows = [i for i, count in enumerate(part_counts) if count == parts]
+            # Amount besar (bisa melebihi int64) dipisah sebelum konversi ke array
+            if any(amounts[i] >= limit for i in rows):
+                for i in rows:
+                    if amounts[i] >= limit:
+                        splits[i] = self._generate_splits(amounts[i], parts)
+                rows = [i for i in rows if amounts[i] < limit]
+            if len(rows) == len(amounts):
+                matrix = vectorized.split_matrix(amounts, parts, self)
+                splits = matrix.tolist()
+                break
+            matrix = vectorized.split_matrix([amounts[i] for i in rows], parts, self)
+            for i, row in zip(rows, matrix.tolist()):
+                splits[i] = row
+        
+        timestamp = datetime.now()
+        return [
+            SplitResult(original_amount=amount, splits=row, num_parts=parts, timestamp=timestamp)
+            for amount, row, parts in zip(amounts, splits, part_counts)
+        ]
+    
+    def _tick_budget(self) -> None:
+        """
+        Catat satu iterasi loop perbaikan dan cek budget pembagian
+        
+        Raises:
+            SplitBudgetExceeded: Jika max_iterations atau time_budget terlampaui
+        """
+        self._iterations += 1
+        if self.max_iterations is not None and self._iterations > self.max_iterations:
+            raise SplitBudgetExceeded(
+                f"Pembagian melebihi batas {self.max_iterations} iterasi"
+            )
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SplitBudgetExceeded(
+                f"Pembagian melebihi batas waktu {self.time_budget} detik"
+            )
+    
+    def _check_amount(self, amount: int) -> None:
+        """Raise ValueError dengan pesan yang sesuai jika amount tidak valid"""
+        if not self._validate_input(amount):
+            if amount <= 0:
+                raise ValueError(ValidationUtils.get_error_message("negative_or_zero"))
+            else:
+                raise ValueError(ValidationUtils.get_error_message("too_small"))
+    
+    def _check_num_parts(self, num_parts: int) -> None:
+        """Raise ValueError jika num_parts di luar range 2-6"""
+        if not isinstance(num_parts, int) or num_parts < 2 or num_parts > 6:
+            raise ValueError("Jumlah bagian harus antara 2 dan 6")
+    
+    def _generate_splits(self, amount: int, num_parts: int) -> List[int]:
+        """Generate pembagian dengan strategi yang dipilih di constructor"""
+        self._iterations = 0
+        if self.time_budget is not None:
+            self._deadline = time.perf_counter() + self.time_budget
+        if self._instrumented:
+            return self._generate_splits_with_stats(amount, num_parts)
+        if self.strategy == "constructive":
+            return self._generate_constructive_splits(amount, num_parts)
+        return self._generate_natural_splits(amount, num_parts)
+    
+    def _generate_splits_with_stats(self, amount: int, num_parts: int) -> List[int]:
+        """Versi _generate_splits yang mengisi SplitStats untuk pembagian ini"""
+        stats = self._stats = SplitStats(amount=amount, num_parts=num_parts, strategy=self.strategy)
+        start = time.perf_counter()
+        try:
+            if self.strategy == "constructive":
+                splits = self._generate_constructive_splits(amount, num_parts)
+            else:
+                splits = self._generate_natural_splits(amount, num_parts)
+        finally:
+            self._stats = None
+        stats.total_time = time.perf_counter() - start
+        stats.iterations = self._iterations
+        self.last_stats = stats
+        if self.on_stats is not None:
+            self.on_stats(stats)
+        return splits
+    
+    def _instrument_stages(self) -> None:
+        """
+        Bungkus method pada STAT_STAGES milik instance ini dengan pengukur waktu
+        
+        Waktu dicatat eksklusif: waktu tahap yang dipanggil di dalam tahap lain
+        (misalnya _balance_splits di dalam _ensure_uniqueness) dikurangkan dari
+        tahap pemanggilnya.
+        """
+        child_times = []
+        perf_counter = time.perf_counter
+        
+        def timed(name, method):
+            def wrapper(*args, **kwargs):
+                child_times.append(0.0)
+                start = perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    elapsed = perf_counter() - start
+                    own = elapsed - child_times.pop()
+                    if child_times:
+                        child_times[-1] += elapsed
+                    stats = self._stats
+                    if stats is not None:
+                        stats.stage_times[name] = stats.stage_times.get(name, 0.0) + own
+            return wrapper
+        
+        for name in STAT_STAGES:
+            setattr(self, name, timed(name, getattr(self, name)))
+    
+    def _generate_constructive_splits(self, amount: int, num_parts: int) -> List[int]:
+        """
+        Bangun pembagian valid secara langsung dalam satu langkah
+        
+        Setiap bagian (kecuali bagian terakhir sebagai penyeimbang) dipilih dari
+        interval yang menjamin sisa amount tetap bisa dibagi dalam batas
+        get_split_bounds, sehingga penyeimbang otomatis berada dalam batas dan
+        total selalu tepat. Bagian yang wajib bulat ribuan ditentukan di awal,
+        dan keunikan dijaga dengan memilih kandidat terdekat yang belum
+        dipakai. Tidak ada loop perbaikan; jumlah langkah O(num_parts).
+        
+        Untuk amount yang sangat kecil kombinasi valid bisa tidak ada (misal
+        10.000 dibagi 6 dengan 3 bagian bulat ribuan). Jika konstruksi gagal,
+        pembagian dialihkan ke _generate_natural_splits.
+        
+        Args:
+            amount: Total jumlah yang akan dibagi
+            num_parts: Jumlah bagian (2-6)
+            
+        Returns:
+            List[int]: Daftar pembagian yang natural
+        """
+        splits = self._construct_splits(amount, num_parts)
+        if splits is None or not ValidationUtils.is_natural_split(splits, amount):
+            return self._generate_natural_splits(amount, num_parts)
+        return splits
+    
+    def _construct_splits(self, amount: int, num_parts: int):
+        """
+        Inti strategi constructive, mengembalikan None jika tidak ada kandidat
+        
+        Args:
+            amount: Total jumlah yang akan dibagi
+            num_parts: Jumlah bagian (2-6)
+            
+        Returns:
+            List[int] atau None
+        """
+        rand = self.random.random
+        min_part, max_part = ValidationUtils.get_split_bounds(amount, num_parts)
+        
+        # Target zero-sum: offset berjarak sama (-1..1) dengan urutan acak,
+        # diskalakan acak, plus sedikit noise (sama seperti engine NumPy)
+        offsets = [-1.0 + 2.0 * i / (num_parts - 1) for i in range(num_parts)]
+        self.random.shuffle(offsets)
+        scale = 0.5 + 0.4 * rand()
+        noise = [offset * scale + 0.2 * rand() - 0.1 for offset in offsets]
+        mean_noise = sum(noise) / num_parts
+        jitter = vectorized.JITTER[num_parts]
+        average = amount / num_parts
+        targets = [int(average * (1.0 + jitter * (value - mean_noise))) for value in noise]
+        
+        # Bagian yang wajib bulat ribuan dipilih di awal; sisanya 80% ribuan
+        required = ValidationUtils.get_required_thousands(num_parts)
+        
+        splits = []
+        used = set()
+        remaining = amount
+        for i in range(num_parts - 1):
+            # Interval yang menjamin sisa bagian tetap bisa berada dalam batas
+            parts_after = num_parts - i - 1
+            low = max(min_part, remaining - parts_after * max_part)
+            high = min(max_part, remaining - parts_after * min_part)
+            
+            unit = 1000 if i < required or rand() < 0.8 else 100
+            value = self._pick_unused(targets[i], unit, low, high, used, num_parts)
+            if value is None and unit == 1000:
+                value = self._pick_unused(targets[i], 100, low, high, used, num_parts)
+            if value is None:
+                return None
+            
+            splits.append(value)
+            used.add(value)
+            remaining -= value
+        
+        # Penyeimbang otomatis berada dalam batas; pastikan unik dan tidak bulat juta
+        if remaining in used or remaining % 1000000 == 0:
+            if not self._shift_balancer(splits, remaining, min_part, max_part):
+                return None
+        else:
+            splits.append(remaining)
+        
+        self.random.shuffle(splits)
+        return splits
+    
+    @staticmethod
+    def _pick_unused(target: int, unit: int, low: int, high: int, used: set, num_parts: int):
+        """
+        Kelipatan unit terdekat dari target dalam [low, high] yang belum dipakai
+        
+        Jumlah kandidat yang dicoba dibatasi oleh num_parts karena paling banyak
+        num_parts nilai yang bisa bentrok (nilai terpakai dan kelipatan 1 juta).
+        
+        Returns:
+            int atau None jika tidak ada kandidat
+        """
+        first = -(-low // unit) * unit
+        last = high // unit * unit
+        if first > last:
+            return None
+        
+        base = min(max((target + unit // 2) // unit * unit, first), last)
+        for step in range(2 * num_parts + 2):
+            for candidate in (base + step * unit, base - step * unit):
+                if (first <= candidate <= last and candidate not in used
+                        and candidate % 1000000 != 0):
+                    return candidate
+        return None
+    
+    def _shift_balancer(self, splits: List[int], balancer: int, min_part: int, max_part: int) -> bool:
+        """
+        Pindahkan sedikit nilai antara penyeimbang dan salah satu bagian lain
+        
+        Dipakai jika penyeimbang bentrok dengan bagian lain atau kelipatan persis
+        1 juta. Pergeseran yang mempertahankan status bulat ribuan bagian lain
+        dicoba lebih dulu, baru kemudian pergeseran ratusan. Jumlah kandidat
+        konstan per bagian. Menambahkan penyeimbang ke splits jika berhasil.
+        
+        Returns:
+            bool: True jika ada pergeseran yang valid
+        """
+        order = self.random.sample(range(len(splits)), len(splits))
+        for deltas in ((1000, -1000, 2000, -2000), (100, -100, 200, -200)):
+            for j in order:
+                if deltas[0] == 1000 and splits[j] % 1000 != 0:
+                    continue
+                others = set(splits[:j] + splits[j + 1:])
+                for delta in deltas:
+                    part = splits[j] + delta
+                    rest = balancer - delta
+                    if (min_part <= part <= max_part and min_part <= rest <= max_part
+                            and part != rest and part not in others and rest not in others
+                            and part % 1000000 != 0 and rest % 1000000 != 0):
+                        splits[j] = part
+                        splits.append(rest)
+                        return True
+        return False
+    
     def _generate_natural_splits(self, amount: int, num_parts: int) -> List[int]:
         """
         Generate pembagian yang terlihat natural dengan variasi yang wajar
@@ -166,6 +576,15 @@ class MoneySplitter:
         Sesuaikan splits agar total tepat sama dengan target_amount
         Preserve thousands preference where possible
         
+        Selisih dipecah menjadi blok 1000 dan sisa di bawah 1000. Blok 1000
+        dibagikan ke semua bagian secara proporsional terhadap ruang tersisa
+        sampai batas wajar, dengan bobot acak (largest remainder), sehingga
+        bagian yang bulat ribuan tetap bulat ribuan. Sisa di bawah 1000
+        diberikan ke satu bagian yang memang tidak bulat ribuan jika ada. Untuk
+        amount kecil (rata-rata bagian di bawah 20 ribu) blok 1000 terlalu
+        kasar, sehingga selisih dibagikan per rupiah. Jumlah langkah
+        O(len(splits)) dan selalu berhenti.
+        
         Args:
             splits: List pembagian yang akan disesuaikan
             target_amount: Target total yang harus dicapai
@@ -175,52 +594,121 @@ class MoneySplitter:
         """
         current_total = sum(splits)
         difference = target_amount - current_total
-        
-        if difference == 0:
-            return splits
-        
-        # Distribusikan perbedaan secara acak ke bagian-bagian
         adjusted_splits = splits.copy()
         
-        # Prioritize adjusting non-thousands ending splits first
-        thousands_indices = [i for i, s in enumerate(adjusted_splits) if s % 1000 == 0]
-        non_thousands_indices = [i for i, s in enumerate(adjusted_splits) if s % 1000 != 0]
-        
-        if difference > 0:
-            # Perlu menambah - prioritize non-thousands first
-            while difference > 0:
-                # Choose from non-thousands first if available
-                if non_thousands_indices and self.random.random() < 0.7:
-                    idx = self.random.choice(non_thousands_indices)
-                else:
-                    idx = self.random.randint(0, len(adjusted_splits) - 1)
-                
-                # Use integer arithmetic to avoid floating point errors
-                max_add = max(1, difference // len(adjusted_splits) + 1)
-                add_amount = min(difference, self.random.randint(1, max_add))
-                adjusted_splits[idx] += add_amount
-                difference -= add_amount
-        else:
-            # Perlu mengurangi - prioritize non-thousands first
-            difference = abs(difference)
-            while difference > 0:
-                # Choose from non-thousands first if available
-                if non_thousands_indices and self.random.random() < 0.7:
-                    idx = self.random.choice(non_thousands_indices)
-                else:
-                    idx = self.random.randint(0, len(adjusted_splits) - 1)
-                
-                # Pastikan tidak mengurangi terlalu banyak - use integer arithmetic
-                max_reduce = min(difference, adjusted_splits[idx] // 10)  # Maksimal 10% dari nilai
-                if max_reduce > 0:
-                    reduce_amount = min(difference, self.random.randint(1, max_reduce))
-                    adjusted_splits[idx] -= reduce_amount
-                    difference -= reduce_amount
+        if difference == 0:
+            self._separate_collisions(adjusted_splits)
+            return adjusted_splits
+        
+        self._tick_budget()
+        if self._stats is not None:
+            self._stats.balance_iterations += 1
+        count = len(adjusted_splits)
+        sign = 1 if difference > 0 else -1
+        unit = 1000 if target_amount >= count * 20000 else 1
+        blocks, remainder = divmod(abs(difference), unit)
+        
+        min_part, max_part = ValidationUtils.get_split_bounds(target_amount, count)
+        
+        if blocks:
+            # Largest remainder: bobot proporsional terhadap ruang tersisa tiap
+            # bagian sampai batas wajar, diacak 50% - 150% agar hasil tetap
+            # bervariasi. Untuk pembagian per rupiah, bagian bulat ribuan tidak
+            # ikut menerima selisih selama bagian lain masih cukup menampung.
+            if sign > 0:
+                room = [max(max_part - split, 0) for split in adjusted_splits]
+            else:
+                room = [max(split - min_part, 0) for split in adjusted_splits]
+            if unit == 1:
+                flexible_room = sum(r for r, split in zip(room, adjusted_splits) if split % 1000 != 0)
+                if flexible_room >= abs(difference):
+                    room = [r if split % 1000 != 0 else 0 for r, split in zip(room, adjusted_splits)]
+            if not any(room):
+                room = [max(split, 1) for split in adjusted_splits]
+            
+            randint = self.random.randint
+            weights = [r * randint(50, 150) for r in room]
+            total_weight = sum(weights)
+            shares = [blocks * weight for weight in weights]
+            allocation = [share // total_weight for share in shares]
+            leftover = blocks - sum(allocation)
+            by_remainder = sorted(range(count), key=lambda i: shares[i] % total_weight, reverse=True)
+            for i in by_remainder[:leftover]:
+                allocation[i] += 1
+            for i in range(count):
+                adjusted_splits[i] += sign * unit * allocation[i]
+        
+        if remainder:
+            # Prioritize non-thousands: sisa tidak merusak bagian yang bulat ribuan,
+            # kecuali jika bagian itu akan keluar dari batas wajar
+            delta = sign * remainder
+            candidates = [
+                i for i, s in enumerate(adjusted_splits)
+                if s % 1000 != 0 and min_part <= s + delta <= max_part
+            ]
+            if candidates:
+                idx = self.random.choice(candidates)
+            elif sign > 0:
+                idx = min(range(count), key=adjusted_splits.__getitem__)
+            else:
+                idx = max(range(count), key=adjusted_splits.__getitem__)
+            adjusted_splits[idx] += delta
+        
+        # Pengurangan besar bisa membuat bagian kecil menjadi <= 0; ambil dari
+        # bagian terbesar (maksimal satu langkah per bagian)
+        for i in range(count):
+            if adjusted_splits[i] < 1:
+                largest = max(range(count), key=adjusted_splits.__getitem__)
+                needed = 1 - adjusted_splits[i]
+                adjusted_splits[i] += needed
+                adjusted_splits[largest] -= needed
+        
+        self._separate_collisions(adjusted_splits)
+        return adjusted_splits
+    
+    def _separate_collisions(self, splits: List[int]) -> None:
+        """
+        Geser sedikit bagian yang identik atau kelipatan persis 1 juta (in-place)
+        
+        Pembagian proporsional bisa menghasilkan dua bagian yang sama atau
+        bagian yang tepat 1 juta. Setiap bagian bermasalah dipasangkan dengan
+        satu bagian lain (urutan acak) dan dipindahkan kelipatan 1000 (atau
+        ratusan jika bagian itu tidak bulat ribuan). Jika semua slot ribuan
+        terisi (amount sangat kecil), pergeseran ratusan dicoba terakhir.
+        Total tidak berubah dan jumlah kandidat terbatas O(len(splits)^2).
+        """
+        count = len(splits)
+        for i in range(count):
+            value = splits[i]
+            if value not in splits[:i] and (value < 1000000 or value % 1000000 != 0):
+                continue
+            
+            hundreds = [
+                sign * step
+                for step in self.random.sample(range(100, 1000, 100), 4)
+                for sign in (1, -1)
+            ]
+            if value % 1000 == 0:
+                deltas = self.random.sample([1000, -1000, 2000, -2000], 4) + hundreds
+            else:
+                deltas = hundreds
+            partners = self.random.sample(range(count), count)
+            for j in partners:
+                if j == i:
+                    continue
+                others = [splits[k] for k in range(count) if k != i and k != j]
+                for delta in deltas:
+                    moved, partner = value + delta, splits[j] - delta
+                    if (moved > 0 and partner > 0 and moved != partner
+                            and moved not in others and partner not in others
+                            and moved % 1000000 != 0 and partner % 1000000 != 0):
+                        splits[i], splits[j] = moved, partner
+                        if self._stats is not None:
+                            self._stats.collision_shifts += 1
+                        break
                 else:
-                    # Jika tidak bisa mengurangi dari bagian ini, coba yang lain
                     continue
-        
-        return adjusted_splits
+                break
     
     def _ensure_natural_properties(self, splits: List[int], original_amount: int) -> List[int]:
         """
@@ -248,12 +736,12 @@ class MoneySplitter:
                     
                     # Re-check for duplicates after adjustment
                     while adjusted_splits[j] in adjusted_splits[:j] + adjusted_splits[j+1:]:
+                        self._tick_budget()
                         variation = self.random.randint(100, 1000)
                         adjusted_splits[j] += variation
         
         # Pastikan distribusi wajar (5% - 40% dari total) - use integer arithmetic
-        min_allowed = original_amount * 5 // 100  # 5% using integer division
-        max_allowed = original_amount * 40 // 100  # 40% using integer division
+        min_allowed, max_allowed = ValidationUtils.get_split_bounds(original_amount, len(adjusted_splits))
         
         for i in range(len(adjusted_splits)):
             if adjusted_splits[i] < min_allowed:
@@ -287,12 +775,14 @@ class MoneySplitter:
             List[int]: Splits dengan distribusi yang wajar
         """
         adjusted_splits = splits.copy()
-        min_allowed = original_amount * 5 // 100  # 5%
-        max_allowed = original_amount * 40 // 100  # 40%
+        min_allowed, max_allowed = ValidationUtils.get_split_bounds(original_amount, len(adjusted_splits))
         
         # Keep trying until distribution is reasonable
         max_attempts = 5
         for attempt in range(max_attempts):
+            self._tick_budget()
+            if attempt and self._stats is not None:
+                self._stats.distribution_retries += 1
             # Fix distribution issues
             for i in range(len(adjusted_splits)):
                 if adjusted_splits[i] < min_allowed:
@@ -330,6 +820,7 @@ class MoneySplitter:
         # Keep adjusting until all values are unique
         max_attempts = 10
         for attempt in range(max_attempts):
+            self._tick_budget()
             # Find duplicates
             seen = set()
             duplicates = []
@@ -342,6 +833,9 @@ class MoneySplitter:
             if not duplicates:
                 break  # No duplicates found
             
+            if self._stats is not None:
+                self._stats.duplicate_fixes += len(duplicates)
+            
             # Fix duplicates while trying to preserve thousands endings
             for idx in duplicates:
                 original_value = adjusted_splits[idx]
@@ -349,6 +843,7 @@ class MoneySplitter:
                 attempts = 0
                 
                 while adjusted_splits[idx] in adjusted_splits[:idx] + adjusted_splits[idx+1:] and attempts < 20:
+                    self._tick_budget()
                     if is_thousands:
                         # Try to keep it as thousands ending
                         variation = self.random.choice([1000, 2000, 3000])
@@ -389,6 +884,7 @@ class MoneySplitter:
         # Keep trying until we meet the requirement
         max_attempts = 5
         for attempt in range(max_attempts):
+            self._tick_budget()
             thousands_count = sum(1 for s in adjusted_splits if s % 1000 == 0)
             
             if thousands_count >= required_thousands:
@@ -401,6 +897,8 @@ class MoneySplitter:
             if len(non_thousands_indices) >= needed:
                 # Select indices to change
                 indices_to_change = self.random.sample(non_thousands_indices, needed)
+                if self._stats is not None:
+                    self._stats.forced_roundings += needed
                 
                 for idx in indices_to_change:
                     current_value = adjusted_splits[idx]
@@ -425,6 +923,8 @@ class MoneySplitter:
             non_thousands.sort(key=lambda x: x[1], reverse=True)  # Sort by value, largest first
             
             needed = required_thousands - thousands_count
+            if self._stats is not None:
+                self._stats.forced_roundings += min(needed, len(non_thousands))
             for i in range(min(needed, len(non_thousands))):
                 idx, value = non_thousands[i]
                 # Round to nearest thousand
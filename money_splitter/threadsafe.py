@@ -0,0 +1,95 @@
+"""
+Facade thread-safe untuk MoneySplitter
+
+Satu MoneySplitter menyimpan state per pembagian (RNG, counter budget,
+statistik) di instance-nya, sehingga tidak aman dipakai bersamaan dari
+beberapa thread. Modul ini menyediakan dua cara pemakaian konkuren tanpa
+state bersama:
+
+- ThreadLocalSplitter: satu MoneySplitter per thread (threading.local),
+  masing-masing dengan RNG sendiri yang diturunkan dari master seed.
+- split_with_rng: fungsi stateless yang memakai RNG milik pemanggil, untuk
+  hasil yang bisa direproduksi per request.
+
+Karena tidak ada lock di jalur pembagian, throughput bisa naik mengikuti
+jumlah thread pada build CPython free-threaded; pada build dengan GIL,
+throughput CPU-bound tetap dibatasi satu core.
+"""
+
+import random
+import threading
+from typing import Iterable, List
+
+from .models import SplitResult
+from .splitter import MoneySplitter, derive_seed
+
+
+class ThreadLocalSplitter:
+    """Pool MoneySplitter per thread dengan API yang sama seperti MoneySplitter"""
+
+    def __init__(self, seed: int = None, **splitter_kwargs):
+        """
+        Args:
+            seed: Master seed opsional. Thread ke-n yang pertama kali memakai
+                pool mendapat seed derive_seed(seed, n); urutan thread
+                bergantung pada scheduler, jadi untuk hasil yang bisa
+                direproduksi per request gunakan split_with_rng.
+            **splitter_kwargs: Argumen lain untuk MoneySplitter (strategy,
+                max_iterations, time_budget, collect_stats, on_stats)
+        """
+        if "rng" in splitter_kwargs:
+            raise ValueError("rng tidak bisa dibagi antar thread; gunakan seed")
+        self.seed = seed
+        self._splitter_kwargs = splitter_kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @property
+    def splitter(self) -> MoneySplitter:
+        """MoneySplitter milik thread pemanggil (dibuat saat pertama dipakai)"""
+        splitter = getattr(self._local, "splitter", None)
+        if splitter is None:
+            with self._lock:
+                index = self._created
+                self._created += 1
+            seed = None if self.seed is None else derive_seed(self.seed, index)
+            splitter = MoneySplitter(seed=seed, **self._splitter_kwargs)
+            self._local.splitter = splitter
+        return splitter
+
+    @property
+    def thread_count(self) -> int:
+        """Jumlah thread yang sudah mendapat MoneySplitter sendiri"""
+        return self._created
+
+    def split_money(self, amount: int, num_parts: int = None) -> SplitResult:
+        """MoneySplitter.split_money memakai splitter milik thread ini"""
+        return self.splitter.split_money(amount, num_parts)
+
+    def split_many(self, amounts: Iterable[int], num_parts: int = None,
+                   engine: str = "python") -> List[SplitResult]:
+        """MoneySplitter.split_many memakai splitter milik thread ini"""
+        return self.splitter.split_many(amounts, num_parts, engine=engine)
+
+
+def split_with_rng(amount: int, num_parts: int = None, *, rng: random.Random,
+                   strategy: str = "repair") -> SplitResult:
+    """
+    Bagi amount memakai RNG milik pemanggil tanpa state bersama
+
+    Setiap panggilan membuat MoneySplitter ringan di atas rng, sehingga aman
+    dipanggil dari banyak thread selama setiap thread memakai rng sendiri.
+    RNG yang sama dengan state yang sama selalu menghasilkan pembagian yang
+    sama.
+
+    Args:
+        amount: Jumlah uang yang akan dibagi
+        num_parts: Jumlah bagian (2-6), None untuk acak 5 atau 6
+        rng: Instance random.Random milik pemanggil
+        strategy: Strategi pembagian ("repair" atau "constructive")
+
+    Returns:
+        SplitResult: Hasil pembagian
+    """
+    return MoneySplitter(strategy=strategy, rng=rng).split_money(amount, num_parts)
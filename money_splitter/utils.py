@@ -3,7 +3,7 @@ Utility functions untuk Money Splitter application
 """
 
 import re
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class CurrencyFormatter:
@@ -80,6 +80,109 @@ class CurrencyFormatter:
         except (ValueError, OverflowError):
             return None
     
+    @staticmethod
+    def format_live(text: str, caret: int) -> Tuple[str, int]:
+        """
+        Format isi field input saat diketik, dengan posisi kursor dipertahankan.
+        
+        Semua karakter non-digit dibuang dan digit dikelompokkan per tiga dengan
+        titik. Kursor ditempatkan setelah digit yang sama seperti sebelum format
+        (dihitung dari jumlah digit di kiri kursor), sehingga mengetik atau
+        menghapus di tengah angka tidak membuat kursor melompat ke akhir.
+        Tidak memakai int(), sehingga angka sepanjang apa pun tetap diformat.
+        
+        Args:
+            text: Isi field saat ini
+            caret: Posisi kursor (indeks karakter) di text
+            
+        Returns:
+            Tuple (teks terformat, posisi kursor baru)
+            
+        Examples:
+            >>> CurrencyFormatter.format_live("1.0000", 6)
+            ('10.000', 6)
+            >>> CurrencyFormatter.format_live("1.50.000", 4)
+            ('150.000', 3)
+        """
+        digits = re.sub(r'\D', '', text)
+        digits_before = len(re.sub(r'\D', '', text[:caret]))
+        
+        # Nol di depan dibuang (seperti int()), kecuali angka 0 itu sendiri
+        stripped = digits.lstrip('0') or digits[:1]
+        digits_before = max(0, digits_before - (len(digits) - len(stripped)))
+        if not stripped:
+            return "", 0
+        
+        head = len(stripped) % 3 or 3
+        groups = [stripped[:head]]
+        groups.extend(stripped[i:i + 3] for i in range(head, len(stripped), 3))
+        
+        # Jumlah titik sebelum digit ke-n = jumlah batas grup yang dilewati
+        separators = 1 + (digits_before - head - 1) // 3 if digits_before > head else 0
+        return ".".join(groups), digits_before + separators
+    
+    @staticmethod
+    def parse_pasted(text: str) -> Optional[int]:
+        """
+        Parse teks dari clipboard sekaligus menjadi satu amount.
+        
+        Berbeda dengan parse_input, teks tempelan sering berisi label, baris
+        baru, spasi pemisah ribuan atau desimal (misalnya
+        "Total: Rp 1.500.000,00\n"). Amount
+        pertama di teks diambil dan bagian desimal satu atau dua digit di akhir
+        (",00" atau ".50") dibuang, bukan digabung ke angka.
+        
+        Args:
+            text: Teks dari clipboard
+            
+        Returns:
+            Integer amount atau None jika tidak ada angka
+            
+        Examples:
+            >>> CurrencyFormatter.parse_pasted("Total: Rp 1.500.000,00")
+            1500000
+            >>> CurrencyFormatter.parse_pasted("1,250,000.50 IDR")
+            1250000
+        """
+        if not isinstance(text, str):
+            return None
+        # Pemisah ribuan bisa titik, koma atau spasi (termasuk non-breaking space)
+        match = re.search(r'(-?)(\d(?:[\d.,]|[ \u00a0](?=\d{3}(?!\d)))*)', text)
+        if not match:
+            return None
+        
+        number = re.sub(r'[.,]\d{1,2}$', '', match.group(2).rstrip('.,'))
+        try:
+            result = int(re.sub(r'\D', '', number))
+        except ValueError:  # Melebihi batas digit konversi int
+            return None
+        return -result if match.group(1) else result
+    
+    @staticmethod
+    def diff_span(old: str, new: str) -> Tuple[int, int, str]:
+        """
+        Rentang minimal yang harus diganti agar old menjadi new.
+        
+        Dipakai field input agar hanya karakter yang berubah (biasanya satu
+        titik pemisah) yang dihapus/disisipkan, bukan seluruh isi field.
+        
+        Args:
+            old: Teks lama
+            new: Teks baru
+            
+        Returns:
+            Tuple (start, end, replacement): ganti old[start:end] dengan replacement
+        """
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start] == new[start]:
+            start += 1
+        old_end, new_end = len(old), len(new)
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        return start, old_end, new[start:new_end]
+    
     @staticmethod
     def format_with_percentage(amount: int, total: int) -> str:
         """
@@ -201,4 +304,73 @@ class ValidationUtils:
         Returns:
             True jika amount dalam range wajar
         """
-        return 0 <= amount <= max_amount
\ No newline at end of file
+        return 0 <= amount <= max_amount
+    
+    @staticmethod
+    def get_split_bounds(amount: int, num_parts: int) -> Tuple[int, int]:
+        """
+        Batas bawah dan atas yang wajar untuk setiap bagian (5% - 40% dari total).
+        
+        Untuk 2 bagian batas 40% tidak mungkin dipenuhi, sehingga batas atasnya
+        dilonggarkan menjadi 60%.
+        
+        Args:
+            amount: Total jumlah yang dibagi
+            num_parts: Jumlah bagian
+            
+        Returns:
+            Tuple (min_part, max_part) dalam integer, inklusif
+        """
+        max_percent = 60 if num_parts == 2 else 40
+        return -(-amount * 5 // 100), amount * max_percent // 100
+    
+    @staticmethod
+    def get_required_thousands(num_parts: int) -> int:
+        """
+        Jumlah minimal bagian yang harus berakhir dengan 000 (ribuan).
+        
+        Minimal setengah (dan minimal 3), tetapi selalu menyisakan satu bagian
+        bebas agar sisa pembagian yang tidak bulat ribuan tetap bisa ditampung.
+        
+        Args:
+            num_parts: Jumlah bagian
+            
+        Returns:
+            Jumlah minimal bagian kelipatan 1000
+        """
+        return min(max(3, (num_parts + 1) // 2), num_parts - 1)
+    
+    @staticmethod
+    def is_natural_split(splits: List[int], amount: int) -> bool:
+        """
+        Validasi apakah hasil pembagian memenuhi semua properti natural.
+        
+        Properti yang dicek: total tepat, tidak ada bagian identik, setiap
+        bagian dalam batas get_split_bounds, tidak ada kelipatan persis
+        1.000.000, preferensi ribuan terpenuhi, dan selisih bagian terbesar
+        dan terkecil minimal 10% dari rata-rata.
+        
+        Args:
+            splits: Daftar bagian hasil pembagian
+            amount: Jumlah asli yang dibagi
+            
+        Returns:
+            True jika semua properti terpenuhi
+        """
+        num_parts = len(splits)
+        if num_parts < 2 or sum(splits) != amount or len(set(splits)) != num_parts:
+            return False
+        
+        min_part, max_part = ValidationUtils.get_split_bounds(amount, num_parts)
+        thousands_count = 0
+        for split in splits:
+            if split < min_part or split > max_part or split % 1000000 == 0:
+                return False
+            if split % 1000 == 0:
+                thousands_count += 1
+        
+        if thousands_count < ValidationUtils.get_required_thousands(num_parts):
+            return False
+        
+        # Selisih min-max minimal 10% dari rata-rata (integer arithmetic)
+        return (max(splits) - min(splits)) * 10 * num_parts >= amount
@@ -0,0 +1,175 @@
+"""
+Engine pembagian berbasis NumPy untuk batch besar (opsional)
+
+Engine ini menggambar dan memperbaiki pembagian untuk seluruh array amount
+sekaligus sebagai operasi matriks (N, num_parts), menggantikan loop Python per
+elemen di _generate_natural_splits, _make_amount_natural dan _balance_splits.
+Baris yang tetap tidak memenuhi properti natural setelah beberapa putaran
+digambar ulang dengan jalur pure-Python milik MoneySplitter.
+
+NumPy bersifat opsional: jika tidak terinstall, HAS_NUMPY bernilai False dan
+MoneySplitter.split_many otomatis memakai jalur pure-Python. NumPy baru
+di-import saat split_matrix pertama kali dipanggil, sehingga import modul ini
+(dan MoneySplitter) tidak membayar biaya startup NumPy.
+"""
+
+import importlib.util
+from typing import TYPE_CHECKING, Sequence
+
+# Cukup cek ketersediaan tanpa meng-import NumPy
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Diisi oleh _load_numpy() saat pertama kali dibutuhkan
+np = None
+
+from .utils import ValidationUtils
+
+if TYPE_CHECKING:
+    from .splitter import MoneySplitter
+
+
+# Variasi maksimal relatif terhadap rata-rata per jumlah bagian, dipilih agar
+# bagian hasil undian sudah berada dalam batas get_split_bounds dan selisih
+# min-max tetap minimal 10% dari rata-rata. Dipakai juga oleh strategi
+# "constructive" di MoneySplitter.
+JITTER = {2: 0.2, 3: 0.2, 4: 0.5, 5: 0.6, 6: 0.6}
+
+# Amount di atas batas ini diproses dengan jalur pure-Python agar perhitungan
+# int64 (termasuk pengecekan selisih min-max) tidak overflow
+MAX_VECTOR_AMOUNT = 10 ** 15
+
+# Jumlah putaran undian ulang untuk baris yang belum valid sebelum fallback
+MAX_ROUNDS = 4
+
+
+def split_matrix(amounts: Sequence[int], num_parts: int,
+                 splitter: "MoneySplitter") -> "np.ndarray":
+    """
+    Bagi seluruh amounts menjadi num_parts bagian sebagai matriks int64
+
+    Args:
+        amounts: Daftar amount yang sudah divalidasi (>= 10.000)
+        num_parts: Jumlah bagian (2-6) untuk setiap amount
+        splitter: MoneySplitter sumber RNG dan jalur fallback pure-Python
+
+    Returns:
+        np.ndarray: Matriks (N, num_parts) dengan setiap baris berjumlah tepat
+        sama dengan amount pada baris tersebut
+
+    Raises:
+        ValueError: Jika ada amount yang tidak muat di int64 (gunakan
+            MoneySplitter.split_many, yang memproses amount itu di jalur
+            pure-Python)
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy diperlukan untuk split_matrix")
+    _load_numpy()
+
+    try:
+        amounts = np.asarray(amounts, dtype=np.int64)
+    except OverflowError:
+        raise ValueError("Amount melebihi int64; gunakan MoneySplitter.split_many") from None
+    parts = np.zeros((len(amounts), num_parts), dtype=np.int64)
+    if len(amounts) == 0:
+        return parts
+
+    # Seed generator NumPy dari RNG splitter agar hasil reproducible
+    rng = np.random.default_rng(splitter.random.getrandbits(64))
+
+    pending = np.flatnonzero(amounts < MAX_VECTOR_AMOUNT)
+    for _ in range(MAX_ROUNDS):
+        if len(pending) == 0:
+            break
+        block = _draw_block(amounts[pending], num_parts, rng)
+        valid = _valid_rows(block, amounts[pending])
+        parts[pending[valid]] = block[valid]
+        pending = pending[~valid]
+
+    # Sisa baris (dan amount yang terlalu besar) memakai jalur pure-Python
+    leftover = np.union1d(pending, np.flatnonzero(amounts >= MAX_VECTOR_AMOUNT))
+    for row in leftover:
+        parts[row] = splitter._generate_splits(int(amounts[row]), num_parts)
+
+    return parts
+
+
+def _load_numpy():
+    """Import NumPy sekali, simpan di global np modul ini dan kembalikan modulnya"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+def _draw_block(amounts: "np.ndarray", num_parts: int, rng: "np.random.Generator") -> "np.ndarray":
+    """
+    Undi satu blok pembagian: variasi acak, pembulatan natural, lalu balancing
+
+    Args:
+        amounts: Array amount (N,)
+        num_parts: Jumlah bagian
+        rng: Generator NumPy
+
+    Returns:
+        np.ndarray: Matriks (N, num_parts) dengan total per baris tepat
+    """
+    rows = len(amounts)
+
+    # Variasi zero-sum: offset berjarak sama (-1..1) dengan urutan acak per
+    # baris, diskalakan acak, plus sedikit noise agar hasil tidak seragam
+    ranks = rng.random((rows, num_parts)).argsort(axis=1).argsort(axis=1)
+    offsets = np.linspace(-1.0, 1.0, num_parts)[ranks]
+    scale = rng.uniform(0.5, 0.9, (rows, 1))
+    noise = offsets * scale + rng.uniform(-0.1, 0.1, (rows, num_parts))
+    noise -= noise.mean(axis=1, keepdims=True)
+    average = amounts.astype(np.float64) / num_parts
+    raw = average[:, None] * (1.0 + JITTER[num_parts] * noise)
+
+    # Urutan acak kedua: kolom dengan rank terakhir menjadi penyeimbang,
+    # kolom dengan rank terkecil wajib bulat ribuan (preferensi ribuan)
+    ranks = rng.random((rows, num_parts)).argsort(axis=1).argsort(axis=1)
+    required = ValidationUtils.get_required_thousands(num_parts)
+
+    # _make_amount_natural: 80% dibulatkan ke ribuan, sisanya ke ratusan
+    thousands = (ranks < required) | (rng.random((rows, num_parts)) < 0.8)
+    unit = np.where(thousands, 1000, 100)
+    parts = (np.rint(raw / unit) * unit).astype(np.int64)
+
+    # Hindari kelipatan persis 1 juta dengan menggeser 50rb - 200rb
+    exact_million = parts % 1000000 == 0
+    if exact_million.any():
+        shift = rng.integers(50, 201, (rows, num_parts)) * 1000
+        sign = np.where(rng.random((rows, num_parts)) < 0.5, 1, -1)
+        parts = np.where(exact_million, parts + sign * shift, parts)
+
+    # _balance_splits: satu kolom per baris menampung seluruh selisih
+    balancer = ranks == num_parts - 1
+    parts[balancer] = 0
+    parts[balancer] = amounts - parts.sum(axis=1)
+    return parts
+
+
+def _valid_rows(parts: "np.ndarray", amounts: "np.ndarray") -> "np.ndarray":
+    """
+    Versi vektor dari ValidationUtils.is_natural_split untuk setiap baris
+
+    Args:
+        parts: Matriks (N, num_parts)
+        amounts: Array amount (N,)
+
+    Returns:
+        np.ndarray: Mask boolean (N,) untuk baris yang valid
+    """
+    num_parts = parts.shape[1]
+    min_part = -(-amounts * 5 // 100)
+    max_part = amounts * (60 if num_parts == 2 else 40) // 100
+
+    ordered = np.sort(parts, axis=1)
+    valid = (np.diff(ordered, axis=1) > 0).all(axis=1)
+    valid &= ordered[:, 0] >= min_part
+    valid &= ordered[:, -1] <= max_part
+    valid &= (parts % 1000000 != 0).all(axis=1)
+    valid &= (parts % 1000 == 0).sum(axis=1) >= ValidationUtils.get_required_thousands(num_parts)
+    valid &= (ordered[:, -1] - ordered[:, 0]) * 10 * num_parts >= amounts
+    return valid
@@ -0,0 +1,223 @@
+"""
+Widget tabel tervirtualisasi untuk batch hasil pembagian
+
+VirtualTable menggambar baris di satu tk.Canvas dan hanya membuat item
+canvas untuk baris yang terlihat. Item-item itu dipakai ulang saat scroll:
+setiap slot layar hanya di-configure ulang jika baris data yang ditunjuknya
+berubah, sehingga biaya scroll dan resize sebanding dengan tinggi viewport,
+bukan jumlah baris. Data cukup berupa sequence (len + indeks), misalnya
+list SplitResult, SplitBatch atau BinaryLogReader; baris diformat hanya saat
+terlihat.
+
+Contoh:
+    table = VirtualTable(parent, RESULT_COLUMNS, format_result_row)
+    table.pack(fill="both", expand=True)
+    table.set_rows(SplitBatch.from_results(results))
+"""
+
+import tkinter as tk
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .utils import CurrencyFormatter
+
+ROW_HEIGHT = 24
+
+# (judul kolom, lebar piksel)
+RESULT_COLUMNS = (("#", 70), ("Jumlah", 150), ("Bagian", 60), ("Rincian", 520))
+PART_COLUMNS = (("#", 50), ("Jumlah", 160), ("Persen", 80))
+
+RowFormatter = Callable[[int, Any], Sequence[str]]
+
+
+def visible_range(offset: float, height: int, row_height: int, total: int) -> Tuple[int, int]:
+    """
+    Rentang baris yang (sebagian) terlihat
+
+    Args:
+        offset: Posisi scroll dalam piksel dari atas baris pertama
+        height: Tinggi viewport dalam piksel
+        row_height: Tinggi satu baris
+        total: Jumlah baris data
+
+    Returns:
+        Tuple[int, int]: (indeks baris pertama, jumlah baris terlihat)
+    """
+    if total <= 0 or height <= 0:
+        return 0, 0
+    first = max(0, min(int(offset // row_height), total - 1))
+    last = min(total, int((offset + height - 1) // row_height) + 1)
+    return first, last - first
+
+
+def format_result_row(index: int, result) -> Tuple[str, str, str, str]:
+    """Baris tabel batch: nomor, amount, jumlah bagian dan rincian bagian"""
+    splits = result.splits
+    return (
+        str(index + 1),
+        CurrencyFormatter.format_rupiah(result.original_amount),
+        str(len(splits)),
+        " | ".join(CurrencyFormatter.format_rupiah(split) for split in splits),
+    )
+
+
+def format_part_row(index: int, part) -> Tuple[str, str, str]:
+    """Baris tabel bagian: nomor, amount dan persentase (SplitPart)"""
+    return (str(part.index + 1), CurrencyFormatter.format_rupiah(part.amount),
+            f"{part.percentage:.1f}%")
+
+
+class VirtualTable(tk.Frame):
+    """Tabel read-only yang hanya membuat item canvas untuk baris terlihat"""
+
+    def __init__(self, master, columns: Sequence[Tuple[str, int]],
+                 formatter: RowFormatter, row_height: int = ROW_HEIGHT,
+                 background: str = "white", foreground: str = "black",
+                 stripe: str = "#f2f2f2", header_background: str = "#e0e0e0",
+                 font=None, **kwargs):
+        """
+        Args:
+            master: Widget induk
+            columns: (judul, lebar piksel) per kolom
+            formatter: formatter(indeks, item) -> teks per kolom
+            row_height: Tinggi baris dalam piksel
+            background, foreground, stripe, header_background: Warna tabel
+            font: Font teks (default font Tk)
+        """
+        super().__init__(master, background=background, **kwargs)
+        self.columns = list(columns)
+        self.formatter = formatter
+        self.row_height = row_height
+        self.colors = {"background": background, "foreground": foreground, "stripe": stripe}
+        self.font = font
+        self.rows: Sequence[Any] = ()
+        self.offset = 0.0
+        # Slot layar: (rect, [text per kolom]) dan indeks data yang sedang ditampilkan
+        self._slots: List[Tuple[int, List[int]]] = []
+        self._slot_rows: List[Optional[int]] = []
+        self._x = []
+        x = 0
+        for _, width in self.columns:
+            self._x.append(x + 6)
+            x += width
+        self._width = x
+
+        self.header = tk.Canvas(self, height=row_height, background=header_background,
+                                highlightthickness=0)
+        for (title, _), text_x in zip(self.columns, self._x):
+            self.header.create_text(text_x, row_height // 2, text=title, anchor="w",
+                                    fill=foreground, font=font)
+        self.canvas = tk.Canvas(self, background=background, highlightthickness=0,
+                                width=self._width)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda event: self.render())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self._on_wheel)
+
+    def set_rows(self, rows: Sequence[Any]) -> None:
+        """Ganti data tabel (tidak disalin) dan kembali ke baris pertama"""
+        self.rows = rows
+        self.offset = 0.0
+        self._slot_rows = [None] * len(self._slots)
+        self.render()
+
+    def refresh(self) -> None:
+        """Gambar ulang semua baris terlihat, misalnya setelah data berubah di tempat"""
+        self._slot_rows = [None] * len(self._slots)
+        self.render()
+
+    def see(self, index: int) -> None:
+        """Scroll seminimal mungkin agar baris index terlihat"""
+        top = index * self.row_height
+        height = self.canvas.winfo_height()
+        if top < self.offset:
+            self._scroll_to(top)
+        elif top + self.row_height > self.offset + height:
+            self._scroll_to(top + self.row_height - height)
+
+    def yview(self, *args) -> None:
+        """Handler perintah scrollbar ("moveto", fraksi) atau ("scroll", n, unit)"""
+        if not args:
+            return
+        height = self.canvas.winfo_height()
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * self._content_height())
+        elif args[0] == "scroll":
+            step = height if args[2] == "pages" else self.row_height
+            self._scroll_to(self.offset + int(args[1]) * step)
+
+    def render(self) -> None:
+        """Posisikan dan isi slot untuk baris yang terlihat"""
+        height = self.canvas.winfo_height()
+        first, count = visible_range(self.offset, height, self.row_height, len(self.rows))
+        self._ensure_slots(count)
+        shift = first * self.row_height - self.offset
+        canvas = self.canvas
+        for slot, (rect, texts) in enumerate(self._slots):
+            index = first + slot
+            if slot >= count:
+                if self._slot_rows[slot] is not None:
+                    self._slot_rows[slot] = None
+                    canvas.itemconfigure(rect, state="hidden")
+                    for text in texts:
+                        canvas.itemconfigure(text, state="hidden")
+                continue
+            y = shift + slot * self.row_height
+            canvas.coords(rect, 0, y, self._width, y + self.row_height)
+            for text, x in zip(texts, self._x):
+                canvas.coords(text, x, y + self.row_height / 2)
+            if self._slot_rows[slot] != index:
+                if self._slot_rows[slot] is None:
+                    canvas.itemconfigure(rect, state="normal")
+                    for text in texts:
+                        canvas.itemconfigure(text, state="normal")
+                self._slot_rows[slot] = index
+                stripe = self.colors["stripe"] if index % 2 else self.colors["background"]
+                canvas.itemconfigure(rect, fill=stripe)
+                for text, value in zip(texts, self.formatter(index, self.rows[index])):
+                    canvas.itemconfigure(text, text=value)
+        self._update_scrollbar(height)
+
+    @property
+    def materialized(self) -> int:
+        """Jumlah slot baris yang dibuat (tidak bergantung pada jumlah data)"""
+        return len(self._slots)
+
+    def _ensure_slots(self, count: int) -> None:
+        canvas = self.canvas
+        while len(self._slots) < count:
+            rect = canvas.create_rectangle(0, 0, 0, 0, width=0, state="hidden")
+            texts = [canvas.create_text(0, 0, anchor="w", fill=self.colors["foreground"],
+                                        font=self.font, state="hidden")
+                     for _ in self.columns]
+            self._slots.append((rect, texts))
+            self._slot_rows.append(None)
+
+    def _content_height(self) -> int:
+        return len(self.rows) * self.row_height
+
+    def _scroll_to(self, offset: float) -> None:
+        limit = max(0, self._content_height() - self.canvas.winfo_height())
+        offset = max(0.0, min(float(offset), float(limit)))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def _update_scrollbar(self, height: int) -> None:
+        total = self._content_height()
+        if total <= height or total == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+
+    def _on_wheel(self, event) -> str:
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.yview("scroll", -3, "units")
+        else:
+            self.yview("scroll", 3, "units")
+        return "break"
@@ -15,6 +15,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    py_modules=["main"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
@@ -31,6 +32,9 @@ setup(
         # tkinter is built-in
     ],
     extras_require={
+        "fast": [
+            "numpy>=1.20.0",
+        ],
         "test": [
             "pytest>=7.0.0",
             "hypothesis>=6.0.0",
@@ -0,0 +1,196 @@
+"""
+Unit tests untuk API asyncio (money_splitter.aio)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from money_splitter.aio import AsyncSplitter, split_money_async
+from money_splitter.models import SplitResult
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncSplitter:
+    """Test cases untuk AsyncSplitter"""
+    
+    def test_split_money(self):
+        """Test split_money async menghasilkan pembagian valid"""
+        result = run(AsyncSplitter().split_money(1500000, 5))
+        
+        assert isinstance(result, SplitResult)
+        assert result.is_balanced()
+        assert len(result.splits) == 5
+    
+    def test_split_money_invalid(self):
+        """Test input tidak valid dilempar dari executor"""
+        with pytest.raises(ValueError):
+            run(AsyncSplitter().split_money(500))
+    
+    def test_split_many_keeps_order(self):
+        """Test split_many mengembalikan hasil sesuai urutan input"""
+        amounts = [100000 + i * 7919 for i in range(250)]
+        splitter = AsyncSplitter(chunk_size=16, max_pending=3)
+        results = run(splitter.split_many(amounts, 4))
+        
+        assert [r.original_amount for r in results] == amounts
+        assert all(r.is_balanced() and r.num_parts == 4 for r in results)
+    
+    def test_seed_reproducible(self):
+        """Test seed yang sama menghasilkan pembagian yang sama"""
+        amounts = [200000 + i * 1000 for i in range(100)]
+        
+        def splits():
+            splitter = AsyncSplitter(seed=7, chunk_size=10)
+            return [r.splits for r in run(splitter.split_many(amounts))]
+        
+        assert splits() == splits()
+    
+    def test_iter_split_async_iterable(self):
+        """Test iter_split menerima async iterable"""
+        async def producer():
+            for i in range(50):
+                await asyncio.sleep(0)
+                yield 100000 + i * 1000
+        
+        async def consume():
+            splitter = AsyncSplitter(chunk_size=8)
+            return [r.original_amount async for r in splitter.iter_split(producer(), 3)]
+        
+        assert run(consume()) == [100000 + i * 1000 for i in range(50)]
+    
+    def test_backpressure_bounds_pending(self):
+        """Test jumlah task berjalan tidak melebihi max_pending"""
+        splitter = AsyncSplitter(chunk_size=1, max_pending=2)
+        peak = 0
+        
+        async def watch(task):
+            nonlocal peak
+            while not task.done():
+                peak = max(peak, splitter.pending)
+                await asyncio.sleep(0)
+        
+        async def main():
+            task = asyncio.ensure_future(asyncio.gather(
+                *(splitter.split_money(100000 + i * 1000, 4) for i in range(30))
+            ))
+            await watch(task)
+            return await task
+        
+        results = run(main())
+        assert len(results) == 30
+        assert 1 <= peak <= 2
+        assert splitter.pending == 0
+    
+    def test_iter_split_early_break_releases_slots(self):
+        """Test break dari iter_split tidak membocorkan slot; aclose tetap selesai"""
+        async def main():
+            splitter = AsyncSplitter(chunk_size=2, max_pending=4)
+            amounts = (100000 + i * 1000 for i in range(200))
+            results = splitter.iter_split(amounts, 3)
+            await results.__anext__()
+            # Seperti break di async for lalu generator ditutup
+            await results.aclose()
+            await asyncio.wait_for(splitter.aclose(), timeout=10)
+            return splitter
+        
+        splitter = run(main())
+        assert splitter.pending == 0
+    
+    def test_cancelled_call_keeps_slot_until_executor_done(self):
+        """Test slot baru dilepas setelah pekerjaan executor selesai, bukan saat dibatalkan"""
+        gate = threading.Event()
+        
+        async def main(executor):
+            splitter = AsyncSplitter(executor=executor, max_pending=1)
+            task = asyncio.ensure_future(splitter.split_money(100000, 3))
+            while splitter.pending == 0:
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            held = splitter.pending
+            gate.set()
+            await asyncio.wait_for(splitter.aclose(), timeout=10)
+            return held, splitter.pending
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Worker tunggal ditahan agar task split masih antre saat dibatalkan
+            executor.submit(gate.wait, 10)
+            assert run(main(executor)) == (1, 0)
+    
+    def test_iter_split_bounds_unconsumed_results(self):
+        """Test chunk yang selesai tetapi belum diambil tetap dihitung dalam max_pending"""
+        gate = threading.Event()
+        amounts = [200000 + i * 1000 for i in range(20)]
+        
+        class HeadBlockedExecutor(ThreadPoolExecutor):
+            submitted = 0
+            
+            def submit(self, fn, *args, **kwargs):
+                self.submitted += 1
+                if self.submitted == 1:
+                    def blocked(*args, **kwargs):
+                        gate.wait(10)
+                        return fn(*args, **kwargs)
+                    return super().submit(blocked, *args, **kwargs)
+                return super().submit(fn, *args, **kwargs)
+        
+        async def main(executor):
+            splitter = AsyncSplitter(executor=executor, max_pending=2, chunk_size=1)
+            results = splitter.iter_split(iter(amounts))
+            first = asyncio.ensure_future(results.__anext__())
+            await asyncio.sleep(0.2)
+            submitted = executor.submitted
+            gate.set()
+            head = await first
+            rest = [result async for result in results]
+            return submitted, [head] + rest
+        
+        with HeadBlockedExecutor(max_workers=4) as executor:
+            submitted, results = run(main(executor))
+        
+        assert submitted == 2
+        assert [r.original_amount for r in results] == amounts
+    
+    def test_custom_executor(self):
+        """Test executor milik pemanggil dipakai"""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="split") as executor:
+            splitter = AsyncSplitter(executor=executor, strategy="constructive")
+            results = run(splitter.split_many([100000, 250000, 1000000], 3))
+        
+        assert all(r.is_balanced() for r in results)
+    
+    def test_async_context_manager(self):
+        """Test async with menunggu semua task selesai"""
+        async def main():
+            async with AsyncSplitter(max_pending=4) as splitter:
+                tasks = [asyncio.ensure_future(splitter.split_money(100000, 2)) for _ in range(8)]
+            assert splitter.pending == 0
+            return await asyncio.gather(*tasks)
+        
+        assert len(run(main())) == 8
+    
+    def test_invalid_arguments(self):
+        """Test argumen konstruktor tidak valid"""
+        with pytest.raises(ValueError):
+            AsyncSplitter(max_pending=0)
+        with pytest.raises(ValueError):
+            AsyncSplitter(chunk_size=0)
+        with pytest.raises(ValueError):
+            AsyncSplitter(rng=object())
+
+
+class TestSplitMoneyAsync:
+    """Test cases untuk split_money_async"""
+    
+    def test_default_splitter_across_loops(self):
+        """Test fungsi module-level bisa dipakai dari beberapa event loop"""
+        for amount in (100000, 2500000):
+            result = run(split_money_async(amount, 3))
+            assert result.original_amount == amount
+            assert result.is_balanced()
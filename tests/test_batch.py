@@ -0,0 +1,139 @@
+"""
+Unit tests untuk container kolumnar SplitBatch (money_splitter.batch)
+"""
+
+from array import array
+from datetime import datetime
+
+import pytest
+from money_splitter import batch as batch_module
+from money_splitter.batch import SplitBatch
+from money_splitter.models import CompactSplitResult, SplitResult
+from money_splitter.splitter import MoneySplitter
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    """Jalankan test dengan jalur NumPy (jika ada) dan pure-Python"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch_module, "HAS_NUMPY", False)
+    return request.param
+
+
+def make_results(count=200, seed=3):
+    splitter = MoneySplitter(seed=seed)
+    return splitter.split_many([10000 + i * 7919 for i in range(count)])
+
+
+class TestSplitBatch:
+    """Test cases untuk SplitBatch"""
+    
+    def test_roundtrip_results(self):
+        """Test from_results lalu to_results menghasilkan list yang sama"""
+        results = make_results()
+        batch = SplitBatch.from_results(results)
+        
+        assert len(batch) == len(results)
+        assert batch.to_results() == results
+        assert list(batch) == results
+        assert batch[5] == results[5]
+        assert batch[-1] == results[-1]
+    
+    def test_columns(self):
+        """Test kolom tersimpan sebagai array('q') dengan offsets yang konsisten"""
+        results = make_results(10)
+        batch = SplitBatch.from_results(results)
+        
+        assert isinstance(batch.parts, array) and batch.parts.typecode == "q"
+        assert list(batch.amounts) == [r.original_amount for r in results]
+        assert list(batch.num_parts()) == [r.num_parts for r in results]
+        assert batch.offsets[0] == 0 and batch.offsets[-1] == len(batch.parts)
+        # Satu timestamp split_many dikonversi sekali
+        assert len(set(batch.timestamps)) == 1
+    
+    def test_totals_and_balance(self, engine):
+        """Test get_total dan is_balanced sama dengan per-objek"""
+        results = make_results()
+        batch = SplitBatch.from_results(results)
+        
+        assert list(batch.get_total()) == [r.get_total() for r in results]
+        assert batch.is_balanced() == [r.is_balanced() for r in results]
+        assert batch.all_balanced()
+    
+    def test_percentages_match_split_result(self, engine):
+        """Test get_percentages identik dengan SplitResult.get_percentages"""
+        results = make_results()
+        batch = SplitBatch.from_results(results)
+        percentages = batch.get_percentages()
+        
+        expected = [p for r in results for p in r.get_percentages()]
+        assert list(percentages) == expected
+        start, end = batch.offsets[7], batch.offsets[8]
+        assert list(percentages[start:end]) == results[7].get_percentages()
+    
+    def test_unbalanced_rows_detected(self, engine):
+        """Test baris yang tidak balance terdeteksi"""
+        batch = SplitBatch.from_results(make_results(5))
+        batch.parts[0] += 1000
+        
+        assert batch.is_balanced() == [False, True, True, True, True]
+        assert not batch.all_balanced()
+    
+    def test_large_amounts_use_exact_arithmetic(self, engine):
+        """Test amount besar (di atas batas int64 NumPy) tetap benar"""
+        amount = 10 ** 18
+        result = SplitResult(original_amount=amount, splits=[amount // 4, amount - amount // 4],
+                             num_parts=2, timestamp=datetime.now())
+        batch = SplitBatch.from_results([result])
+        
+        assert list(batch.get_percentages()) == result.get_percentages()
+        assert batch.is_balanced() == [True]
+    
+    def test_extend(self):
+        """Test batch bisa dibangun per chunk"""
+        results = make_results(30)
+        batch = SplitBatch()
+        batch.extend(results[:10])
+        batch.extend(results[10:])
+        
+        assert batch.to_results() == results
+    
+    def test_from_compact_results(self):
+        """Test CompactSplitResult bisa dimasukkan langsung"""
+        results = make_results(20)
+        compact = [CompactSplitResult.from_result(r) for r in results]
+        
+        assert SplitBatch.from_results(compact).to_results() == results
+    
+    def test_from_matrix(self):
+        """Test batch dari matriks num_parts seragam"""
+        moment = datetime(2024, 1, 1, 12, 0)
+        batch = SplitBatch.from_matrix([100000, 200000], [[40000, 60000], [150000, 50000]], moment)
+        
+        assert list(batch.offsets) == [0, 2, 4]
+        assert batch[1].splits == [150000, 50000]
+        assert batch[1].timestamp == moment
+        assert SplitBatch.from_matrix([], []).to_results() == []
+        with pytest.raises(ValueError):
+            SplitBatch.from_matrix([100000], [[50000, 50000], [1, 2]])
+    
+    def test_empty_batch(self, engine):
+        """Test batch kosong"""
+        batch = SplitBatch()
+        
+        assert len(batch) == 0
+        assert list(batch.get_total()) == []
+        assert list(batch.get_percentages()) == []
+        assert batch.is_balanced() == []
+    
+    def test_inconsistent_columns(self):
+        """Test kolom dengan panjang tidak konsisten ditolak"""
+        with pytest.raises(ValueError):
+            SplitBatch(array("q", [100000]), array("q", [0, 2]), array("q", [1]), array("q", [0]))
+    
+    def test_index_out_of_range(self):
+        """Test indeks di luar jangkauan"""
+        with pytest.raises(IndexError):
+            SplitBatch.from_results(make_results(2))[2]
@@ -0,0 +1,112 @@
+"""
+Unit tests untuk log biner append-only (money_splitter.binlog)
+"""
+
+from datetime import datetime
+
+import pytest
+from money_splitter.binlog import HEADER, BinaryLogReader, BinaryLogWriter
+from money_splitter.models import SplitResult
+from money_splitter.splitter import MoneySplitter
+
+
+def make_results(count=50, seed=5):
+    splitter = MoneySplitter(seed=seed)
+    return splitter.split_many([10000 + i * 7919 for i in range(count)])
+
+
+class TestBinaryLog:
+    """Test cases untuk BinaryLogWriter dan BinaryLogReader"""
+    
+    def test_roundtrip(self, tmp_path):
+        """Test semua hasil terbaca kembali utuh dan berurutan"""
+        path = tmp_path / "audit.splitlog"
+        results = make_results()
+        with BinaryLogWriter(path) as log:
+            assert log.extend(results) == len(results)
+        
+        with BinaryLogReader(path) as log:
+            assert len(log) == len(results)
+            assert list(log) == results
+    
+    def test_random_access(self, tmp_path):
+        """Test akses acak per indeks, termasuk indeks negatif"""
+        path = tmp_path / "audit.splitlog"
+        results = make_results()
+        with BinaryLogWriter(path) as log:
+            log.extend(results)
+        
+        with BinaryLogReader(path) as log:
+            assert log[17] == results[17]
+            assert log[-1] == results[-1]
+            with pytest.raises(IndexError):
+                log[len(results)]
+    
+    def test_append_across_writers(self, tmp_path):
+        """Test writer kedua menambah record di akhir file"""
+        path = tmp_path / "audit.splitlog"
+        results = make_results(10)
+        with BinaryLogWriter(path) as log:
+            assert log.append(results[0]) == 0
+        with BinaryLogWriter(path) as log:
+            assert log.count == 1
+            log.extend(results[1:])
+        
+        with BinaryLogReader(path) as log:
+            assert list(log) == results
+    
+    def test_columns_and_records(self, tmp_path):
+        """Test kolom zero-copy dan scan tuple mentah"""
+        path = tmp_path / "audit.splitlog"
+        timestamp = datetime(2024, 1, 1, 8, 30)
+        results = [SplitResult(original_amount=amount, splits=[amount - 1, 1], num_parts=2,
+                               timestamp=timestamp) for amount in (100, 200, 300)]
+        with BinaryLogWriter(path) as log:
+            log.extend(results)
+        
+        with BinaryLogReader(path) as log:
+            amounts = log.amounts
+            assert amounts.tolist() == [100, 200, 300]
+            assert len(set(log.timestamps.tolist())) == 1
+            amounts.release()
+            assert next(log.records()) == (100, log.timestamps[0], [99, 1])
+    
+    def test_truncated_record_is_ignored_and_repaired(self, tmp_path):
+        """Test record terakhir yang terpotong diabaikan reader dan dibuang writer"""
+        path = tmp_path / "audit.splitlog"
+        results = make_results(5)
+        with BinaryLogWriter(path) as log:
+            log.extend(results)
+        with open(path, "ab") as file:
+            file.write(b"\x01\x02\x03")
+        
+        with BinaryLogReader(path) as log:
+            assert list(log) == results
+        with BinaryLogWriter(path) as log:
+            log.append(results[0])
+        with BinaryLogReader(path) as log:
+            assert list(log) == results + [results[0]]
+    
+    def test_empty_log(self, tmp_path):
+        """Test log tanpa record"""
+        path = tmp_path / "audit.splitlog"
+        BinaryLogWriter(path).close()
+        assert path.stat().st_size == HEADER.size
+        with BinaryLogReader(path) as log:
+            assert len(log) == 0
+            assert list(log) == []
+    
+    def test_rejects_invalid_input(self, tmp_path):
+        """Test file asing dan hasil dengan terlalu banyak bagian ditolak"""
+        foreign = tmp_path / "foreign.bin"
+        foreign.write_bytes(b"bukan log biner split")
+        with pytest.raises(ValueError):
+            BinaryLogReader(foreign)
+        with pytest.raises(ValueError):
+            BinaryLogWriter(foreign)
+        
+        path = tmp_path / "audit.splitlog"
+        with BinaryLogWriter(path, max_parts=2) as log:
+            with pytest.raises(ValueError, match="max_parts"):
+                log.extend(make_results(3))
+            assert log.count == 0
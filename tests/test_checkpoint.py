@@ -0,0 +1,102 @@
+"""
+Unit tests untuk checkpoint batch (money_splitter.checkpoint)
+"""
+
+import pytest
+from money_splitter import cli
+from money_splitter.checkpoint import Checkpoint, CheckpointMismatch
+from money_splitter.splitter import MoneySplitter
+
+
+class TestCheckpoint:
+    """Test cases untuk Checkpoint"""
+    
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test checkpoint tersimpan dan terbaca kembali tanpa file sementara"""
+        path = tmp_path / "job.ckpt"
+        state = list(MoneySplitter(seed=1).get_rng_state())
+        Checkpoint(lines_read=10, records_written=9, output_bytes=512,
+                   rng_state=state, options={"seed": 1}).save(path)
+        
+        loaded = Checkpoint.load(path)
+        assert loaded.lines_read == 10
+        assert loaded.records_written == 9
+        assert loaded.output_bytes == 512
+        assert loaded.options == {"seed": 1}
+        assert list(tmp_path.iterdir()) == [path]
+    
+    def test_check_options_mismatch(self):
+        """Test opsi batch yang berbeda ditolak"""
+        checkpoint = Checkpoint(lines_read=0, records_written=0, output_bytes=0,
+                                rng_state=[], options={"seed": 1, "parts": 5})
+        checkpoint.check_options({"seed": 1, "parts": 5})
+        with pytest.raises(CheckpointMismatch, match="parts"):
+            checkpoint.check_options({"seed": 1, "parts": 6})
+    
+    def test_unsupported_version(self, tmp_path):
+        """Test versi checkpoint yang tidak dikenal ditolak"""
+        path = tmp_path / "job.ckpt"
+        path.write_text('{"version": 99}', encoding="utf-8")
+        with pytest.raises(ValueError):
+            Checkpoint.load(path)
+
+
+class TestResume:
+    """Test cases untuk resume batch CLI dari checkpoint"""
+    
+    def run_split(self, source, target, *extra):
+        return cli.main(["split", str(source), "-o", str(target), "--seed", "7",
+                         "--chunk-size", "10", *extra])
+    
+    @pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+    def test_resume_is_byte_identical(self, tmp_path, monkeypatch, output_format):
+        """Test batch yang crash lalu dilanjutkan menghasilkan output identik"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("".join(f"{100000 + i * 7919}\n" for i in range(95)), encoding="utf-8")
+        reference = tmp_path / "reference.out"
+        output = tmp_path / "resumed.out"
+        checkpoint = tmp_path / "job.ckpt"
+        
+        assert self.run_split(source, reference, "-f", output_format) == 0
+        
+        # Simulasikan crash pada chunk ke-4
+        original = MoneySplitter.split_many
+        calls = []
+        
+        def crashing_split_many(splitter, *args, **kwargs):
+            calls.append(1)
+            if len(calls) == 4:
+                raise KeyboardInterrupt
+            return original(splitter, *args, **kwargs)
+        
+        monkeypatch.setattr(MoneySplitter, "split_many", crashing_split_many)
+        with pytest.raises(KeyboardInterrupt):
+            self.run_split(source, output, "-f", output_format, "--checkpoint", str(checkpoint))
+        monkeypatch.undo()
+        
+        assert Checkpoint.load(checkpoint).lines_read == 30
+        with open(output, "a", encoding="utf-8") as fh:
+            fh.write("sisa tulisan sebelum crash")
+        
+        assert self.run_split(source, output, "-f", output_format, "--checkpoint", str(checkpoint)) == 0
+        assert output.read_bytes() == reference.read_bytes()
+        assert not checkpoint.exists()
+    
+    def test_resume_with_different_options_fails(self, tmp_path, capsys):
+        """Test resume dengan opsi berbeda ditolak"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("1500000\n", encoding="utf-8")
+        checkpoint = tmp_path / "job.ckpt"
+        Checkpoint(lines_read=0, records_written=0, output_bytes=0,
+                   rng_state=list(MoneySplitter(seed=1).get_rng_state()),
+                   options={"seed": 1}).save(checkpoint)
+        
+        assert self.run_split(source, tmp_path / "out.jsonl", "--checkpoint", str(checkpoint)) == 1
+        assert "opsi berbeda" in capsys.readouterr().err
+    
+    def test_checkpoint_requires_output_file(self, tmp_path, capsys):
+        """Test checkpoint tidak bisa dipakai dengan output stdout"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("1500000\n", encoding="utf-8")
+        assert cli.main(["split", str(source), "--checkpoint", str(tmp_path / "job.ckpt")]) == 1
+        assert "--output" in capsys.readouterr().err
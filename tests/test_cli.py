@@ -0,0 +1,149 @@
+"""
+Unit tests untuk CLI headless (money_splitter.cli)
+"""
+
+import csv
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from money_splitter import cli
+from money_splitter.splitter import MoneySplitter
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class CountingStream(io.StringIO):
+    """StringIO yang menghitung jumlah flush"""
+    
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+    
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestReadAmounts:
+    """Test cases untuk parsing input baris per baris"""
+    
+    def test_parses_supported_formats(self):
+        """Test format angka biasa, titik ribuan dan prefix Rp"""
+        lines = ["1500000\n", "1.500.000\n", "Rp 2.750.000\n", "\n", "   \n"]
+        assert list(cli.read_amounts(lines)) == [1500000, 1500000, 2750000]
+    
+    def test_invalid_line_raises_with_line_number(self):
+        """Test baris tidak valid menghentikan proses dengan nomor baris"""
+        with pytest.raises(cli.InputError, match="Baris 2"):
+            list(cli.read_amounts(["1500000", "5000", "2000000"]))
+    
+    def test_skip_invalid_reports_to_errors(self):
+        """Test skip_invalid melewati baris tidak valid dan melaporkannya"""
+        errors = io.StringIO()
+        amounts = list(cli.read_amounts(["abc", "1500000", "-20000"], skip_invalid=True, errors=errors))
+        assert amounts == [1500000]
+        assert "Baris 1" in errors.getvalue()
+        assert "Baris 3" in errors.getvalue()
+    
+    def test_is_lazy(self):
+        """Test input dibaca secara lazy (tidak dibaca sekaligus)"""
+        consumed = []
+        
+        def lines():
+            for value in ["1000000", "2000000", "3000000"]:
+                consumed.append(value)
+                yield value
+        
+        iterator = cli.read_amounts(lines())
+        assert next(iterator) == 1000000
+        assert consumed == ["1000000"]
+
+
+class TestStreamSplits:
+    """Test cases untuk stream_splits"""
+    
+    def setup_method(self):
+        """Setup untuk setiap test"""
+        self.splitter = MoneySplitter()
+        self.splitter.random.seed(42)
+    
+    def test_jsonl_output(self):
+        """Test setiap baris output adalah JSON valid dengan total tepat"""
+        output = io.StringIO()
+        written = cli.stream_splits(["1500000", "2750000", "980000"], output, self.splitter, num_parts=4)
+        
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert written == 3
+        assert [r["amount"] for r in records] == [1500000, 2750000, 980000]
+        for record in records:
+            assert record["num_parts"] == 4
+            assert sum(record["splits"]) == record["amount"]
+            assert "timestamp" not in record
+    
+    def test_jsonl_timestamp_opt_in(self):
+        """Test timestamp hanya ditulis jika diminta"""
+        output = io.StringIO()
+        cli.stream_splits(["1500000"], output, self.splitter, timestamp=True)
+        assert "timestamp" in json.loads(output.getvalue())
+    
+    def test_csv_output(self):
+        """Test output CSV dengan header dan kolom split yang dikosongkan"""
+        output = io.StringIO()
+        cli.stream_splits(["1500000", "980000"], output, self.splitter, num_parts=3, output_format="csv")
+        
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert len(rows) == 2
+        for row in rows:
+            splits = [int(row[f"split_{i}"]) for i in range(1, 4)]
+            assert sum(splits) == int(row["amount"])
+            assert row["split_4"] == row["split_5"] == row["split_6"] == ""
+    
+    def test_flushes_per_chunk(self):
+        """Test output di-flush per chunk sehingga memori tetap terbatas"""
+        output = CountingStream()
+        amounts = [str(100000 + i * 1000) for i in range(25)]
+        written = cli.stream_splits(amounts, output, self.splitter, chunk_size=10)
+        
+        assert written == 25
+        assert output.flushes >= 3
+        assert len(output.getvalue().splitlines()) == 25
+
+
+class TestMain:
+    """Test cases untuk entry point CLI"""
+    
+    def test_split_file_to_file(self, tmp_path):
+        """Test subcommand split membaca file dan menulis file output"""
+        source = tmp_path / "amounts.txt"
+        target = tmp_path / "splits.jsonl"
+        source.write_text("1500000\n2750000\n", encoding="utf-8")
+        
+        assert cli.main(["split", str(source), "-o", str(target), "--parts", "5"]) == 0
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert all(len(json.loads(line)["splits"]) == 5 for line in lines)
+    
+    def test_invalid_input_exit_code(self, tmp_path, capsys):
+        """Test input tidak valid menghasilkan exit code 1 dan pesan error"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("1500000\nabc\n", encoding="utf-8")
+        
+        assert cli.main(["split", str(source), "-o", str(tmp_path / "out.jsonl")]) == 1
+        assert "Baris 2" in capsys.readouterr().err
+    
+    def test_does_not_import_gui(self, tmp_path):
+        """Test CLI berjalan headless tanpa tkinter/customtkinter"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("1500000\n", encoding="utf-8")
+        code = (
+            "import sys, main; "
+            f"main.main(['split', {str(source)!r}, '-o', {str(tmp_path / 'out.jsonl')!r}]); "
+            "print(sorted({'tkinter', 'customtkinter'} & set(sys.modules)))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert completed.stdout.strip() == "[]"
@@ -0,0 +1,266 @@
+"""
+Unit tests untuk protokol biner, daemon Unix socket dan client
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+from money_splitter import protocol
+from money_splitter.protocol import ProtocolError
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="butuh Unix domain socket")
+
+
+@pytest.fixture
+def daemon():
+    """Jalankan SplitDaemon di thread terpisah, yield daemon"""
+    from money_splitter.daemon import SplitDaemon
+    
+    # Path Unix socket dibatasi ~100 karakter, jadi tidak memakai tmp_path
+    directory = tempfile.mkdtemp(prefix="ms-")
+    instance = SplitDaemon(os.path.join(directory, "d.sock"), seed=1)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(instance.start())
+        started.set()
+        loop.run_forever()
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(5)
+    try:
+        yield instance
+    finally:
+        asyncio.run_coroutine_threadsafe(instance.shutdown(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+        shutil.rmtree(directory)
+
+
+class TestProtocol:
+    """Test cases untuk encode/decode frame"""
+    
+    def test_request_roundtrip(self):
+        """Test request di-encode dan di-decode kembali"""
+        frame = protocol.encode_request(7, 1500000, 5, seed=42)
+        (length,) = protocol.LENGTH.unpack_from(frame)
+        
+        assert length == protocol.REQUEST.size == len(frame) - protocol.LENGTH.size
+        assert protocol.decode_request(frame[4:]) == (7, 1500000, 5, 42)
+    
+    def test_request_without_seed_and_parts(self):
+        """Test num_parts dan seed opsional menjadi None"""
+        frame = protocol.encode_request(1, 200000)
+        assert protocol.decode_request(frame[4:]) == (1, 200000, None, None)
+    
+    def test_seed_zero_is_kept(self):
+        """Test seed 0 dibedakan dari tanpa seed"""
+        frame = protocol.encode_request(1, 200000, seed=0)
+        assert protocol.decode_request(frame[4:])[3] == 0
+    
+    def test_response_roundtrip(self):
+        """Test response sukses dan error"""
+        ok = protocol.encode_response(3, [100000, 200000])
+        error = protocol.encode_error(4, protocol.STATUS_INVALID, "tidak valid")
+        
+        assert protocol.decode_response(ok[4:]) == (3, protocol.STATUS_OK, [100000, 200000])
+        assert protocol.decode_response(error[4:]) == (4, protocol.STATUS_INVALID, "tidak valid")
+    
+    def test_default_socket_path_uses_xdg_runtime_dir(self, monkeypatch, tmp_path):
+        """Test socket default berada di $XDG_RUNTIME_DIR jika ada"""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        
+        assert protocol.default_socket_path() == str(tmp_path / "money-splitter.sock")
+    
+    def test_default_socket_path_private_directory(self, monkeypatch, tmp_path):
+        """Test tanpa XDG_RUNTIME_DIR socket berada di direktori 0700 per user"""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        
+        path = protocol.default_socket_path()
+        directory = os.path.dirname(path)
+        
+        assert directory == str(tmp_path / f"money-splitter-{os.getuid()}")
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+        assert protocol.default_socket_path() == path
+    
+    def test_default_socket_path_rejects_shared_directory(self, monkeypatch, tmp_path):
+        """Test direktori per user yang bisa diakses user lain ditolak"""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        directory = tmp_path / f"money-splitter-{os.getuid()}"
+        directory.mkdir()
+        directory.chmod(0o777)
+        
+        with pytest.raises(OSError):
+            protocol.default_socket_path()
+    
+    def test_invalid_frames(self):
+        """Test frame dengan ukuran salah ditolak"""
+        with pytest.raises(ProtocolError):
+            protocol.decode_request(b"\x00" * 5)
+        with pytest.raises(ProtocolError):
+            protocol.decode_response(protocol.encode_response(1, [1, 2])[4:-1])
+        with pytest.raises(ValueError):
+            protocol.encode_request(1, -5)
+
+
+class TestDaemonClient:
+    """Test cases untuk DaemonClient terhadap SplitDaemon"""
+    
+    def test_split(self, daemon):
+        """Test satu request menghasilkan pembagian valid"""
+        from money_splitter.client import DaemonClient
+        
+        with DaemonClient(daemon.path) as client:
+            result = client.split(1500000, 5)
+        
+        assert result.is_balanced()
+        assert result.num_parts == 5
+    
+    def test_seed_is_reproducible(self, daemon):
+        """Test seed yang sama menghasilkan pembagian yang sama"""
+        from money_splitter.client import DaemonClient
+        
+        with DaemonClient(daemon.path) as client:
+            first = client.split(2500000, 4, seed=99).splits
+            client.split(700000)  # request tanpa seed di antaranya
+            second = client.split(2500000, 4, seed=99).splits
+        
+        assert first == second
+    
+    def test_pipelined_split_many(self, daemon):
+        """Test split_many pipelined mengembalikan hasil sesuai urutan"""
+        from money_splitter.client import DaemonClient
+        
+        amounts = [100000 + i * 997 for i in range(500)]
+        with DaemonClient(daemon.path) as client:
+            results = client.split_many(amounts, 3, window=64)
+        
+        assert [r.original_amount for r in results] == amounts
+        assert all(r.is_balanced() and r.num_parts == 3 for r in results)
+        assert daemon.requests == 500
+    
+    def test_large_window_does_not_deadlock(self, daemon):
+        """Test jendela lebih besar dari buffer socket tetap selesai"""
+        from money_splitter.client import DaemonClient
+        
+        amounts = [1500000] * 20000
+        with DaemonClient(daemon.path, timeout=20) as client:
+            results = client.split_many(amounts, 5, window=len(amounts))
+            assert client.split(300000, 2).is_balanced()
+        
+        assert len(results) == len(amounts)
+        assert all(r.is_balanced() for r in results)
+    
+    def test_invalid_amount_keeps_connection_usable(self, daemon):
+        """Test error per request dilempar sebagai ValueError dan koneksi tetap sinkron"""
+        from money_splitter.client import DaemonClient
+        
+        with DaemonClient(daemon.path) as client:
+            with pytest.raises(ValueError):
+                client.split_many([100000, 500, 200000])
+            with pytest.raises(ValueError):
+                client.split(100000, 9)
+            assert client.split(300000, 2).is_balanced()
+    
+    def test_multiple_connections(self, daemon):
+        """Test beberapa client bersamaan"""
+        from money_splitter.client import DaemonClient
+        
+        clients = [DaemonClient(daemon.path) for _ in range(3)]
+        try:
+            results = [client.split(100000 * (i + 1), 2) for i, client in enumerate(clients)]
+        finally:
+            for client in clients:
+                client.close()
+        
+        assert [r.original_amount for r in results] == [100000, 200000, 300000]
+    
+    def test_oversized_frame_closes_connection(self, daemon):
+        """Test frame lebih besar dari MAX_FRAME_SIZE dijawab error lalu ditutup"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(daemon.path)
+        sock.sendall(protocol.LENGTH.pack(protocol.MAX_FRAME_SIZE + 1))
+        reader = sock.makefile("rb")
+        (length,) = protocol.LENGTH.unpack(reader.read(4))
+        _, status, _ = protocol.decode_response(reader.read(length))
+        
+        assert status == protocol.STATUS_BAD_REQUEST
+        assert reader.read() == b""
+        reader.close()
+        sock.close()
+    
+    def test_refuses_live_socket_and_cleans_up(self, daemon):
+        """Test daemon kedua di path yang sama ditolak"""
+        from money_splitter.daemon import SplitDaemon
+        
+        with pytest.raises(OSError):
+            asyncio.run(SplitDaemon(daemon.path).start())
+    
+    def test_client_without_daemon(self):
+        """Test client gagal jelas jika daemon tidak berjalan"""
+        from money_splitter.client import DaemonClient
+        
+        with pytest.raises(OSError):
+            DaemonClient("/nonexistent/money-splitter.sock")
+
+
+class TestDaemonLifecycle:
+    """Test cases untuk start/shutdown SplitDaemon"""
+    
+    def test_shutdown_removes_socket_and_stale_socket_is_replaced(self):
+        """Test socket dihapus saat shutdown dan socket basi diganti saat start"""
+        from money_splitter.daemon import SplitDaemon
+        
+        directory = tempfile.mkdtemp(prefix="ms-")
+        path = os.path.join(directory, "d.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()  # file socket tertinggal tanpa listener
+        
+        async def main():
+            daemon = SplitDaemon(path)
+            await daemon.start()
+            assert os.path.exists(path)
+            await daemon.shutdown()
+        
+        try:
+            asyncio.run(main())
+            assert not os.path.exists(path)
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestLoadGenerator:
+    """Test cases untuk load generator (money-splitter daemon bench)"""
+    
+    def test_run_client_pipelined(self, daemon):
+        """Test satu klien mengirim semua request dengan pipeline"""
+        from money_splitter.loadgen import run_client
+        
+        latencies = run_client(daemon.path, 50, 16, seed=1)
+        
+        assert len(latencies) == 50
+        assert daemon.requests == 50
+    
+    def test_cli_bench_against_running_daemon(self, daemon, capsys):
+        """Test subcommand daemon bench mencetak satu baris per konfigurasi"""
+        from money_splitter.cli import main
+        
+        code = main(["daemon", "bench", "--socket", daemon.path, "--requests", "40",
+                     "--clients", "1", "2", "--depth", "1", "8", "--spawn", "0"])
+        lines = capsys.readouterr().out.strip().splitlines()
+        
+        assert code == 0
+        assert len(lines) == 3 + 4
+        assert daemon.requests == 40 * 2 + 20 * 2 * 2
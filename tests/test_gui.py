@@ -2,9 +2,12 @@
 Unit tests untuk GUI components
 """
 
+import sys
 import unittest
 import tkinter as tk
+from unittest import mock
 from money_splitter.gui import MoneySpitterGUI
+from money_splitter.jobs import GUI_SWITCH_INTERVAL
 from money_splitter.models import SplitResult
 from money_splitter.utils import CurrencyFormatter
 from datetime import datetime
@@ -15,6 +18,7 @@ class TestMoneySpitterGUI(unittest.TestCase):
     
     def setUp(self):
         """Setup test fixtures"""
+        self.switch_interval = sys.getswitchinterval()
         self.gui = MoneySpitterGUI()
     
     def tearDown(self):
@@ -171,6 +175,19 @@ class TestMoneySpitterGUI(unittest.TestCase):
         # Should show success status
         self.assertEqual(self.gui.status_var.get(), "Pembagian berhasil")
 
+    
+    def test_switch_interval_only_during_run(self):
+        """Test switch interval GIL hanya diubah selama run() dan dikembalikan"""
+        self.assertEqual(sys.getswitchinterval(), self.switch_interval)
+        
+        during = []
+        with mock.patch.object(self.gui.root, "mainloop",
+                               side_effect=lambda: during.append(sys.getswitchinterval())):
+            self.gui.run()
+        
+        self.assertEqual(during, [GUI_SWITCH_INTERVAL])
+        self.assertEqual(sys.getswitchinterval(), self.switch_interval)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
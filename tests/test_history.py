@@ -0,0 +1,219 @@
+"""
+Unit tests untuk riwayat pembagian di SQLite (money_splitter.history)
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from money_splitter import cli
+from money_splitter.checkpoint import Checkpoint
+from money_splitter.history import HistoryStore
+from money_splitter.models import SplitResult
+from money_splitter.splitter import MoneySplitter
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_result(amount, minutes=0, parts=3):
+    splits = [amount // parts] * (parts - 1)
+    splits.append(amount - sum(splits))
+    return SplitResult(original_amount=amount, splits=splits, num_parts=parts,
+                       timestamp=BASE + timedelta(minutes=minutes))
+
+
+@pytest.fixture
+def store(tmp_path):
+    with HistoryStore(tmp_path / "history.db") as history:
+        yield history
+
+
+class TestHistoryStore:
+    """Test cases untuk HistoryStore"""
+    
+    def test_roundtrip(self, store):
+        """Test hasil tersimpan dan terbaca kembali utuh"""
+        result = make_result(1_500_000, parts=5)
+        store.add(result, source="test")
+        
+        page = store.query()
+        assert len(page.entries) == 1
+        assert page.entries[0].result == result
+        assert page.entries[0].source == "test"
+        assert page.next_cursor is None
+    
+    def test_uses_wal(self, store):
+        """Test database memakai journal WAL"""
+        conn = sqlite3.connect(store.path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+    
+    def test_buffer_flushed_per_batch(self, tmp_path):
+        """Test baris ditulis otomatis setiap batch_size dan sisanya saat close"""
+        path = tmp_path / "history.db"
+        history = HistoryStore(path, batch_size=10)
+        history.add_many(make_result(100_000 + i) for i in range(25))
+        
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM split_history").fetchone()[0] == 20
+            history.close()
+            assert conn.execute("SELECT COUNT(*) FROM split_history").fetchone()[0] == 25
+        finally:
+            conn.close()
+    
+    def test_pagination_newest_first(self, store):
+        """Test cursor berhalaman mengembalikan semua baris tanpa duplikat"""
+        store.add_many(make_result(100_000 + i, minutes=i // 3) for i in range(23))
+        
+        amounts, cursor = [], None
+        while True:
+            page = store.query(limit=5, cursor=cursor)
+            amounts.extend(entry.result.original_amount for entry in page.entries)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert amounts == [100_000 + i for i in reversed(range(23))]
+    
+    def test_filters(self, store):
+        """Test filter waktu, amount dan source"""
+        store.add_many([make_result(100_000, 0), make_result(200_000, 10),
+                        make_result(300_000, 20)], source="a")
+        store.add(make_result(400_000, 30), source="b")
+        
+        def amounts(**filters):
+            return [entry.result.original_amount for entry in store.query(**filters).entries]
+        
+        assert amounts(since=BASE + timedelta(minutes=10)) == [400_000, 300_000, 200_000]
+        assert amounts(until=BASE + timedelta(minutes=10)) == [100_000]
+        assert amounts(min_amount=200_000, max_amount=300_000) == [300_000, 200_000]
+        assert amounts(source="b") == [400_000]
+        assert store.count(source="a") == 3
+        assert store.count() == 4
+    
+    def test_seq_is_idempotent(self, store):
+        """Test (source, seq) yang sama tidak tercatat dua kali"""
+        results = [make_result(100_000 + i) for i in range(5)]
+        store.add_many(results, source="job", first_seq=0)
+        store.add_many(results[2:], source="job", first_seq=2)
+        store.add_many(results, source="other", first_seq=0)
+        store.add_many(results)
+        
+        assert store.count(source="job") == 5
+        assert store.count() == 15
+    
+    def test_invalid_arguments(self, store):
+        """Test batch_size, limit dan cursor yang tidak valid ditolak"""
+        with pytest.raises(ValueError):
+            HistoryStore(batch_size=0)
+        with pytest.raises(ValueError):
+            store.query(limit=0)
+        with pytest.raises(ValueError, match="Cursor"):
+            store.query(cursor="bukan-cursor")
+
+    
+    def test_amount_over_int64_rejected(self, store):
+        """Test amount di atas batas INTEGER SQLite ditolak sebelum di-buffer"""
+        huge = make_result(10 ** 19)
+        with pytest.raises(ValueError, match="melebihi"):
+            store.add(huge)
+        with pytest.raises(ValueError, match="melebihi"):
+            store.add_many([make_result(100_000), huge])
+        
+        # Store tetap bisa dipakai; hasil dari add_many yang ditolak tidak tercatat
+        store.add(make_result(200_000))
+        assert store.count() == 1
+    
+    def test_failed_flush_drops_batch(self, tmp_path):
+        """Test batch yang gagal di-insert dibuang dan close tetap menutup koneksi"""
+        path = tmp_path / "history.db"
+        history = HistoryStore(path, batch_size=100)
+        history._conn.execute(
+            "CREATE TRIGGER reject BEFORE INSERT ON split_history WHEN NEW.amount = 123456 "
+            "BEGIN SELECT RAISE(ABORT, 'ditolak'); END")
+        history.add_many([make_result(100_000), make_result(123_456)])
+        with pytest.raises(sqlite3.IntegrityError):
+            history.flush()
+        
+        history.add(make_result(300_000))
+        assert history.count() == 1
+        history.add(make_result(123_456))
+        with pytest.raises(sqlite3.IntegrityError):
+            history.close()
+        assert history._conn is None
+        history.close()
+
+class TestCliHistory:
+    """Test cases untuk opsi --history dan subcommand history"""
+    
+    def test_split_records_history(self, tmp_path, capsys):
+        """Test split --history mencatat setiap hasil dan bisa dibaca subcommand history"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("".join(f"{100000 + i}\n" for i in range(7)), encoding="utf-8")
+        database = tmp_path / "history.db"
+        
+        assert cli.main(["split", str(source), "-o", str(tmp_path / "out.jsonl"),
+                         "--chunk-size", "3", "--history", str(database)]) == 0
+        assert cli.main(["history", str(database), "--limit", "5"]) == 0
+        
+        captured = capsys.readouterr()
+        rows = [json.loads(line) for line in captured.out.splitlines()]
+        assert len(rows) == 5
+        assert all(row["source"] == "cli" and sum(row["splits"]) == row["amount"] for row in rows)
+        cursor = captured.err.split("next_cursor: ")[1].strip()
+        assert cli.main(["history", str(database), "--cursor", cursor]) == 0
+        assert len(capsys.readouterr().out.splitlines()) == 2
+    
+    def test_resume_does_not_duplicate_history(self, tmp_path, monkeypatch):
+        """Test chunk yang diulang saat resume tidak tercatat dua kali"""
+        source = tmp_path / "amounts.txt"
+        source.write_text("".join(f"{100000 + i * 7919}\n" for i in range(25)), encoding="utf-8")
+        database = tmp_path / "history.db"
+        args = ["split", str(source), "-o", str(tmp_path / "out.jsonl"), "--seed", "7",
+                "--chunk-size", "10", "--checkpoint", str(tmp_path / "job.ckpt"),
+                "--history", str(database)]
+        
+        # Crash setelah riwayat chunk kedua di-commit, sebelum checkpoint-nya disimpan
+        original = Checkpoint.save
+        calls = []
+        
+        def crashing_save(self, path):
+            calls.append(path)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            original(self, path)
+        
+        monkeypatch.setattr(Checkpoint, "save", crashing_save)
+        with pytest.raises(KeyboardInterrupt):
+            cli.main(args)
+        monkeypatch.setattr(Checkpoint, "save", original)
+        assert cli.main(args) == 0
+        
+        with HistoryStore(database) as history:
+            assert history.count() == 25
+            rows = history.query(limit=25).entries
+        expected = MoneySplitter(seed=7).split_many([100000 + i * 7919 for i in range(25)])
+        assert sorted(entry.result.splits for entry in rows) == sorted(r.splits for r in expected)
+    
+    def test_split_amount_too_large_for_history(self, tmp_path, capsys):
+        """Test amount di atas int64 dengan --history dilaporkan sebagai error, bukan traceback"""
+        source = tmp_path / "amounts.txt"
+        source.write_text(f"100000\n{10 ** 19}\n", encoding="utf-8")
+        output = tmp_path / "out.jsonl"
+        database = tmp_path / "history.db"
+        
+        assert cli.main(["split", str(source), "-o", str(output), "--chunk-size", "1",
+                         "--history", str(database)]) == 1
+        assert "Riwayat tidak bisa dicatat" in capsys.readouterr().err
+        # Chunk yang ditolak tidak ditulis ke output maupun riwayat
+        assert len(output.read_text(encoding="utf-8").splitlines()) == 1
+        with HistoryStore(database) as history:
+            assert history.count() == 1
+    
+    def test_history_missing_database(self, tmp_path, capsys):
+        """Test subcommand history dengan database yang tidak ada"""
+        assert cli.main(["history", str(tmp_path / "missing.db")]) == 1
+        assert "tidak ditemukan" in capsys.readouterr().err
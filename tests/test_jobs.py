@@ -0,0 +1,167 @@
+"""
+Unit tests untuk job runner thread worker (money_splitter.jobs)
+"""
+
+import threading
+import time
+
+import pytest
+from money_splitter.jobs import (
+    CANCELLED, DONE, FAILED, JobRunner, Speculator, split_job, split_many_job,
+)
+from money_splitter.splitter import MoneySplitter
+
+
+def wait_finished(runner, count=1, timeout=5.0):
+    """Poll runner seperti GUI sampai count job selesai"""
+    finished = []
+    deadline = time.monotonic() + timeout
+    while len(finished) < count:
+        assert time.monotonic() < deadline, "job tidak selesai"
+        finished.extend(runner.poll())
+        time.sleep(0.005)
+    return finished
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner()
+    yield runner
+    runner.shutdown()
+
+
+class TestJobRunner:
+    """Test cases untuk JobRunner"""
+    
+    def test_runs_off_calling_thread(self, runner):
+        """Test job berjalan di thread worker dan hasilnya diambil lewat poll"""
+        job = runner.submit(lambda job: threading.current_thread().name)
+        [finished] = wait_finished(runner)
+        assert finished is job
+        assert job.state == DONE
+        assert job.result == runner.name != threading.current_thread().name
+        assert runner.pending == 0
+    
+    def test_split_job(self, runner):
+        """Test job pembagian tunggal"""
+        job = runner.submit(split_job, MoneySplitter(seed=1), 1_500_000, 5)
+        wait_finished(runner)
+        assert job.result.splits == MoneySplitter(seed=1).split_money(1_500_000, 5).splits
+    
+    def test_error_is_captured(self, runner):
+        """Test exception job tersimpan di job.error, bukan menghentikan worker"""
+        failed = runner.submit(split_job, MoneySplitter(), -5, 3)
+        ok = runner.submit(lambda job: 42)
+        wait_finished(runner, 2)
+        assert failed.state == FAILED
+        assert isinstance(failed.error, ValueError)
+        assert ok.result == 42
+    
+    def test_cancel_running_batch(self, runner):
+        """Test batch berhenti di batas chunk setelah dibatalkan"""
+        started = threading.Event()
+        
+        def slow_batch(job):
+            started.set()
+            for i in range(1000):
+                job.report(i, 1000)
+                time.sleep(0.001)
+        
+        job = runner.submit(slow_batch)
+        assert started.wait(5)
+        job.cancel()
+        wait_finished(runner)
+        assert job.state == CANCELLED
+        assert job.done < 999
+    
+    def test_cancelled_result_is_discarded(self, runner):
+        """Test job yang selesai setelah dibatalkan tidak memberi hasil"""
+        release = threading.Event()
+        
+        def uninterruptible(job):
+            release.wait(5)
+            return "basi"
+        
+        job = runner.submit(uninterruptible)
+        runner.cancel_all()
+        release.set()
+        wait_finished(runner)
+        assert job.state == CANCELLED
+        assert job.result is None
+    
+    def test_split_many_job_progress(self, runner):
+        """Test batch melaporkan progress sampai 1.0"""
+        amounts = [10000 + i * 7919 for i in range(250)]
+        job = runner.submit(split_many_job, MoneySplitter(seed=3), amounts, chunk_size=100)
+        wait_finished(runner)
+        assert job.progress == 1.0
+        expected = MoneySplitter(seed=3).split_many(amounts)
+        assert [r.splits for r in job.result] == [r.splits for r in expected]
+    
+    def test_submit_after_shutdown(self):
+        """Test submit ditolak setelah shutdown"""
+        runner = JobRunner()
+        runner.shutdown()
+        with pytest.raises(RuntimeError):
+            runner.submit(lambda job: None)
+
+
+class TestSpeculator:
+    """Test cases untuk Speculator (preview saat mengetik)"""
+    
+    def test_take_finished_result(self, runner):
+        """Test take mengembalikan job yang sudah selesai untuk key yang sama"""
+        speculator = Speculator(runner, split_job)
+        job = speculator.update((1_500_000, 5), MoneySplitter(seed=1), 1_500_000, 5)
+        wait_finished(runner)
+        assert speculator.take((1_500_000, 5)) is job
+        assert job.state == DONE
+        assert job.result.splits == MoneySplitter(seed=1).split_money(1_500_000, 5).splits
+        # Sudah diambil: take berikutnya harus menghitung ulang
+        assert speculator.take((1_500_000, 5)) is None
+    
+    def test_same_key_reuses_job(self, runner):
+        """Test update dengan key yang sama tidak men-submit job baru"""
+        speculator = Speculator(runner, lambda job, value: value)
+        first = speculator.update("a", 1)
+        assert speculator.update("a", 1) is first
+        wait_finished(runner)
+        assert runner.poll() == []
+    
+    def test_new_key_cancels_stale_jobs(self, runner):
+        """Test job untuk ketukan lama dibatalkan dan tidak dijalankan"""
+        release = threading.Event()
+        calls = []
+        
+        def record(job, value):
+            release.wait(5)
+            calls.append(value)
+            return value
+        
+        speculator = Speculator(runner, record)
+        jobs = [speculator.update(value, value) for value in ("1", "12", "123")]
+        release.set()
+        wait_finished(runner, 3)
+        # Job pertama sudah berjalan saat dibatalkan; job kedua dilewati worker
+        assert [job.state for job in jobs] == [CANCELLED, CANCELLED, DONE]
+        assert "12" not in calls
+        assert speculator.take("123").result == "123"
+    
+    def test_take_other_key_cancels(self, runner):
+        """Test take dengan key berbeda membatalkan job dan mengembalikan None"""
+        release = threading.Event()
+        speculator = Speculator(runner, lambda job: release.wait(5))
+        job = speculator.update("lama")
+        assert speculator.take("baru") is None
+        assert job.cancelled
+        release.set()
+        wait_finished(runner)
+        assert job.state == CANCELLED
+    
+    def test_none_key_cancels(self, runner):
+        """Test key None (input tidak valid) hanya membatalkan job"""
+        speculator = Speculator(runner, lambda job: None)
+        job = speculator.update("a")
+        assert speculator.update(None) is None
+        assert job.cancelled or job.finished
+        assert speculator.job is None
@@ -4,7 +4,9 @@ Unit tests untuk data models
 
 import pytest
 from datetime import datetime
-from money_splitter.models import SplitResult, SplitPart
+import pickle
+from array import array
+from money_splitter.models import CompactSplitResult, SplitResult, SplitPart, _TimestampMemo
 
 
 class TestSplitResult:
@@ -159,4 +161,91 @@ class TestSplitPart:
     def test_validation_negative_index(self):
         """Test validation for negative index"""
         with pytest.raises(ValueError, match="Index must be non-negative"):
-            SplitPart(amount=1500000, percentage=15.0, index=-1)
\ No newline at end of file
+            SplitPart(amount=1500000, percentage=15.0, index=-1)
+
+
+class TestCompactSplitResult:
+    """Test cases for CompactSplitResult"""
+    
+    def make_result(self):
+        return SplitResult(
+            original_amount=1000000,
+            splits=[150000, 250000, 300000, 300000],
+            num_parts=4,
+            timestamp=datetime(2024, 5, 17, 10, 30, 15, 123456),
+        )
+    
+    def test_same_public_methods_as_split_result(self):
+        """Test compact result gives the same answers as SplitResult"""
+        result = self.make_result()
+        compact = CompactSplitResult.from_result(result)
+        
+        assert compact.original_amount == result.original_amount
+        assert list(compact.splits) == result.splits
+        assert compact.num_parts == result.num_parts
+        assert compact.timestamp == result.timestamp
+        assert compact.get_total() == result.get_total()
+        assert compact.get_percentages() == result.get_percentages()
+        assert compact.is_balanced() == result.is_balanced()
+        assert compact.get_split_parts() == result.get_split_parts()
+    
+    def test_roundtrip_to_result(self):
+        """Test conversion back to SplitResult is lossless"""
+        result = self.make_result()
+        assert CompactSplitResult.from_result(result).to_result() == result
+    
+    def test_compact_storage(self):
+        """Test splits are stored as array('q') and there is no __dict__"""
+        compact = CompactSplitResult.from_result(self.make_result())
+        
+        assert isinstance(compact.splits, array)
+        assert compact.splits.typecode == "q"
+        assert isinstance(compact.timestamp_us, int)
+        assert not hasattr(compact, "__dict__")
+    
+    def test_timestamp_forms(self):
+        """Test timestamp accepts datetime, epoch microseconds or None"""
+        moment = datetime(2024, 1, 2, 3, 4, 5, 6)
+        from_datetime = CompactSplitResult(100000, [40000, 60000], moment)
+        from_int = CompactSplitResult(100000, [40000, 60000], from_datetime.timestamp_us)
+        
+        assert from_int == from_datetime
+        assert from_int.timestamp == moment
+        assert isinstance(CompactSplitResult(100000, [40000, 60000]).timestamp, datetime)
+    
+    def test_pickle(self):
+        """Test compact result survives pickling"""
+        compact = CompactSplitResult.from_result(self.make_result())
+        assert pickle.loads(pickle.dumps(compact)) == compact
+    
+    def test_validation(self):
+        """Test the same validation rules as SplitResult"""
+        with pytest.raises(ValueError, match="Original amount must be positive"):
+            CompactSplitResult(0, [1])
+        with pytest.raises(ValueError, match="Splits list cannot be empty"):
+            CompactSplitResult(100000, [])
+        with pytest.raises(ValueError, match="All splits must be positive"):
+            CompactSplitResult(100000, [100001, -1])
+
+
+class TestTimestampMemo:
+    """Test cases for the per-caller timestamp memo"""
+    
+    def test_round_trip(self):
+        """Test conversion both ways matches the unmemoized helpers"""
+        memo = _TimestampMemo()
+        first, second = datetime(2024, 1, 2, 3, 4, 5, 6), datetime(1999, 12, 31)
+        for moment in (first, first, second, first):
+            value = memo.to_us(moment)
+            assert value == CompactSplitResult(1, [1], moment).timestamp_us
+            assert memo.from_us(value) == moment
+    
+    def test_instances_are_independent(self):
+        """Test each caller keeps its own memo (no module-level shared state)"""
+        first, second = _TimestampMemo(), _TimestampMemo()
+        moment = datetime(2024, 1, 2)
+        value = first.to_us(moment)
+        
+        assert second.to_us(datetime(2000, 1, 1)) != value
+        assert first.to_us(moment) == value
+        assert second.from_us(value) == moment
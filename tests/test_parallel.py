@@ -0,0 +1,65 @@
+"""
+Unit tests untuk ParallelSplitter (money_splitter.parallel)
+"""
+
+import pytest
+from money_splitter.models import SplitResult
+from money_splitter.parallel import ParallelSplitter
+
+AMOUNTS = [10000 + i * 123457 for i in range(60)]
+
+
+class TestParallelSplitter:
+    """Test cases untuk ParallelSplitter"""
+    
+    def test_results_in_input_order(self):
+        """Test hasil kembali sesuai urutan input dengan total tepat"""
+        with ParallelSplitter(workers=2, chunk_size=7, seed=1) as pool:
+            results = pool.split_many(AMOUNTS, num_parts=4)
+        
+        assert [result.original_amount for result in results] == AMOUNTS
+        for result in results:
+            assert isinstance(result, SplitResult)
+            assert result.num_parts == 4
+            assert result.get_total() == result.original_amount
+    
+    def test_reproducible_across_worker_counts(self):
+        """Test master seed yang sama memberi hasil identik berapa pun jumlah worker"""
+        outputs = []
+        for workers in (1, 2, 3):
+            with ParallelSplitter(workers=workers, chunk_size=9, seed=2024) as pool:
+                outputs.append([result.splits for result in pool.split_many(AMOUNTS)])
+        assert outputs[0] == outputs[1] == outputs[2]
+    
+    def test_different_seeds_differ(self):
+        """Test master seed berbeda menghasilkan pembagian berbeda"""
+        first = ParallelSplitter(workers=1, chunk_size=10, seed=1).split_many(AMOUNTS)
+        second = ParallelSplitter(workers=1, chunk_size=10, seed=2).split_many(AMOUNTS)
+        assert [r.splits for r in first] != [r.splits for r in second]
+    
+    def test_chunk_seeds_are_independent(self):
+        """Test setiap chunk mendapat seed sendiri"""
+        pool = ParallelSplitter(workers=1, seed=5)
+        seeds = {pool.chunk_seed(index) for index in range(100)}
+        assert len(seeds) == 100
+    
+    def test_imap_is_lazy(self):
+        """Test imap bisa dikonsumsi sebagian tanpa membaca seluruh input"""
+        def amounts():
+            yield from AMOUNTS[:5]
+            raise AssertionError("input dibaca terlalu jauh")
+        
+        pool = ParallelSplitter(workers=1, chunk_size=5, seed=3)
+        first = next(pool.imap(amounts(), num_parts=3))
+        assert first.original_amount == AMOUNTS[0]
+    
+    def test_invalid_input(self):
+        """Test amount dan parameter tidak valid ditolak"""
+        with pytest.raises(ValueError):
+            ParallelSplitter(workers=1).split_many([1500000, 500])
+        with pytest.raises(ValueError):
+            ParallelSplitter(workers=1).split_many([1500000], num_parts=7)
+        with pytest.raises(ValueError):
+            ParallelSplitter(chunk_size=0)
+        with pytest.raises(ValueError):
+            ParallelSplitter(workers=0)
@@ -0,0 +1,39 @@
+"""
+Regression tests untuk kasus latency terburuk hasil benchmarks/fuzz_latency.py
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from money_splitter.splitter import MoneySplitter
+
+REGRESSIONS_PATH = Path(__file__).parent / "data" / "latency_regressions.json"
+CASES = json.loads(REGRESSIONS_PATH.read_text(encoding="utf-8"))["cases"]
+
+# Kelonggaran iterasi di atas nilai yang tercatat saat kasus disimpan, agar
+# perubahan urutan undian tidak membuat test rapuh tetapi regresi ke loop
+# panjang tetap tertangkap
+ITERATION_SLACK = 2
+MIN_ITERATION_BUDGET = 50
+
+
+def case_id(case):
+    return f"{case['strategy']}-{case['amount']}-{case['num_parts']}-{case['seed']}"
+
+
+class TestLatencyRegressions:
+    """Putar ulang kasus terburuk dengan seed yang sama dan budget iterasi"""
+
+    @pytest.mark.parametrize("case", CASES, ids=case_id)
+    def test_replay_within_budget(self, case):
+        """Test kasus tersimpan selesai dalam budget iterasi dan total tetap tepat"""
+        budget = max(MIN_ITERATION_BUDGET, case["iterations"] * ITERATION_SLACK)
+        splitter = MoneySplitter(strategy=case["strategy"], max_iterations=budget)
+        splitter.random.seed(case["seed"])
+
+        result = splitter.split_money(case["amount"], case["num_parts"])
+
+        assert sum(result.splits) == case["amount"]
+        assert len(result.splits) == case["num_parts"]
+        assert all(split > 0 for split in result.splits)
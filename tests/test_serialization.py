@@ -0,0 +1,122 @@
+"""
+Unit tests untuk serialisasi SplitResult/SplitPart (models dan money_splitter.serialization)
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+
+import pytest
+from money_splitter import serialization
+from money_splitter.models import SplitPart, SplitResult
+from money_splitter.splitter import MoneySplitter
+
+
+def make_results(count=100, seed=9):
+    splitter = MoneySplitter(seed=seed)
+    return splitter.split_many([10000 + i * 7919 for i in range(count)])
+
+
+class TestSplitResultSerialization:
+    """Test cases untuk serialisasi per objek SplitResult"""
+    
+    def test_bytes_roundtrip(self):
+        """Test to_bytes/from_bytes mengembalikan hasil yang sama"""
+        for result in make_results(20):
+            data = result.to_bytes()
+            assert len(data) == 18 + 8 * result.num_parts
+            assert SplitResult.from_bytes(data) == result
+    
+    def test_json_matches_asdict(self):
+        """Test to_json identik secara isi dengan dataclasses.asdict + json.dumps"""
+        result = make_results(1)[0]
+        naive = json.loads(json.dumps(dataclasses.asdict(result), default=str))
+        fast = json.loads(result.to_json())
+        assert fast["amount"] == naive["original_amount"]
+        assert fast["splits"] == naive["splits"]
+        assert fast == result.to_dict()
+        assert SplitResult.from_json(result.to_json()) == result
+    
+    def test_json_without_timestamp(self):
+        """Test to_json(timestamp=False) sama seperti baris JSONL CLI tanpa --timestamp"""
+        result = make_results(1)[0]
+        data = json.loads(result.to_json(timestamp=False))
+        assert "timestamp" not in data
+        assert data == {key: value for key, value in result.to_dict().items() if key != "timestamp"}
+    
+    def test_from_dict_without_timestamp(self):
+        """Test baris JSONL CLI tanpa timestamp bisa dibaca"""
+        result = SplitResult.from_dict({"amount": 100, "splits": [60, 40]})
+        assert result.num_parts == 2
+        assert isinstance(result.timestamp, datetime)
+    
+    def test_invalid_data(self):
+        """Test data rusak ditolak dengan ValueError"""
+        data = make_results(1)[0].to_bytes()
+        with pytest.raises(ValueError):
+            SplitResult.from_bytes(data[:-1])
+        with pytest.raises(ValueError, match="Versi"):
+            SplitResult.from_bytes(b"\x09" + data[1:])
+        with pytest.raises(ValueError):
+            SplitResult.from_json('{"amount": 100}')
+        with pytest.raises(ValueError):
+            SplitResult(original_amount=2 ** 64, splits=[2 ** 64], num_parts=1,
+                        timestamp=datetime.now()).to_bytes()
+
+
+class TestSplitPartSerialization:
+    """Test cases untuk serialisasi per objek SplitPart"""
+    
+    def test_roundtrip(self):
+        """Test bentuk bytes, dict dan JSON"""
+        part = SplitPart(amount=311000, percentage=20.73, index=2)
+        assert SplitPart.from_bytes(part.to_bytes()) == part
+        assert SplitPart.from_dict(part.to_dict()) == part
+        assert json.loads(part.to_json()) == dataclasses.asdict(part)
+        assert SplitPart.from_json(part.to_json()) == part
+    
+    def test_invalid_data(self):
+        """Test ukuran bytes yang salah ditolak"""
+        with pytest.raises(ValueError):
+            SplitPart.from_bytes(b"\x01\x02")
+
+
+class TestBatchSerialization:
+    """Test cases untuk bentuk batch di money_splitter.serialization"""
+    
+    def test_results_bytes_roundtrip(self):
+        """Test batch bytes kolumnar dan lebih ringkas dari encode per objek"""
+        results = make_results()
+        data = serialization.results_to_bytes(results)
+        assert serialization.results_from_bytes(data) == results
+        assert len(data) < sum(len(result.to_bytes()) for result in results)
+    
+    def test_results_json_roundtrip(self):
+        """Test batch JSON berupa array dari bentuk to_dict"""
+        results = make_results()
+        text = serialization.results_to_json(results)
+        assert json.loads(text) == [result.to_dict() for result in results]
+        assert serialization.results_from_json(text) == results
+    
+    def test_parts_roundtrip(self):
+        """Test batch SplitPart dalam bentuk bytes dan JSON"""
+        parts = [part for result in make_results(10) for part in result.get_split_parts()]
+        assert serialization.parts_from_bytes(serialization.parts_to_bytes(parts)) == parts
+        assert serialization.parts_from_json(serialization.parts_to_json(parts)) == parts
+    
+    def test_empty_batch(self):
+        """Test batch kosong"""
+        assert serialization.results_from_bytes(serialization.results_to_bytes([])) == []
+        assert serialization.results_from_json(serialization.results_to_json([])) == []
+    
+    def test_invalid_batch(self):
+        """Test batch terpotong, berlebih atau jenis salah ditolak"""
+        data = serialization.results_to_bytes(make_results(5))
+        with pytest.raises(ValueError, match="terpotong"):
+            serialization.results_from_bytes(data[:-1])
+        with pytest.raises(ValueError, match="berlebih"):
+            serialization.results_from_bytes(data + b"\x00")
+        with pytest.raises(ValueError):
+            serialization.parts_from_bytes(data)
+        with pytest.raises(ValueError, match="array"):
+            serialization.results_from_json("{}")
@@ -0,0 +1,296 @@
+"""
+Unit tests untuk server HTTP (money_splitter.server)
+"""
+
+import asyncio
+import json
+import signal
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from money_splitter.server import MicroBatcher, SplitServer
+from money_splitter.splitter import MoneySplitter
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def request(reader, writer, method, path, payload=None, headers=""):
+    """Kirim satu request di koneksi yang ada, kembalikan (status, header, body)"""
+    body = b"" if payload is None else json.dumps(payload).encode()
+    length = f"Content-Length: {len(body)}\r\n" if method == "POST" else ""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\n{length}{headers}\r\n".encode() + body)
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode()
+    lines = head.split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    response_headers = dict(
+        (name.lower(), value.strip())
+        for name, _, value in (line.partition(":") for line in lines[1:] if line)
+    )
+    data = await reader.readexactly(int(response_headers["content-length"]))
+    return status, response_headers, json.loads(data)
+
+
+def with_server(test, **kwargs):
+    """Jalankan coroutine test(server) dengan server di port bebas"""
+    async def main():
+        server = SplitServer(port=0, splitter=MoneySplitter(seed=1), **kwargs)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.shutdown(timeout=5)
+    return asyncio.run(main())
+
+
+async def connect(server):
+    return await asyncio.open_connection("127.0.0.1", server.port)
+
+
+class TestSplitServer:
+    """Test cases untuk SplitServer"""
+    
+    def test_split(self):
+        """Test POST /split mengembalikan SplitResult sebagai JSON"""
+        async def test(server):
+            reader, writer = await connect(server)
+            status, _, data = await request(reader, writer, "POST", "/split",
+                                            {"amount": 1500000, "num_parts": 5})
+            writer.close()
+            return status, data
+        
+        status, data = with_server(test)
+        assert status == 200
+        assert data["amount"] == 1500000
+        assert data["num_parts"] == 5
+        assert sum(data["splits"]) == 1500000
+        assert "timestamp" in data
+    
+    def test_split_batch(self):
+        """Test POST /split/batch mengembalikan hasil sesuai urutan"""
+        amounts = [100000 + i * 1000 for i in range(20)]
+        
+        async def test(server):
+            reader, writer = await connect(server)
+            result = await request(reader, writer, "POST", "/split/batch",
+                                   {"amounts": amounts, "num_parts": 3})
+            writer.close()
+            return result
+        
+        status, _, data = with_server(test)
+        assert status == 200
+        assert [r["amount"] for r in data["results"]] == amounts
+        assert all(sum(r["splits"]) == r["amount"] for r in data["results"])
+    
+    def test_keep_alive(self):
+        """Test beberapa request memakai satu koneksi"""
+        async def test(server):
+            reader, writer = await connect(server)
+            responses = [
+                await request(reader, writer, "POST", "/split", {"amount": 200000 + i})
+                for i in range(5)
+            ]
+            writer.close()
+            return responses
+        
+        responses = with_server(test)
+        assert all(status == 200 for status, _, _ in responses)
+        assert all(headers["connection"] == "keep-alive" for _, headers, _ in responses)
+    
+    def test_connection_close(self):
+        """Test Connection: close menutup koneksi setelah response"""
+        async def test(server):
+            reader, writer = await connect(server)
+            _, headers, _ = await request(reader, writer, "POST", "/split",
+                                          {"amount": 200000}, "Connection: close\r\n")
+            return headers, await reader.read()
+        
+        headers, rest = with_server(test)
+        assert headers["connection"] == "close"
+        assert rest == b""
+    
+    def test_concurrent_requests_are_batched(self):
+        """Test request bersamaan digabung ke lebih sedikit batch"""
+        async def client(server, i):
+            reader, writer = await connect(server)
+            result = await request(reader, writer, "POST", "/split", {"amount": 100000 + i * 1000})
+            writer.close()
+            return result
+        
+        async def test(server):
+            responses = await asyncio.gather(*(client(server, i) for i in range(20)))
+            return responses, server.batcher.batches
+        
+        responses, batches = with_server(test, batch_window=0.05)
+        assert [data["amount"] for _, _, data in responses] == [100000 + i * 1000 for i in range(20)]
+        assert batches < 20
+    
+    @pytest.mark.parametrize("method,path,payload,expected", [
+        ("POST", "/split", {"amount": 500}, 422),
+        ("POST", "/split", {"amount": 100000, "num_parts": 9}, 422),
+        ("POST", "/split", {"amount": "100000"}, 400),
+        ("POST", "/split", [100000], 400),
+        ("POST", "/split/batch", {"amounts": [100000, 5]}, 422),
+        ("GET", "/split", None, 405),
+        ("POST", "/unknown", {}, 404),
+    ])
+    def test_errors(self, method, path, payload, expected):
+        """Test request tidak valid mendapat status error dan koneksi tetap hidup"""
+        async def test(server):
+            reader, writer = await connect(server)
+            status, _, data = await request(reader, writer, method, path, payload)
+            follow_up, _, _ = await request(reader, writer, "GET", "/health")
+            writer.close()
+            return status, data, follow_up
+        
+        status, data, follow_up = with_server(test)
+        assert status == expected
+        assert "error" in data
+        assert follow_up == 200
+    
+    def test_invalid_entry_does_not_fail_batch(self):
+        """Test error satu request tidak memengaruhi request lain di batch yang sama"""
+        async def client(server, amount):
+            reader, writer = await connect(server)
+            status, _, _ = await request(reader, writer, "POST", "/split", {"amount": amount})
+            writer.close()
+            return status
+        
+        async def test(server):
+            return await asyncio.gather(*(client(server, a) for a in (100000, 5, 200000)))
+        
+        assert with_server(test, batch_window=0.05) == [200, 422, 200]
+    
+    def test_missing_content_length(self):
+        """Test POST tanpa Content-Length ditolak dengan 411"""
+        async def test(server):
+            reader, writer = await connect(server)
+            writer.write(b"POST /split HTTP/1.1\r\nHost: test\r\n\r\n")
+            head = await reader.readuntil(b"\r\n\r\n")
+            writer.close()
+            return head
+        
+        assert with_server(test).startswith(b"HTTP/1.1 411")
+    
+    def test_graceful_shutdown(self):
+        """Test shutdown menutup koneksi idle dan menolak koneksi baru"""
+        async def main():
+            server = SplitServer(port=0)
+            await server.start()
+            reader, writer = await connect(server)
+            status, _, _ = await request(reader, writer, "POST", "/split", {"amount": 300000})
+            await server.shutdown(timeout=5)
+            closed = await reader.read()
+            with pytest.raises(OSError):
+                await connect(server)
+            return status, closed
+        
+        status, closed = asyncio.run(main())
+        assert status == 200
+        assert closed == b""
+
+
+class TestMicroBatcher:
+    """Test cases untuk MicroBatcher"""
+    
+    def test_submit_and_close(self):
+        """Test submit mengembalikan hasil dan close menghentikan worker"""
+        async def main():
+            batcher = MicroBatcher(MoneySplitter(seed=3), max_batch=4)
+            results = await asyncio.gather(
+                *(batcher.submit([100000 + i * 1000], 2) for i in range(10))
+            )
+            await batcher.close()
+            return batcher, results
+        
+        batcher, results = asyncio.run(main())
+        assert [r[0].original_amount for r in results] == [100000 + i * 1000 for i in range(10)]
+        assert batcher.entries == 10
+        assert batcher.batches >= 3  # max_batch=4
+    
+    def test_batch_split_once_per_num_parts(self):
+        """Test satu batch dibagi dengan satu split_many per num_parts"""
+        splitter = MoneySplitter(seed=3)
+        calls = []
+        split_many = splitter.split_many
+        
+        def counting_split_many(amounts, num_parts=None, **kwargs):
+            calls.append((num_parts, len(amounts)))
+            return split_many(amounts, num_parts, **kwargs)
+        
+        splitter.split_many = counting_split_many
+        entries = [([100000 + i * 1000], 2 + i % 2) for i in range(8)] + [([500], 2)]
+        
+        async def main():
+            batcher = MicroBatcher(splitter, batch_window=0.05)
+            outcomes = await asyncio.gather(
+                *(batcher.submit(amounts, parts) for amounts, parts in entries),
+                return_exceptions=True)
+            await batcher.close()
+            return batcher, outcomes
+        
+        batcher, outcomes = asyncio.run(main())
+        assert batcher.batches == 1
+        assert sorted(calls) == [(2, 4), (3, 4)]
+        for (amounts, parts), outcome in zip(entries[:-1], outcomes):
+            assert [r.original_amount for r in outcome] == amounts
+            assert outcome[0].num_parts == parts
+        assert isinstance(outcomes[-1], ValueError)
+    
+    def test_executor_failure_fails_batch_not_worker(self):
+        """Test error executor diteruskan ke semua request dan worker tetap melayani"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        
+        async def main():
+            batcher = MicroBatcher(MoneySplitter(), executor=executor)
+            outcomes = []
+            for _ in range(2):
+                try:
+                    await asyncio.wait_for(batcher.submit([100000], 2), timeout=5)
+                except RuntimeError as e:
+                    outcomes.append(e)
+            await asyncio.wait_for(batcher.close(), timeout=5)
+            return outcomes
+        
+        assert len(asyncio.run(main())) == 2
+    
+    def test_invalid_arguments(self):
+        """Test argumen tidak valid"""
+        with pytest.raises(ValueError):
+            MicroBatcher(MoneySplitter(), batch_window=-1)
+        with pytest.raises(ValueError):
+            MicroBatcher(MoneySplitter(), max_batch=0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="butuh SIGTERM")
+class TestServeCommand:
+    """Test cases untuk subcommand serve"""
+    
+    def test_serve_and_sigterm(self):
+        """Test server CLI melayani request dan berhenti bersih saat SIGTERM"""
+        process = subprocess.Popen(
+            [sys.executable, "-m", "money_splitter", "serve", "--port", "0"],
+            cwd=ROOT, stderr=subprocess.PIPE, text=True,
+        )
+        try:
+            port = int(process.stderr.readline().split("http://127.0.0.1:")[1].split()[0])
+            
+            async def call():
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                result = await request(reader, writer, "POST", "/split", {"amount": 750000})
+                writer.close()
+                return result
+            
+            status, _, data = asyncio.run(call())
+            process.send_signal(signal.SIGTERM)
+            assert process.wait(timeout=10) == 0
+        finally:
+            process.kill()
+            process.stderr.close()
+        
+        assert status == 200
+        assert sum(data["splits"]) == 750000
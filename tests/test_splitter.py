@@ -2,9 +2,12 @@
 Unit tests untuk MoneySplitter business logic
 """
 
+import random
+
 import pytest
-from money_splitter.splitter import MoneySplitter
-from money_splitter.models import SplitResult
+from money_splitter.splitter import MoneySplitter, SplitBudgetExceeded
+from money_splitter.models import SplitResult, SplitStats
+from money_splitter.utils import ValidationUtils
 
 
 class TestMoneySplitter:
@@ -58,4 +61,215 @@ class TestMoneySplitter:
         for _ in range(20):  # Test multiple times karena random
             result = self.splitter.split_money(10000000)
             assert result.num_parts in [5, 6]
-            assert len(result.splits) == result.num_parts
\ No newline at end of file
+            assert len(result.splits) == result.num_parts
+    
+    def test_split_many_preserves_order_and_total(self):
+        """Test split_many mengembalikan hasil sesuai urutan input dengan total tepat"""
+        amounts = [10000000, 5000000, 15000000, 123457, 10000]
+        results = self.splitter.split_many(amounts)
+        
+        assert [r.original_amount for r in results] == amounts
+        for result in results:
+            assert isinstance(result, SplitResult)
+            assert result.num_parts in [5, 6]
+            assert result.get_total() == result.original_amount
+    
+    def test_split_many_fixed_parts(self):
+        """Test split_many dengan num_parts tetap"""
+        results = self.splitter.split_many([10000000] * 20, num_parts=4)
+        
+        for result in results:
+            assert result.num_parts == 4
+            assert len(set(result.splits)) == 4
+    
+    def test_split_many_validates_before_splitting(self):
+        """Test split_many menolak batch jika ada amount yang tidak valid"""
+        with pytest.raises(ValueError) as exc_info:
+            self.splitter.split_many([10000000, 5000])
+        
+        assert "10.000" in str(exc_info.value)
+        
+        with pytest.raises(ValueError):
+            self.splitter.split_many([10000000], num_parts=7)
+    
+    def test_split_many_empty(self):
+        """Test split_many dengan input kosong"""
+        assert self.splitter.split_many([]) == []
+    
+    def test_invalid_strategy(self):
+        """Test constructor menolak strategi yang tidak dikenal"""
+        with pytest.raises(ValueError):
+            MoneySplitter(strategy="greedy")
+    
+    def test_balance_splits_exact_total(self):
+        """Test _balance_splits selalu mencapai target, naik maupun turun"""
+        cases = [
+            ([200000, 300000, 150000, 250000, 50000], 1000000),
+            ([200000, 300000, 150000, 250000, 50000], 1234567),
+            ([200000, 300000, 150000, 250000, 50000], 777777),
+            ([1000, 1000, 1000, 1000, 9000], 10000),
+        ]
+        for splits, target in cases:
+            balanced = self.splitter._balance_splits(splits, target)
+            assert sum(balanced) == target
+            assert all(split > 0 for split in balanced)
+    
+    def test_balance_splits_tiny_parts_terminates(self):
+        """Test pengurangan dari bagian sangat kecil tetap berhenti"""
+        # Versi lama bisa berputar tanpa progres jika bagian // 10 == 0
+        balanced = self.splitter._balance_splits([5, 7, 9, 100000], 20000)
+        assert sum(balanced) == 20000
+        assert all(split > 0 for split in balanced)
+    
+    def test_balance_splits_preserves_thousands(self):
+        """Test selisih ribuan tidak merusak bagian yang bulat ribuan"""
+        splits = [210000, 305000, 148000, 251000, 83500]
+        balanced = self.splitter._balance_splits(splits, 1012500)
+        assert sum(balanced) == 1012500
+        assert sum(1 for split in balanced if split % 1000 == 0) >= 4
+    
+    def test_iteration_budget_exceeded(self):
+        """Test max_iterations melempar SplitBudgetExceeded, bukan hang"""
+        splitter = MoneySplitter(max_iterations=1)
+        splitter._balance_splits([1000, 2000], 5000)  # satu iterasi masih boleh
+        with pytest.raises(SplitBudgetExceeded):
+            splitter._balance_splits([1000, 2000], 6000)
+    
+    def test_budget_resets_per_split(self):
+        """Test budget dihitung per pembagian, bukan kumulatif"""
+        splitter = MoneySplitter(max_iterations=1000, time_budget=5.0)
+        for _ in range(50):
+            result = splitter.split_money(10000000)
+            assert result.get_total() == 10000000
+    
+    def test_invalid_budget(self):
+        """Test constructor menolak budget yang tidak valid"""
+        with pytest.raises(ValueError):
+            MoneySplitter(max_iterations=0)
+        with pytest.raises(ValueError):
+            MoneySplitter(time_budget=0)
+
+
+class TestConstructiveStrategy:
+    """Test cases untuk strategi constructive"""
+    
+    def setup_method(self):
+        """Setup untuk setiap test"""
+        self.splitter = MoneySplitter(strategy="constructive")
+        self.splitter.random.seed(2024)
+    
+    @pytest.mark.parametrize("num_parts", [2, 3, 4, 5, 6])
+    def test_constructive_splits_are_natural(self, num_parts):
+        """Test strategi constructive selalu menghasilkan pembagian natural"""
+        amounts = [25000, 123457, 999999, 1000000, 10000003, 5 * 10 ** 8, 10 ** 12 + 7]
+        for amount in amounts:
+            for _ in range(20):
+                result = self.splitter.split_money(amount, num_parts)
+                assert ValidationUtils.is_natural_split(result.splits, amount), result.splits
+    
+    def test_constructive_small_amount_falls_back(self):
+        """Test amount sangat kecil tetap terbagi dengan total tepat"""
+        for num_parts in range(2, 7):
+            result = self.splitter.split_money(10000, num_parts)
+            assert result.get_total() == 10000
+            assert len(result.splits) == num_parts
+    
+    def test_construct_splits_never_repairs(self):
+        """Test konstruksi langsung berhasil tanpa fallback untuk amount wajar"""
+        for amount in [50000, 1234567, 98765432]:
+            for num_parts in range(2, 7):
+                splits = self.splitter._construct_splits(amount, num_parts)
+                assert splits is not None
+                assert sum(splits) == amount
+
+
+class TestInstrumentation:
+    """Test cases untuk instrumentasi SplitStats"""
+    
+    def test_stats_disabled_by_default(self):
+        """Test tanpa opt-in tidak ada statistik dan method tidak dibungkus"""
+        splitter = MoneySplitter()
+        splitter.split_money(1000000, 5)
+        assert splitter.last_stats is None
+        assert "_balance_splits" not in vars(splitter)
+    
+    def test_collect_stats(self):
+        """Test last_stats terisi untuk setiap pembagian"""
+        splitter = MoneySplitter(collect_stats=True)
+        splitter.random.seed(7)
+        splitter.split_money(1234567, 6)
+        stats = splitter.last_stats
+        
+        assert isinstance(stats, SplitStats)
+        assert stats.amount == 1234567
+        assert stats.num_parts == 6
+        assert stats.strategy == "repair"
+        assert stats.iterations >= stats.balance_iterations > 0
+        assert "_balance_splits" in stats.stage_times
+        assert sum(stats.stage_times.values()) <= stats.total_time
+        assert stats.dominant_stage() in stats.stage_times
+    
+    def test_stats_callback_per_split(self):
+        """Test callback dipanggil sekali per pembagian, termasuk split_many"""
+        collected = []
+        splitter = MoneySplitter(on_stats=collected.append)
+        splitter.split_many([100000, 2000000, 30000000], num_parts=4)
+        
+        assert [stats.amount for stats in collected] == [100000, 2000000, 30000000]
+        assert splitter.last_stats is collected[-1]
+    
+    def test_stats_counts_forced_roundings(self):
+        """Test pembulatan paksa ke ribuan tercatat"""
+        splitter = MoneySplitter(collect_stats=True)
+        splitter._stats = SplitStats(amount=100000, num_parts=4, strategy="repair")
+        splitter._ensure_thousands_preference([24100, 25200, 26300, 24400], 100000)
+        assert splitter._stats.forced_roundings >= 3
+    
+    def test_constructive_stats(self):
+        """Test strategi constructive hanya mencatat tahap konstruksi"""
+        splitter = MoneySplitter(strategy="constructive", collect_stats=True)
+        splitter.split_money(98765432, 5)
+        stats = splitter.last_stats
+        assert stats.strategy == "constructive"
+        assert stats.iterations == 0
+        assert set(stats.stage_times) == {"_construct_splits"}
+
+
+class TestSeeding:
+    """Test cases untuk seed dan snapshot state RNG"""
+    
+    def test_same_seed_same_results(self):
+        """Test seed yang sama menghasilkan pembagian identik"""
+        amounts = [1500000, 2750000, 980000, 123456789]
+        first = MoneySplitter(seed=99).split_many(amounts)
+        second = MoneySplitter(seed=99).split_many(amounts)
+        assert [r.splits for r in first] == [r.splits for r in second]
+    
+    def test_restore_state_continues_stream(self):
+        """Test state yang dipulihkan melanjutkan urutan hasil yang sama"""
+        splitter = MoneySplitter(seed=5)
+        splitter.split_money(1000000, 5)
+        state = splitter.get_rng_state()
+        expected = [splitter.split_money(2000000).splits for _ in range(3)]
+        
+        resumed = MoneySplitter()
+        resumed.set_rng_state(state)
+        assert [resumed.split_money(2000000).splits for _ in range(3)] == expected
+    
+    def test_restore_state_from_json_lists(self):
+        """Test state hasil round-trip JSON (list) tetap bisa dipulihkan"""
+        splitter = MoneySplitter(seed=11)
+        state = [list(item) if isinstance(item, tuple) else item for item in splitter.get_rng_state()]
+        expected = splitter.split_money(5000000, 4).splits
+        
+        resumed = MoneySplitter()
+        resumed.set_rng_state(state)
+        assert resumed.split_money(5000000, 4).splits == expected
+    
+    def test_explicit_rng(self):
+        """Test rng milik pemanggil dipakai langsung"""
+        rng = random.Random(3)
+        splitter = MoneySplitter(rng=rng)
+        assert splitter.random is rng
+        with pytest.raises(ValueError):
+            MoneySplitter(seed=1, rng=random.Random())
@@ -0,0 +1,53 @@
+"""
+Tests untuk jalur startup: import headless tidak menyentuh GUI atau NumPy
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("tkinter", "customtkinter", "numpy")
+
+
+def imported_heavy_modules(statement: str) -> list:
+    """Jalankan statement di interpreter baru dan kembalikan modul berat yang ter-import"""
+    code = f"import sys; {statement}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [name for name in completed.stdout.strip().split(",") if name]
+
+
+class TestStartup:
+    """Test cases untuk lazy import"""
+    
+    @pytest.mark.parametrize("module", ["main", "money_splitter.splitter", "money_splitter.cli"])
+    def test_headless_import_is_light(self, module):
+        """Test import modul headless tidak meng-import tkinter, customtkinter atau NumPy"""
+        assert imported_heavy_modules(f"import {module}") == []
+    
+    def test_daemon_client_import_is_light(self):
+        """Test client daemon tidak meng-import asyncio maupun MoneySplitter"""
+        code = ("import sys, money_splitter.client; "
+                "print([m for m in ('asyncio', 'money_splitter.splitter') if m in sys.modules])")
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert completed.stdout.strip() == "[]"
+    
+    def test_main_import_skips_logging_setup(self):
+        """Test import main tidak meng-import logging (logging hanya disiapkan di jalur GUI)"""
+        code = "import sys, main; print('logging' in sys.modules)"
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert completed.stdout.strip() == "False"
+    
+    def test_split_money_without_numpy_import(self):
+        """Test split_money dan split_many engine python tidak memuat NumPy"""
+        statement = (
+            "from money_splitter.splitter import MoneySplitter; "
+            "s = MoneySplitter(); s.split_money(1500000, 5); s.split_many([1500000, 2000000])"
+        )
+        assert imported_heavy_modules(statement) == []
@@ -0,0 +1,71 @@
+"""
+Unit tests untuk facade thread-safe (money_splitter.threadsafe)
+"""
+
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from money_splitter.threadsafe import ThreadLocalSplitter, split_with_rng
+
+
+class TestThreadLocalSplitter:
+    """Test cases untuk ThreadLocalSplitter"""
+    
+    def test_one_splitter_per_thread(self):
+        """Test setiap thread mendapat MoneySplitter sendiri"""
+        pool = ThreadLocalSplitter(seed=1)
+        seen = []
+        barrier = threading.Barrier(4)
+        
+        def work():
+            barrier.wait()
+            seen.append(pool.splitter)
+            assert pool.splitter is pool.splitter
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(splitter) for splitter in seen}) == 4
+        assert pool.thread_count == 4
+    
+    def test_concurrent_splits_are_valid(self):
+        """Test pembagian konkuren tetap benar"""
+        pool = ThreadLocalSplitter(seed=2, strategy="constructive")
+        amounts = [100000 + i * 9973 for i in range(400)]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda amount: pool.split_money(amount, 4), amounts))
+        
+        assert [result.original_amount for result in results] == amounts
+        assert all(result.get_total() == result.original_amount for result in results)
+    
+    def test_rejects_shared_rng(self):
+        """Test satu rng tidak boleh dibagi antar thread"""
+        with pytest.raises(ValueError):
+            ThreadLocalSplitter(rng=random.Random(1))
+
+
+class TestSplitWithRng:
+    """Test cases untuk split_with_rng"""
+    
+    def test_reproducible_per_rng(self):
+        """Test rng dengan seed sama menghasilkan pembagian sama"""
+        first = split_with_rng(1500000, 5, rng=random.Random(7))
+        second = split_with_rng(1500000, 5, rng=random.Random(7))
+        assert first.splits == second.splits
+    
+    def test_reproducible_under_threads(self):
+        """Test hasil per request tidak dipengaruhi thread lain"""
+        amounts = [250000 + i * 31337 for i in range(200)]
+        expected = [split_with_rng(amount, rng=random.Random(i)).splits for i, amount in enumerate(amounts)]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(executor.map(
+                lambda pair: split_with_rng(pair[1], rng=random.Random(pair[0])).splits,
+                enumerate(amounts)))
+        assert actual == expected
@@ -57,6 +57,57 @@ class TestCurrencyFormatter:
         assert CurrencyFormatter.parse_input(None) is None
         assert CurrencyFormatter.parse_input(123) is None  # Not a string
     
+    def test_format_live_groups_digits(self):
+        """Test format_live membuang non-digit dan nol di depan"""
+        assert CurrencyFormatter.format_live("1000000", 7) == ("1.000.000", 9)
+        assert CurrencyFormatter.format_live("Rp 12a34", 8) == ("1.234", 5)
+        assert CurrencyFormatter.format_live("0001", 4) == ("1", 1)
+        assert CurrencyFormatter.format_live("000", 3) == ("0", 1)
+        assert CurrencyFormatter.format_live("abc", 3) == ("", 0)
+        assert CurrencyFormatter.format_live("", 0) == ("", 0)
+    
+    def test_format_live_preserves_caret(self):
+        """Test kursor tetap setelah digit yang sama saat mengetik di tengah"""
+        # Sisip "5" setelah "1" di "1.000.000": kursor setelah "15"
+        assert CurrencyFormatter.format_live("15.000.000", 2) == ("15.000.000", 2)
+        assert CurrencyFormatter.format_live("1.5000.000", 3) == ("15.000.000", 2)
+        # Hapus digit di tengah: kursor tetap di antara digit yang sama
+        assert CurrencyFormatter.format_live("1.00.000", 4) == ("100.000", 3)
+        assert CurrencyFormatter.format_live("1.234", 0) == ("1.234", 0)
+    
+    def test_format_live_long_input(self):
+        """Test format_live untuk angka lebih panjang dari batas konversi int"""
+        formatted, caret = CurrencyFormatter.format_live("9" * 6000, 6000)
+        assert formatted == ".".join(["999"] * 2000)
+        assert caret == len(formatted)
+    
+    def test_parse_pasted(self):
+        """Test parse_pasted dengan teks clipboard"""
+        assert CurrencyFormatter.parse_pasted("Rp 1.500.000,00") == 1500000
+        assert CurrencyFormatter.parse_pasted("1,250,000.50 IDR") == 1250000
+        assert CurrencyFormatter.parse_pasted("Total:\n  Rp 2.000.000\n") == 2000000
+        assert CurrencyFormatter.parse_pasted("1 500 000") == 1500000
+        assert CurrencyFormatter.parse_pasted("1.000.000.") == 1000000
+        assert CurrencyFormatter.parse_pasted("-500.000") == -500000
+        assert CurrencyFormatter.parse_pasted("Rp 10.000 dan 20.000") == 10000
+    
+    def test_parse_pasted_invalid(self):
+        """Test parse_pasted tanpa angka"""
+        assert CurrencyFormatter.parse_pasted("") is None
+        assert CurrencyFormatter.parse_pasted("Rp") is None
+        assert CurrencyFormatter.parse_pasted(None) is None
+    
+    def test_diff_span(self):
+        """Test diff_span hanya mencakup karakter yang berubah"""
+        assert CurrencyFormatter.diff_span("1.0000", "10.000") == (1, 3, "0.")
+        assert CurrencyFormatter.diff_span("1234", "1.234") == (1, 1, ".")
+        assert CurrencyFormatter.diff_span("1.234", "1.234") == (5, 5, "")
+        assert CurrencyFormatter.diff_span("abc", "") == (0, 3, "")
+        
+        for old, new in [("1.5000.000", "15.000.000"), ("12a", "12"), ("", "1")]:
+            start, end, replacement = CurrencyFormatter.diff_span(old, new)
+            assert old[:start] + replacement + old[end:] == new
+    
     def test_format_with_percentage(self):
         """Test format_with_percentage method"""
         assert CurrencyFormatter.format_with_percentage(1000000, 5000000) == "Rp 1.000.000 (20.0%)"
@@ -115,4 +166,32 @@ class TestValidationUtils:
         assert ValidationUtils.is_reasonable_amount(0) is True
         assert ValidationUtils.is_reasonable_amount(1000000000) is True
         assert ValidationUtils.is_reasonable_amount(1000000001) is False
-        assert ValidationUtils.is_reasonable_amount(-1) is False
\ No newline at end of file
+        assert ValidationUtils.is_reasonable_amount(-1) is False
+    
+    def test_get_split_bounds(self):
+        """Test get_split_bounds method"""
+        assert ValidationUtils.get_split_bounds(1000000, 5) == (50000, 400000)
+        assert ValidationUtils.get_split_bounds(1000000, 2) == (50000, 600000)
+        # Batas bawah dibulatkan ke atas agar tetap minimal 5%
+        assert ValidationUtils.get_split_bounds(10001, 5) == (501, 4000)
+    
+    def test_get_required_thousands(self):
+        """Test get_required_thousands method"""
+        assert ValidationUtils.get_required_thousands(2) == 1
+        assert ValidationUtils.get_required_thousands(3) == 2
+        assert ValidationUtils.get_required_thousands(5) == 3
+        assert ValidationUtils.get_required_thousands(6) == 3
+    
+    def test_is_natural_split(self):
+        """Test is_natural_split method"""
+        assert ValidationUtils.is_natural_split([150000, 230000, 180000, 245500, 194500], 1000000) is True
+        # Total tidak tepat
+        assert ValidationUtils.is_natural_split([150000, 230000, 180000, 245500, 194000], 1000000) is False
+        # Ada bagian identik
+        assert ValidationUtils.is_natural_split([200000, 200000, 180000, 225500, 194500], 1000000) is False
+        # Bagian di bawah 5%
+        assert ValidationUtils.is_natural_split([40000, 340000, 180000, 245500, 194500], 1000000) is False
+        # Kurang dari 3 bagian kelipatan ribuan
+        assert ValidationUtils.is_natural_split([150500, 230500, 180000, 245500, 193500], 1000000) is False
+        # Kelipatan persis 1 juta
+        assert ValidationUtils.is_natural_split([1000000, 1230000, 1180000, 1245500, 1344500], 6000000) is False
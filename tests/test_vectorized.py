@@ -0,0 +1,103 @@
+"""
+Unit tests untuk engine NumPy (money_splitter.vectorized)
+"""
+
+import pytest
+from money_splitter import vectorized
+from money_splitter.models import SplitResult
+from money_splitter.splitter import MoneySplitter
+from money_splitter.utils import ValidationUtils
+
+np = pytest.importorskip("numpy")
+
+
+class TestSplitMatrix:
+    """Test cases untuk split_matrix"""
+    
+    def setup_method(self):
+        """Setup untuk setiap test"""
+        self.splitter = MoneySplitter()
+        self.splitter.random.seed(42)
+    
+    @pytest.mark.parametrize("num_parts", [2, 3, 4, 5, 6])
+    def test_rows_are_natural(self, num_parts):
+        """Test setiap baris memenuhi semua properti natural"""
+        rng = np.random.default_rng(7)
+        amounts = rng.integers(10000, 10 ** 12, 2000).tolist()
+        matrix = vectorized.split_matrix(amounts, num_parts, self.splitter)
+        
+        assert matrix.shape == (2000, num_parts)
+        assert (matrix.sum(axis=1) == np.asarray(amounts)).all()
+        rows_valid = vectorized._valid_rows(matrix, np.asarray(amounts))
+        # Fallback pure-Python tidak selalu memenuhi semua properti, tapi
+        # hampir semua baris harus lolos di jalur vektor
+        assert rows_valid.mean() > 0.99
+    
+    def test_empty_input(self):
+        """Test split_matrix dengan input kosong"""
+        assert vectorized.split_matrix([], 5, self.splitter).shape == (0, 5)
+    
+    def test_huge_amounts_use_python_path(self):
+        """Test amount di atas MAX_VECTOR_AMOUNT tetap terbagi dengan benar"""
+        amount = vectorized.MAX_VECTOR_AMOUNT * 3 + 12345
+        matrix = vectorized.split_matrix([amount], 5, self.splitter)
+        assert int(matrix[0].sum()) == amount
+    
+    def test_amount_over_int64_rejected(self):
+        """Test amount di luar int64 ditolak dengan ValueError, bukan OverflowError"""
+        with pytest.raises(ValueError, match="int64"):
+            vectorized.split_matrix([10 ** 20], 5, self.splitter)
+    
+    def test_reproducible_with_seed(self):
+        """Test hasil sama jika RNG splitter di-seed sama"""
+        amounts = [10000000, 2500000, 123457]
+        other = MoneySplitter()
+        other.random.seed(42)
+        
+        first = vectorized.split_matrix(amounts, 5, self.splitter)
+        second = vectorized.split_matrix(amounts, 5, other)
+        assert (first == second).all()
+
+
+class TestSplitManyNumpyEngine:
+    """Test cases untuk split_many(engine="numpy")"""
+    
+    def test_split_many_numpy_engine(self):
+        """Test split_many dengan engine numpy"""
+        splitter = MoneySplitter()
+        amounts = [10000000, 5000000, 15000000, 123457, 10000] * 20
+        results = splitter.split_many(amounts, engine="numpy")
+        
+        assert [r.original_amount for r in results] == amounts
+        for result in results:
+            assert isinstance(result, SplitResult)
+            assert result.num_parts in [5, 6]
+            assert result.is_balanced()
+        
+        # Amount sangat kecil (10.000) sering jatuh ke fallback pure-Python
+        large = [r for r in results if r.original_amount >= 100000]
+        natural = sum(ValidationUtils.is_natural_split(r.splits, r.original_amount) for r in large)
+        assert natural >= len(large) * 0.95
+    
+    @pytest.mark.parametrize("num_parts", [5, None])
+    def test_split_many_amount_over_int64(self, num_parts):
+        """Test amount di atas int64 dibagi di jalur pure-Python seperti engine python"""
+        amounts = [10 ** 20, 1500000, 2 ** 63, 10000000]
+        results = MoneySplitter().split_many(amounts, num_parts, engine="numpy")
+        
+        assert [r.original_amount for r in results] == amounts
+        assert all(r.is_balanced() for r in results)
+        assert all(isinstance(split, int) for r in results for split in r.splits)
+    
+    def test_split_many_falls_back_without_numpy(self, monkeypatch):
+        """Test engine numpy kembali ke jalur pure-Python jika NumPy tidak ada"""
+        monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+        splitter = MoneySplitter()
+        
+        results = splitter.split_many([10000000, 5000000], num_parts=4, engine="numpy")
+        assert [r.get_total() for r in results] == [10000000, 5000000]
+    
+    def test_split_many_unknown_engine(self):
+        """Test split_many menolak engine yang tidak dikenal"""
+        with pytest.raises(ValueError):
+            MoneySplitter().split_many([10000000], engine="gpu")
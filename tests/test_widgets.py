@@ -0,0 +1,93 @@
+"""
+Unit tests untuk tabel tervirtualisasi (money_splitter.widgets)
+"""
+
+import tkinter as tk
+
+import pytest
+from money_splitter.models import SplitResult
+from money_splitter.splitter import MoneySplitter
+from money_splitter.widgets import (
+    RESULT_COLUMNS, VirtualTable, format_part_row, format_result_row, visible_range,
+)
+
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Tk display tidak tersedia")
+    root.geometry("800x400")
+    yield root
+    root.destroy()
+
+
+class TestVisibleRange:
+    """Test cases untuk perhitungan baris yang terlihat"""
+    
+    def test_top(self):
+        """Test viewport di atas hanya mencakup baris yang muat"""
+        assert visible_range(0, 240, 24, 100_000) == (0, 10)
+    
+    def test_partial_rows(self):
+        """Test baris yang terpotong di atas dan bawah ikut dihitung"""
+        assert visible_range(12, 240, 24, 100_000) == (0, 11)
+    
+    def test_end_and_empty(self):
+        """Test ujung data dan data kosong"""
+        assert visible_range(24 * 99_995, 240, 24, 100_000) == (99_995, 5)
+        assert visible_range(0, 240, 24, 0) == (0, 0)
+        assert visible_range(0, 0, 24, 10) == (0, 0)
+
+
+class TestFormatters:
+    """Test cases untuk formatter baris"""
+    
+    def test_result_row(self):
+        """Test baris batch berisi nomor, amount, jumlah bagian dan rincian"""
+        result = MoneySplitter(seed=1).split_money(1_500_000, 3)
+        row = format_result_row(9, result)
+        assert row[0] == "10"
+        assert row[1] == "Rp 1.500.000"
+        assert row[2] == "3"
+        assert row[3].count("Rp") == 3
+    
+    def test_part_row(self):
+        """Test baris bagian berisi nomor, amount dan persen"""
+        part = MoneySplitter(seed=1).split_money(1_500_000, 3).get_split_parts()[1]
+        assert format_part_row(0, part)[0] == "2"
+        assert format_part_row(0, part)[2].endswith("%")
+
+
+class TestVirtualTable:
+    """Test cases untuk VirtualTable (butuh display)"""
+    
+    def test_materializes_only_visible_rows(self, root):
+        """Test 100k baris hanya membuat slot sebanyak baris terlihat"""
+        results = MoneySplitter(seed=2).split_many([100_000 + i for i in range(200)])
+        rows = [results[i % 200] for i in range(100_000)]
+        table = VirtualTable(root, RESULT_COLUMNS, format_result_row)
+        table.pack(fill="both", expand=True)
+        root.update()
+        table.set_rows(rows)
+        root.update()
+        visible = table.materialized
+        assert 0 < visible < 30
+        
+        table.yview("moveto", 0.5)
+        table.see(99_999)
+        root.update()
+        assert table.materialized == visible
+        assert table.offset == len(rows) * table.row_height - table.canvas.winfo_height()
+    
+    def test_set_rows_resets_scroll(self, root):
+        """Test data baru kembali ke baris pertama"""
+        table = VirtualTable(root, RESULT_COLUMNS, format_result_row)
+        table.pack(fill="both", expand=True)
+        root.update()
+        table.set_rows([SplitResult.from_dict({"amount": 100, "splits": [60, 40]})] * 1000)
+        table.yview("scroll", 5, "pages")
+        assert table.offset > 0
+        table.set_rows([])
+        assert table.offset == 0